@@ -8,6 +8,7 @@ setup(
     install_requires=[
         "Django>=4.2",
         "meilisearch>=0.31.4",
+        "httpx>=0.28.1",
     ],
     classifiers=[
         "Development Status :: 4 - Beta",
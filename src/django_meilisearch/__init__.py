@@ -4,12 +4,22 @@
 This library provides a simple way to integrate MeiliSearch with Django.
 It allows you to define indexes for your Django models and provides methods
 to interact with MeiliSearch. It also provides a management command to
-perform actions on the indexes.
+perform actions on the indexes. The `async_client` is used by the coroutine
+methods of the indexes.
+
+The clients are built from the `DJANGO_MEILISEARCH` setting on their first
+use in each process, so importing the library does not connect to
+Meilisearch.
 """
 
 from django.conf import settings
 
-from meilisearch.client import Client as MeiliClient
-
+from django_meilisearch.async_client import AsyncClient
+from django_meilisearch.clients import Client, LazyClient, client_options
 
-client = MeiliClient(**settings.DJANGO_MEILISEARCH)
+client: Client = LazyClient(  # type: ignore[assignment]
+    lambda: Client(**client_options(settings.DJANGO_MEILISEARCH))
+)
+async_client: AsyncClient = LazyClient(  # type: ignore[assignment]
+    lambda: AsyncClient(**client_options(settings.DJANGO_MEILISEARCH))
+)
@@ -0,0 +1,252 @@
+"""
+This module contains the AsyncClient class, which sends requests to
+Meilisearch from coroutines, without blocking the event loop.
+"""
+
+import asyncio
+import json
+from typing import Any, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+import httpx
+from django.core.serializers.json import DjangoJSONEncoder
+from meilisearch.errors import MeilisearchApiError
+from meilisearch.models.task import Task, TaskInfo
+
+from django_meilisearch.clients import ConnectionPool
+from django_meilisearch.instrumentation import is_recording, record_request
+
+
+class AsyncClient:
+    """Asyncio client for the Meilisearch routes used by the indexes.
+
+    The requests are sent with an `httpx.AsyncClient`, whose pool of
+    connections is shared by every coroutine of an event loop. A pool is
+    created for each running event loop, since connections cannot be shared
+    between loops.
+
+    Args:
+        url (str): Meilisearch host.
+        api_key (Optional[str]): Meilisearch API key.
+        timeout (Optional[int]): Timeout of the requests, in seconds.
+        client_agents (Optional[Tuple[str, ...]]): Extra user agents.
+        pool (ConnectionPool): Options of the pool of each event loop.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        api_key: Optional[str] = None,
+        timeout: Optional[int] = None,
+        client_agents: Optional[Tuple[str, ...]] = None,
+        pool: ConnectionPool = ConnectionPool(),
+    ):
+        self.url = url
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=pool.size,
+            max_keepalive_connections=pool.size if pool.keep_alive else 0,
+        )
+        self.headers = {
+            "User-Agent": "; ".join(
+                (
+                    "Meilisearch Python (django_meilisearch)",
+                    *(client_agents or ()),
+                )
+            )
+        }
+        if api_key:
+            self.headers["Authorization"] = f"Bearer {api_key}"
+
+        self._pools: WeakKeyDictionary = WeakKeyDictionary()
+
+    def _pool(self) -> httpx.AsyncClient:
+        """Get the HTTP client of the running event loop."""
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(loop)
+        if pool is None:
+            pool = httpx.AsyncClient(
+                base_url=self.url,
+                headers=self.headers,
+                timeout=self.timeout,
+                limits=self.limits,
+            )
+            self._pools[loop] = pool
+        return pool
+
+    async def aclose(self) -> None:
+        """Close the connections of the running event loop."""
+        loop = asyncio.get_running_loop()
+        pool = self._pools.pop(loop, None)
+        if pool is not None:
+            await pool.aclose()
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        body: Any = None,
+        params: Optional[dict[str, Any]] = None,
+    ) -> Any:
+        """Send a request to Meilisearch.
+
+        Args:
+            method (str): HTTP method.
+            path (str): Route path.
+            body (Any): JSON body of the request.
+            params (Optional[dict]): Query string parameters.
+
+        Returns:
+            Any: Decoded JSON response.
+
+        Raises:
+            MeilisearchApiError: If Meilisearch answers with an error.
+        """
+        headers = {}
+        content = None
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+            content = json.dumps(body, cls=DjangoJSONEncoder)
+
+        response = await self._pool().request(
+            method, path, content=content, params=params, headers=headers
+        )
+        if is_recording():
+            record_request(
+                len(content.encode()) if content else 0,
+                len(response.content),
+                (
+                    response.json().get("taskUid")
+                    if response.status_code == 202
+                    else None
+                ),
+            )
+
+        if response.is_error:
+            # The error only reads the status code and the text of the
+            # response, which httpx responses provide as well.
+            raise MeilisearchApiError(
+                str(response.status_code), response  # type: ignore[arg-type]
+            )
+
+        return response.json() if response.content else None
+
+    async def create_index(self, uid: str, primary_key: str) -> TaskInfo:
+        """Enqueue the creation of an index."""
+        data = await self.request(
+            "POST", "/indexes", {"uid": uid, "primaryKey": primary_key}
+        )
+        return TaskInfo(**data)
+
+    async def delete_index(self, uid: str) -> TaskInfo:
+        """Enqueue the deletion of an index."""
+        data = await self.request("DELETE", f"/indexes/{uid}")
+        return TaskInfo(**data)
+
+    async def get_settings(self, uid: str) -> dict[str, Any]:
+        """Get the settings of an index."""
+        return await self.request("GET", f"/indexes/{uid}/settings")
+
+    async def update_settings(
+        self, uid: str, settings: dict[str, Any]
+    ) -> TaskInfo:
+        """Enqueue an update of the settings of an index."""
+        data = await self.request(
+            "PATCH", f"/indexes/{uid}/settings", settings
+        )
+        return TaskInfo(**data)
+
+    async def add_documents(
+        self, uid: str, documents: list[dict], primary_key: str
+    ) -> TaskInfo:
+        """Enqueue the addition or replacement of documents."""
+        data = await self.request(
+            "POST",
+            f"/indexes/{uid}/documents",
+            documents,
+            {"primaryKey": primary_key},
+        )
+        return TaskInfo(**data)
+
+    async def delete_document(self, uid: str, document_id: Any) -> TaskInfo:
+        """Enqueue the deletion of a document."""
+        data = await self.request(
+            "DELETE", f"/indexes/{uid}/documents/{document_id}"
+        )
+        return TaskInfo(**data)
+
+    async def delete_documents(
+        self, uid: str, document_ids: list[Any]
+    ) -> TaskInfo:
+        """Enqueue the deletion of several documents."""
+        data = await self.request(
+            "POST",
+            f"/indexes/{uid}/documents/delete-batch",
+            [str(document_id) for document_id in document_ids],
+        )
+        return TaskInfo(**data)
+
+    async def delete_documents_by_filter(
+        self, uid: str, filter_expr: Any
+    ) -> TaskInfo:
+        """Enqueue the deletion of the documents matching a filter."""
+        data = await self.request(
+            "POST", f"/indexes/{uid}/documents/delete", {"filter": filter_expr}
+        )
+        return TaskInfo(**data)
+
+    async def delete_all_documents(self, uid: str) -> TaskInfo:
+        """Enqueue the deletion of every document of an index."""
+        data = await self.request("DELETE", f"/indexes/{uid}/documents")
+        return TaskInfo(**data)
+
+    async def search(self, uid: str, query: dict[str, Any]) -> dict[str, Any]:
+        """Search an index."""
+        return await self.request("POST", f"/indexes/{uid}/search", query)
+
+    async def multi_search(
+        self,
+        queries: list[dict[str, Any]],
+        federation: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Search several indexes with a single request."""
+        body: dict[str, Any] = {"queries": queries}
+        if federation is not None:
+            body["federation"] = federation
+        return await self.request("POST", "/multi-search", body)
+
+    async def get_stats(self, uid: str) -> dict[str, Any]:
+        """Get the statistics of an index."""
+        return await self.request("GET", f"/indexes/{uid}/stats")
+
+    async def get_task(self, task_uid: int) -> Task:
+        """Get a task."""
+        data = await self.request("GET", f"/tasks/{task_uid}")
+        return Task(**data)
+
+    async def get_tasks(self, task_uids: list[int]) -> list[Task]:
+        """Get several tasks with a single request."""
+        data = await self.request(
+            "GET",
+            "/tasks",
+            params={
+                "uids": ",".join(str(uid) for uid in task_uids),
+                "limit": len(task_uids),
+            },
+        )
+        return [Task(**task) for task in data["results"]]
+
+    async def get_index_tasks(
+        self, uid: str, statuses: list[str], limit: int = 20
+    ) -> list[Task]:
+        """Get the latest tasks of an index with some statuses."""
+        data = await self.request(
+            "GET",
+            "/tasks",
+            params={
+                "indexUids": uid,
+                "statuses": ",".join(statuses),
+                "limit": limit,
+            },
+        )
+        return [Task(**task) for task in data["results"]]
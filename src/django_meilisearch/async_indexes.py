@@ -0,0 +1,257 @@
+"""
+This module contains the AsyncIndexMixin class, which provides the coroutine
+methods of the indexes, sending their requests with the async client.
+"""
+
+from typing import Any, Iterable, Optional, Sequence, Union
+from typing_extensions import Unpack
+
+from asgiref.sync import sync_to_async
+from django.db.models import Model, QuerySet
+from meilisearch.models.task import Task
+
+from django_meilisearch import async_client
+from django_meilisearch.batching import BatchStats, IndexingResult
+from django_meilisearch.index_base import IndexBase
+from django_meilisearch.instrumentation import (
+    instrumented,
+    operation,
+    record_documents,
+)
+from django_meilisearch.types import OptParams
+from django_meilisearch.utils import diff_settings
+
+
+class AsyncIndexMixin(IndexBase):
+    """Coroutine methods of the indexes, which do not block the event loop.
+    The requests are sent with the `async_client`, and the database is read
+    in the thread of the synchronous Django code.
+    """
+
+    @classmethod
+    @instrumented("acreate_async")
+    async def acreate_async(cls) -> Task:
+        """Create the index without blocking the event loop.
+
+        Returns:
+            Task: Meilisearch task object.
+        """
+
+        task_info = await async_client.create_index(
+            cls.name, cls.primary_key_field
+        )
+        return await cls.task_waiter.wait_async(task_info.task_uid)
+
+    @classmethod
+    @instrumented("apopulate_async")
+    async def apopulate_async(cls) -> IndexingResult:
+        """Populate the index without blocking the event loop.
+        The batches are read from the database and serialized in the thread
+        of the synchronous Django code, while the requests to Meilisearch are
+        sent from the event loop.
+
+        Returns:
+            IndexingResult: List of Meilisearch task objects, with the
+            uploaded batches and the updated settings.
+        """
+
+        current = await async_client.get_settings(cls.name)
+        changes = diff_settings(current, cls.get_index_settings())
+        if changes:
+            await async_client.update_settings(
+                cls.name,
+                {key: change["new"] for key, change in changes.items()},
+            )
+
+        batches, serialize = cls._document_batches()
+
+        @sync_to_async
+        def next_documents() -> Optional[list[dict]]:
+            batch = next(batches, None)
+            return None if batch is None else serialize(batch)
+
+        uploaded = []
+        while (documents := await next_documents()) is not None:
+            with operation("add_documents"):
+                task_info = await async_client.add_documents(
+                    cls.name, documents, cls.primary_key_field
+                )
+                record_documents(len(documents))
+            uploaded.append(BatchStats(len(documents), task_info.task_uid))
+
+        tasks = await cls.task_waiter.wait_many_async(
+            batch.task_uid for batch in uploaded
+        )
+        cls.invalidate_search_cache()
+        return IndexingResult(tasks, uploaded, changes)
+
+    @classmethod
+    @instrumented("aclean_async")
+    async def aclean_async(cls) -> Task:
+        """Delete all documents from the index without blocking the event loop.
+
+        Returns:
+            Task: Meilisearch task object.
+        """
+
+        task_info = await async_client.delete_all_documents(cls.name)
+        task = await cls.task_waiter.wait_async(task_info.task_uid)
+        cls.invalidate_search_cache()
+        return task
+
+    @classmethod
+    @instrumented("asearch")
+    async def asearch(
+        cls,
+        term: str,
+        to_queryset: bool = False,
+        select_related: Sequence[str] = (),
+        prefetch_related: Sequence[str] = (),
+        **opt_params: Unpack[OptParams],
+    ) -> Union[dict[str, Any], QuerySet]:
+        """Do a search on the index without blocking the event loop.
+        It accepts the same parameters as the `search` method.
+
+        Args:
+            term (str): Define the search query term.
+            to_queryset (bool): Return the QuerySet of the hits.
+            select_related (Sequence[str]): Relations to select with the hits.
+            prefetch_related (Sequence[str]): Relations to prefetch with the
+            hits.
+
+        Returns:
+            Union[dict, QuerySet]: Search results, or the QuerySet of the hits
+            if `to_queryset` is set. The QuerySet is lazy and can be iterated
+            with `async for`.
+        """
+
+        results = await cls._asearch(
+            term, cls._search_params(to_queryset, opt_params)
+        )
+        return cls._search_results(
+            results, to_queryset, select_related, prefetch_related
+        )
+
+    @classmethod
+    @instrumented("adestroy_async")
+    async def adestroy_async(cls) -> Task:
+        """Delete the index without blocking the event loop.
+
+        Returns:
+            Task: Meilisearch task object.
+        """
+
+        task_info = await async_client.delete_index(cls.name)
+        task = await cls.task_waiter.wait_async(task_info.task_uid)
+        cls.invalidate_search_cache()
+        return task
+
+    @classmethod
+    @instrumented("aadd_single_document_async")
+    async def aadd_single_document_async(cls, instance: Model) -> Task:
+        """Add a single document to the index without blocking the event loop.
+
+        Args:
+            instance (django.db.models.Model): Django model instance.
+
+        Returns:
+            Task: Meilisearch task object.
+        """
+
+        task_info = await async_client.add_documents(
+            cls.name,
+            await sync_to_async(cls.serialize_instances)([instance]),
+            cls.primary_key_field,
+        )
+        record_documents(1)
+        task = await cls.task_waiter.wait_async(task_info.task_uid)
+        cls.invalidate_search_cache()
+        return task
+
+    @classmethod
+    @instrumented("aremove_single_document_async")
+    async def aremove_single_document_async(cls, instance: Model) -> Task:
+        """Remove a single document from the index without blocking the event
+        loop.
+
+        Args:
+            instance (Model): Django model instance.
+
+        Returns:
+            Task: Meilisearch task object.
+        """
+
+        task_info = await async_client.delete_document(cls.name, instance.pk)
+        record_documents(1)
+        task = await cls.task_waiter.wait_async(task_info.task_uid)
+        cls.invalidate_search_cache()
+        return task
+
+    @classmethod
+    @instrumented("aremove_documents_async")
+    async def aremove_documents_async(
+        cls, queryset_or_ids: Union[QuerySet, Iterable[Any]]
+    ) -> list[Task]:
+        """Remove several documents from the index without blocking the event
+        loop. The primary keys of a QuerySet are read in the thread of the
+        synchronous Django code.
+
+        Args:
+            queryset_or_ids (Union[QuerySet, Iterable[Any]]): Rows of the
+            documents, or their primary keys.
+
+        Returns:
+            list[Task]: List of Meilisearch task objects.
+        """
+
+        batches = cls._key_batches(queryset_or_ids)
+
+        @sync_to_async
+        def next_keys() -> Optional[list[Any]]:
+            return next(batches, None)
+
+        task_uids = []
+        while (keys := await next_keys()) is not None:
+            task_info = await async_client.delete_documents(cls.name, keys)
+            record_documents(len(keys))
+            task_uids.append(task_info.task_uid)
+
+        tasks = await cls.task_waiter.wait_many_async(task_uids)
+        cls.invalidate_search_cache()
+        return tasks
+
+    @classmethod
+    @instrumented("aremove_by_filter_async")
+    async def aremove_by_filter_async(
+        cls, filter_expr: Union[str, list]
+    ) -> Task:
+        """Remove the documents matching a filter without blocking the event
+        loop.
+
+        Args:
+            filter_expr (Union[str, list]): Filter of the documents, with the
+            syntax of the `filter` search parameter.
+
+        Returns:
+            Task: Meilisearch task object.
+        """
+
+        task_info = await async_client.delete_documents_by_filter(
+            cls.name, filter_expr
+        )
+        task = await cls.task_waiter.wait_async(task_info.task_uid)
+        cls.invalidate_search_cache()
+        return task
+
+    @classmethod
+    @instrumented("acount")
+    async def acount(cls) -> int:
+        """Get the number of documents in the index without blocking the event
+        loop.
+
+        Returns:
+            int: Number of documents in the index.
+        """
+
+        stats = await async_client.get_stats(cls.name)
+        return stats["numberOfDocuments"]
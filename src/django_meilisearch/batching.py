@@ -0,0 +1,215 @@
+"""
+This module contains the AdaptiveBatchSize class, which tunes the size of
+the batches of a populate from the size of the documents, their
+serialization time and the processing time of their Meilisearch tasks, and
+the IndexingResult class, which reports the batches of a populate.
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Iterable, NamedTuple, Optional
+
+from meilisearch.models.task import Task
+
+from django_meilisearch import client
+
+
+@dataclass
+class BatchStats:
+    """Measures of a single uploaded batch.
+
+    Attributes:
+        size (int): Number of documents of the batch.
+        task_uid (int): UID of the Meilisearch task of the batch.
+        payload_bytes (Optional[int]): Size of the uncompressed request body,
+        in bytes, when it is measured.
+    """
+
+    size: int
+    task_uid: int
+    payload_bytes: Optional[int] = None
+
+
+class IndexingResult(list[Task]):
+    """Meilisearch task objects of a populate, rebuild or sync, with the
+    batches it uploaded and the settings it updated.
+
+    Args:
+        tasks (Iterable[Task]): Meilisearch task objects.
+        batches (Iterable[BatchStats]): Uploaded batches, in order.
+        settings_changes (Optional[dict]): Updated settings, with their `old`
+        and `new` values.
+
+    Attributes:
+        batches (list[BatchStats]): Uploaded batches, in order.
+        settings_changes (dict): Updated settings, with their `old` and `new`
+        values.
+    """
+
+    def __init__(
+        self,
+        tasks: Iterable[Task] = (),
+        batches: Iterable[BatchStats] = (),
+        settings_changes: Optional[dict[str, dict[str, Any]]] = None,
+    ):
+        super().__init__(tasks)
+        self.batches = list(batches)
+        self.settings_changes = settings_changes or {}
+
+
+class AdaptiveBatchSize(NamedTuple):
+    """Choose the size of each batch of a populate from the previous ones.
+
+    The first batch has `initial_size` rows. Every batch updates a moving
+    average of the size of a document, of its serialization time and, when
+    `target_task_seconds` is set, of its processing time by Meilisearch,
+    read from the oldest unchecked task with one request per batch. The next
+    batch is the largest one fitting `target_bytes` and the time targets,
+    within `min_size` and `max_size`. It grows by at most `max_growth` times
+    per batch, but shrinks at once.
+
+    Attributes:
+        initial_size (int): Size of the first batch.
+        min_size (int): Minimum size of a batch.
+        max_size (int): Maximum size of a batch.
+        target_bytes (int): Size of the request body of a batch, in bytes.
+        target_serialize_seconds (Optional[float]): Serialization time of a
+        batch, in seconds. Defaults to no time target.
+        target_task_seconds (Optional[float]): Processing time of the task
+        of a batch, in seconds. Defaults to no time target.
+        max_growth (float): Maximum factor between two batch sizes.
+        smoothing (float): Weight of the last batch in the moving averages,
+        between 0 and 1.
+    """
+
+    initial_size: int = 1_000
+    min_size: int = 100
+    max_size: int = 100_000
+    target_bytes: int = 10 * 1024 * 1024
+    target_serialize_seconds: Optional[float] = 2.0
+    target_task_seconds: Optional[float] = 10.0
+    max_growth: float = 2.0
+    smoothing: float = 0.5
+
+    def start(self) -> "BatchSizer":
+        """Start tuning the batches of a populate.
+
+        Returns:
+            BatchSizer: Sizes of the batches of the populate.
+        """
+        return BatchSizer(self)
+
+
+class BatchSizer:
+    """Size of the next batch of a single populate, tuned by its batches.
+
+    Calling the sizer returns the size of the next batch. The measures may
+    be recorded from other threads, e.g. those of a populate pipeline.
+
+    Args:
+        config (AdaptiveBatchSize): Targets and limits of the sizes.
+
+    Attributes:
+        size (int): Size of the next batch.
+    """
+
+    def __init__(self, config: AdaptiveBatchSize):
+        self.config = config
+        self.size = config.initial_size
+
+        self._lock = threading.Lock()
+        self._requested = config.initial_size
+        # Moving averages of the measures of a document, by target.
+        self._averages: dict[str, Optional[float]] = {
+            "target_bytes": None,
+            "target_serialize_seconds": None,
+            "target_task_seconds": None,
+        }
+        # Number of documents and task UID of the batches whose processing
+        # time is not read yet.
+        self._unchecked: deque[tuple[int, int]] = deque()
+
+    def __call__(self) -> int:
+        with self._lock:
+            self._requested = self.size
+            return self.size
+
+    def record_serialize(self, documents: int, seconds: float) -> None:
+        """Record the serialization of a batch.
+
+        Args:
+            documents (int): Number of serialized documents.
+            seconds (float): Serialization time, in seconds.
+        """
+        if not documents:
+            return
+        with self._lock:
+            self._record("target_serialize_seconds", seconds / documents)
+
+    def record_upload(
+        self, documents: int, payload_bytes: int, task_uid: int
+    ) -> None:
+        """Record the upload of a batch, and check the processing time of
+        the oldest unchecked task.
+
+        Args:
+            documents (int): Number of uploaded documents.
+            payload_bytes (int): Size of the uncompressed request body.
+            task_uid (int): UID of the Meilisearch task of the batch.
+        """
+        with self._lock:
+            if not documents:
+                self._tune()
+                return
+            if self.config.target_task_seconds is not None:
+                self._unchecked.append((documents, task_uid))
+            self._record("target_bytes", payload_bytes / documents)
+
+        if self._unchecked:
+            self._check_task()
+
+    def _check_task(self) -> None:
+        """Record the processing time of the oldest unchecked task, if it is
+        finished."""
+        with self._lock:
+            if not self._unchecked:
+                return
+            batch = self._unchecked[0]
+
+        documents, task_uid = batch
+        task = client.get_task(task_uid)
+        if task.finished_at is None:
+            return
+
+        with self._lock:
+            if self._unchecked and self._unchecked[0] is batch:
+                self._unchecked.popleft()
+            if task.started_at is None:
+                return
+
+            seconds = (task.finished_at - task.started_at).total_seconds()
+            self._record("target_task_seconds", seconds / documents)
+
+    def _record(self, target: str, value: float) -> None:
+        """Update the moving average of the measure of a target with a new
+        value, and tune the size of the next batch."""
+        average = self._averages[target]
+        smoothing = self.config.smoothing
+        self._averages[target] = (
+            value
+            if average is None
+            else smoothing * value + (1 - smoothing) * average
+        )
+        self._tune()
+
+    def _tune(self) -> None:
+        """Choose the size of the next batch from the averages."""
+        config = self.config
+        limits = [config.max_size, self._requested * config.max_growth]
+        for target, per_document in self._averages.items():
+            limit = getattr(config, target)
+            if limit is not None and per_document:
+                limits.append(limit / per_document)
+
+        self.size = max(config.min_size, int(min(limits)))
@@ -0,0 +1,317 @@
+"""
+This module contains the search result caches, which keep the results of the
+`search` method of the indexes until they expire or the index is written.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional
+
+from django.core.cache import caches
+
+
+class SearchCache(ABC):
+    """Base class of the search result caches.
+
+    The results are stored by index name, by version of the index and by
+    the search term and parameters, and expire after `ttl` seconds. Every
+    write sent to an index increments its version, so the results cached
+    before are no longer read, even those of searches running during the
+    write. Since the index answers with the previous documents until the
+    tasks of the write are finished, the results of a version are only
+    cached once the index has no unfinished task, which is recorded by
+    `settle`. The numbers of cache hits and misses of the process are
+    counted in `hits` and `misses`.
+
+    Args:
+        ttl (float): Time to live of the results, in seconds.
+    """
+
+    def __init__(self, ttl: float = 60):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(term: str, opt_params: dict[str, Any]) -> str:
+        """Build the key of a search.
+
+        Args:
+            term (str): Search query term.
+            opt_params (dict): Search parameters.
+
+        Returns:
+            str: Key independent of the order of the parameters.
+        """
+        return json.dumps([term, opt_params], sort_keys=True, default=str)
+
+    @abstractmethod
+    def version(self, index_name: str) -> int:
+        """Get the current version of an index.
+
+        Args:
+            index_name (str): Index name.
+
+        Returns:
+            int: Version, incremented by every write.
+        """
+
+    @abstractmethod
+    def invalidate(self, index_name: str) -> None:
+        """Increment the version of an index, so its cached results are no
+        longer read.
+
+        Args:
+            index_name (str): Index name.
+        """
+
+    @abstractmethod
+    def settled(self, index_name: str, version: int) -> bool:
+        """Check whether the writes of a version of an index are known to be
+        finished.
+
+        Args:
+            index_name (str): Index name.
+            version (int): Version of the index.
+
+        Returns:
+            bool: Whether `settle` was called for the version.
+        """
+
+    @abstractmethod
+    def settle(self, index_name: str, version: int) -> None:
+        """Record that the index had no unfinished task at a version, so its
+        results can be cached.
+
+        Args:
+            index_name (str): Index name.
+            version (int): Version of the index.
+        """
+
+    def get(
+        self,
+        index_name: str,
+        version: int,
+        term: str,
+        opt_params: dict[str, Any],
+    ) -> Optional[dict[str, Any]]:
+        """Get the cached results of a search.
+
+        Args:
+            index_name (str): Index name.
+            version (int): Version of the index.
+            term (str): Search query term.
+            opt_params (dict): Search parameters.
+
+        Returns:
+            Optional[dict]: Search results, `None` if they are not cached.
+        """
+        results = self._get(
+            index_name, version, self.make_key(term, opt_params)
+        )
+        with self._lock:
+            if results is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return results
+
+    def set(
+        self,
+        index_name: str,
+        version: int,
+        term: str,
+        opt_params: dict[str, Any],
+        results: dict[str, Any],
+    ) -> None:
+        """Cache the results of a search.
+
+        Args:
+            index_name (str): Index name.
+            version (int): Version of the index read before the search.
+            term (str): Search query term.
+            opt_params (dict): Search parameters.
+            results (dict): Search results.
+        """
+        self._set(
+            index_name, version, self.make_key(term, opt_params), results
+        )
+
+    @abstractmethod
+    def _get(
+        self, index_name: str, version: int, key: str
+    ) -> Optional[dict[str, Any]]:
+        """Get cached results by key, `None` if missing or expired."""
+
+    @abstractmethod
+    def _set(
+        self, index_name: str, version: int, key: str, results: dict[str, Any]
+    ) -> None:
+        """Store results by key for `ttl` seconds."""
+
+
+class LocalSearchCache(SearchCache):
+    """Search result cache kept in the memory of the process.
+
+    When more than `max_entries` results are cached, the least recently
+    used ones are evicted. The results of the previous versions of an index
+    are dropped when it is invalidated. The cached results are shared by
+    the callers and must not be modified.
+
+    Args:
+        ttl (float): Time to live of the results, in seconds.
+        max_entries (int): Maximum number of cached results.
+    """
+
+    def __init__(self, ttl: float = 60, max_entries: int = 1000):
+        super().__init__(ttl)
+        self.max_entries = max_entries
+
+        self._entries: OrderedDict[
+            tuple[str, int, str], tuple[float, dict]
+        ] = OrderedDict()
+        self._versions: dict[str, int] = {}
+        self._settled: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def version(self, index_name: str) -> int:
+        with self._lock:
+            return self._versions.get(index_name, 0)
+
+    def invalidate(self, index_name: str) -> None:
+        with self._lock:
+            self._versions[index_name] = self._versions.get(index_name, 0) + 1
+            for entry_key in [
+                entry_key
+                for entry_key in self._entries
+                if entry_key[0] == index_name
+            ]:
+                del self._entries[entry_key]
+
+    def settled(self, index_name: str, version: int) -> bool:
+        with self._lock:
+            return self._settled.get(index_name) == version
+
+    def settle(self, index_name: str, version: int) -> None:
+        with self._lock:
+            self._settled[index_name] = version
+
+    def _get(
+        self, index_name: str, version: int, key: str
+    ) -> Optional[dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get((index_name, version, key))
+            if entry is None:
+                return None
+
+            expires_at, results = entry
+            if expires_at <= time.monotonic():
+                del self._entries[(index_name, version, key)]
+                return None
+
+            self._entries.move_to_end((index_name, version, key))
+            return results
+
+    def _set(
+        self, index_name: str, version: int, key: str, results: dict[str, Any]
+    ) -> None:
+        with self._lock:
+            if version != self._versions.get(index_name, 0):
+                return
+
+            self._entries[(index_name, version, key)] = (
+                time.monotonic() + self.ttl,
+                results,
+            )
+            self._entries.move_to_end((index_name, version, key))
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class DjangoSearchCache(SearchCache):
+    """Search result cache stored with the Django cache framework.
+
+    The entries are shared by the processes using the same cache. The
+    version of each index is a counter stored in the cache, created with
+    `add` and incremented with `incr`, which are atomic in the cache
+    backends shared by several processes, so concurrent writes never lose
+    an increment. A counter evicted by the cache is created again from the
+    current time in nanoseconds, above every version used before, so the
+    results of the previous versions are never read again. The eviction of
+    the results is left to the cache backend.
+
+    Args:
+        ttl (float): Time to live of the results, in seconds.
+        alias (str): Alias of the cache in the `CACHES` setting.
+        key_prefix (str): Prefix of the keys of the entries.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60,
+        alias: str = "default",
+        key_prefix: str = "django_meilisearch",
+    ):
+        super().__init__(ttl)
+        self.alias = alias
+        self.key_prefix = key_prefix
+
+    @property
+    def cache(self):
+        """The Django cache of the entries."""
+        return caches[self.alias]
+
+    def version(self, index_name: str) -> int:
+        version_key = self._version_key(index_name)
+        version = self.cache.get(version_key)
+        if version is None:
+            version = time.time_ns()
+            if not self.cache.add(version_key, version, None):
+                version = self.cache.get(version_key, version)
+        return version
+
+    def invalidate(self, index_name: str) -> None:
+        version_key = self._version_key(index_name)
+        self.cache.add(version_key, time.time_ns(), None)
+        try:
+            self.cache.incr(version_key)
+        except ValueError:
+            # Evicted between the `add` and the `incr`.
+            self.cache.add(version_key, time.time_ns(), None)
+
+    def settled(self, index_name: str, version: int) -> bool:
+        return bool(self.cache.get(self._settled_key(index_name, version)))
+
+    def settle(self, index_name: str, version: int) -> None:
+        self.cache.set(self._settled_key(index_name, version), True, self.ttl)
+
+    def _version_key(self, index_name: str) -> str:
+        return f"{self.key_prefix}:{index_name}:version"
+
+    def _settled_key(self, index_name: str, version: int) -> str:
+        return f"{self.key_prefix}:{index_name}:{version}:settled"
+
+    def _entry_key(self, index_name: str, version: int, key: str) -> str:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return f"{self.key_prefix}:{index_name}:{version}:{digest}"
+
+    def _get(
+        self, index_name: str, version: int, key: str
+    ) -> Optional[dict[str, Any]]:
+        return self.cache.get(self._entry_key(index_name, version, key))
+
+    def _set(
+        self, index_name: str, version: int, key: str, results: dict[str, Any]
+    ) -> None:
+        self.cache.set(
+            self._entry_key(index_name, version, key), results, self.ttl
+        )
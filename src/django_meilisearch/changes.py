@@ -0,0 +1,44 @@
+"""
+This module contains the operations of the document changes written to the
+outbox by the model signals of the indexes with `use_outbox`, and the
+function writing them.
+"""
+
+from typing import TYPE_CHECKING, Any, Iterable
+
+from django.apps import apps
+
+if TYPE_CHECKING:
+    from django_meilisearch.indexes import BaseIndex
+
+# Operations of the outbox changes: `add` uploads the current row of the
+# document again, `remove` deletes the document.
+ADD = "add"
+REMOVE = "remove"
+
+
+def record_changes(
+    index_cls: "type[BaseIndex]",
+    keys: Iterable[Any],
+    operation: str,
+    using: str,
+) -> None:
+    """Write document changes to the outbox, in the transaction of the
+    changed rows.
+
+    Args:
+        index_cls (type[BaseIndex]): Index class of the documents.
+        keys (Iterable[Any]): Primary keys of the documents.
+        operation (str): `ADD` or `REMOVE`.
+        using (str): Database of the changed rows.
+    """
+
+    outbox_entry = apps.get_model("django_meilisearch", "OutboxEntry")
+    outbox_entry.objects.using(using).bulk_create(
+        [
+            outbox_entry(
+                index_name=index_cls.name, key=key, operation=operation
+            )
+            for key in keys
+        ]
+    )
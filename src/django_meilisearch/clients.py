@@ -0,0 +1,278 @@
+"""
+This module contains the Meilisearch client of the library, which reuses its
+connections, and the LazyClient proxy, which builds a client on first use in
+each process.
+"""
+
+import os
+import threading
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+import requests
+from meilisearch._httprequests import HttpRequests
+from meilisearch.client import Client as MeiliClient
+from meilisearch.config import Config
+from meilisearch.errors import (
+    MeilisearchApiError,
+    MeilisearchCommunicationError,
+    MeilisearchTimeoutError,
+)
+from meilisearch.index import Index
+from meilisearch.models.task import TaskInfo
+from requests.adapters import HTTPAdapter
+
+from django_meilisearch.instrumentation import is_recording, record_request
+from django_meilisearch.upload import DocumentStream
+
+
+class ConnectionPool(NamedTuple):
+    """Options of the pool of connections of a client.
+
+    Args:
+        keep_alive (bool): Keep the connections open between requests.
+        size (int): Maximum number of connections kept open.
+    """
+
+    keep_alive: bool = True
+    size: int = 10
+
+
+def client_options(options: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the arguments of a client from the `DJANGO_MEILISEARCH` setting.
+
+    The `keep_alive` and `pool_size` keys of the setting are grouped in the
+    `ConnectionPool` of the client.
+
+    Args:
+        options (Dict[str, Any]): Value of the setting.
+
+    Returns:
+        Dict[str, Any]: Keyword arguments of `Client` and `AsyncClient`.
+    """
+    options = dict(options)
+    defaults = ConnectionPool()
+    options["pool"] = ConnectionPool(
+        keep_alive=options.pop("keep_alive", defaults.keep_alive),
+        size=options.pop("pool_size", defaults.size),
+    )
+    return options
+
+
+class PooledHttpRequests(HttpRequests):
+    """Meilisearch HTTP requests sent with a `requests.Session`.
+
+    The Meilisearch client sends every request with the module functions of
+    `requests`, which open a new connection each time. The requests are
+    sent with the matching methods of the session of the current thread
+    instead, so the connections are kept alive in its pool.
+
+    Args:
+        config (Config): Meilisearch client configuration.
+        get_session (Callable[[], requests.Session]): Function returning the
+        session of the current thread.
+    """
+
+    SESSION_METHODS = {
+        requests.get: "get",
+        requests.post: "post",
+        requests.put: "put",
+        requests.patch: "patch",
+        requests.delete: "delete",
+    }
+
+    def __init__(
+        self, config: Config, get_session: Callable[[], requests.Session]
+    ):
+        super().__init__(config)
+        self.get_session = get_session
+
+    @property
+    def session(self) -> requests.Session:
+        """The session sending the requests of the current thread."""
+        return self.get_session()
+
+    def send_request(self, http_method: Callable, *args, **kwargs) -> Any:
+        method = self.SESSION_METHODS.get(http_method)
+        if method is not None:
+            http_method = getattr(self.session, method)
+        return super().send_request(http_method, *args, **kwargs)
+
+
+class Client(MeiliClient):
+    """Meilisearch client reusing its connections.
+
+    The requests of the client and of the indexes it returns with `index`
+    share a pool of connections per thread, and are counted by the measured
+    operations of the indexes. Each thread has its own session, since a
+    `requests.Session` is not thread-safe.
+
+    Args:
+        url (str): Meilisearch host.
+        api_key (Optional[str]): Meilisearch API key.
+        timeout (Optional[int]): Timeout of the requests, in seconds.
+        client_agents (Optional[Tuple[str, ...]]): Extra user agents.
+        pool (ConnectionPool): Options of the pool of connections.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        api_key: Optional[str] = None,
+        timeout: Optional[int] = None,
+        client_agents: Optional[Tuple[str, ...]] = None,
+        pool: ConnectionPool = ConnectionPool(),
+    ):
+        super().__init__(url, api_key, timeout, client_agents)
+
+        self.pool = pool
+        self._sessions = threading.local()
+
+        self.http = PooledHttpRequests(self.config, self.get_session)
+        self.task_handler.http = PooledHttpRequests(
+            self.config, self.get_session
+        )
+
+    @property
+    def session(self) -> requests.Session:
+        """The session sending the requests of the current thread."""
+        return self.get_session()
+
+    def get_session(self) -> requests.Session:
+        """Get the session of the current thread, creating it if needed.
+
+        Returns:
+            requests.Session: Session keeping up to `pool.size` connections
+            alive.
+        """
+        session = getattr(self._sessions, "session", None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1, pool_maxsize=self.pool.size
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            if not self.pool.keep_alive:
+                session.headers["Connection"] = "close"
+            session.hooks["response"].append(record_response)
+            self._sessions.session = session
+        return session
+
+    def index(self, uid: str) -> Index:
+        index = super().index(uid)
+        index.http = PooledHttpRequests(self.config, self.get_session)
+        index.task_handler.http = PooledHttpRequests(
+            self.config, self.get_session
+        )
+        return index
+
+    def add_documents_stream(
+        self, uid: str, stream: DocumentStream, primary_key: str
+    ) -> TaskInfo:
+        """Enqueue the addition of documents sent as a stream.
+
+        The body is sent with a chunked transfer encoding while the stream
+        produces it, so it is never held in memory as a whole.
+
+        Args:
+            uid (str): Index name.
+            stream (DocumentStream): Documents to add.
+            primary_key (str): Primary key of the documents.
+
+        Returns:
+            TaskInfo: Meilisearch task info.
+
+        Raises:
+            MeilisearchApiError: If Meilisearch answers with an error.
+        """
+        headers = {
+            key: value
+            for key, value in self.http.headers.items()
+            if key in ("Authorization", "User-Agent")
+        }
+        try:
+            response = self.session.post(
+                f"{self.config.url}/indexes/{uid}/documents",
+                params={"primaryKey": primary_key},
+                data=stream,
+                headers={**headers, **stream.headers},
+                timeout=self.config.timeout,
+            )
+        except requests.exceptions.Timeout as err:
+            raise MeilisearchTimeoutError(str(err)) from err
+        except requests.exceptions.ConnectionError as err:
+            raise MeilisearchCommunicationError(str(err)) from err
+
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as err:
+            raise MeilisearchApiError(str(err), response) from err
+
+        return TaskInfo(**response.json())
+
+
+def record_response(response: requests.Response, *args, **kwargs) -> None:
+    """Count a response in the measured operations, if any.
+
+    Args:
+        response (requests.Response): Response of Meilisearch.
+    """
+    # pylint: disable=unused-argument
+    if not is_recording():
+        return
+
+    body = response.request.body or b""
+    if isinstance(body, str):
+        body = body.encode()
+    bytes_sent = getattr(body, "bytes_sent", None)
+    if bytes_sent is None:
+        bytes_sent = len(body) if isinstance(body, bytes) else 0
+
+    task_uid = None
+    if response.status_code == 202:
+        try:
+            task_uid = response.json().get("taskUid")
+        except ValueError:
+            pass
+
+    record_request(bytes_sent, len(response.content), task_uid)
+
+
+class LazyClient:
+    """Proxy of a client built on the first use of its attributes.
+
+    The client is built again when the proxy is used in another process,
+    so forked workers never share the connections of their parent.
+
+    Args:
+        factory (Callable[[], Any]): Function building the client.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._client: Any = None
+        self._pid: Optional[int] = None
+
+    def get_client(self) -> Any:
+        """Get the client of the current process, building it if needed.
+
+        Returns:
+            Any: Client built by the factory.
+        """
+        pid = os.getpid()
+        if self._client is None or self._pid != pid:
+            with self._lock:
+                if self._client is None or self._pid != pid:
+                    self._client = self._factory()
+                    self._pid = pid
+        return self._client
+
+    def reset(self) -> None:
+        """Drop the client, e.g. after changing the settings."""
+        with self._lock:
+            self._client = None
+            self._pid = None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.get_client(), name)
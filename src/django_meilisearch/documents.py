@@ -0,0 +1,195 @@
+"""
+This module contains the DocumentsMixin class, which removes or reindexes
+several documents of the indexes at once.
+"""
+
+from typing import Any, Iterable, Type, Union
+
+from django.db.models import Model, Q, QuerySet
+from meilisearch.models.task import Task
+
+from django_meilisearch import client
+from django_meilisearch.index_base import IndexBase
+from django_meilisearch.instrumentation import instrumented, record_documents
+
+
+class DocumentsMixin(IndexBase):
+    """Changes of several documents of the indexes at once."""
+
+    @classmethod
+    @instrumented("aremove_documents")
+    def aremove_documents(
+        cls, queryset_or_ids: Union[QuerySet, Iterable[Any]]
+    ) -> list[Task]:
+        """Remove several documents from the index asynchronously.
+        The primary keys are sent in batches of `indexing_batch_size` keys,
+        with one `delete_documents` request per batch.
+
+        Args:
+            queryset_or_ids (Union[QuerySet, Iterable[Any]]): Rows of the
+            documents, or their primary keys.
+
+        Returns:
+            list[Task]: List of Meilisearch task objects.
+        """
+
+        index = cls.get_index()
+        task_uids = []
+        for keys in cls._key_batches(queryset_or_ids):
+            task_info = index.delete_documents(keys)
+            record_documents(len(keys))
+            task_uids.append(task_info.task_uid)
+
+        tasks = [client.get_task(task_uid) for task_uid in task_uids]
+        cls.invalidate_search_cache()
+        return tasks
+
+    @classmethod
+    @instrumented("remove_documents")
+    def remove_documents(
+        cls, queryset_or_ids: Union[QuerySet, Iterable[Any]]
+    ) -> list[Task]:
+        """Remove several documents from the index.
+        The primary keys are sent in batches of `indexing_batch_size` keys,
+        and the tasks of the batches are awaited at once.
+
+        Args:
+            queryset_or_ids (Union[QuerySet, Iterable[Any]]): Rows of the
+            documents, or their primary keys.
+
+        Returns:
+            list[Task]: List of Meilisearch task objects.
+        """
+
+        tasks = cls.aremove_documents(queryset_or_ids)
+        tasks = cls.task_waiter.wait_many(task.uid for task in tasks)
+        cls.invalidate_search_cache()
+        return tasks
+
+    @classmethod
+    @instrumented("aremove_by_filter")
+    def aremove_by_filter(cls, filter_expr: Union[str, list]) -> Task:
+        """Remove the documents matching a filter asynchronously.
+        The documents are deleted by Meilisearch with a single request, so
+        the filter can only use the `filterable_fields` of the index.
+
+        Args:
+            filter_expr (Union[str, list]): Filter of the documents, with the
+            syntax of the `filter` search parameter.
+
+        Returns:
+            Task: Meilisearch task object.
+        """
+
+        index = cls.get_index()
+        task_info = index.delete_documents(filter=filter_expr)
+        task = client.get_task(task_info.task_uid)
+        cls.invalidate_search_cache()
+        return task
+
+    @classmethod
+    @instrumented("remove_by_filter")
+    def remove_by_filter(cls, filter_expr: Union[str, list]) -> Task:
+        """Remove the documents matching a filter.
+
+        Args:
+            filter_expr (Union[str, list]): Filter of the documents, with the
+            syntax of the `filter` search parameter.
+
+        Returns:
+            Task: Meilisearch task object.
+        """
+
+        task = cls.aremove_by_filter(filter_expr)
+        task = cls.task_waiter.wait(task.uid)
+        cls.invalidate_search_cache()
+        return task
+
+    @classmethod
+    @instrumented("areindex_documents")
+    def areindex_documents(
+        cls, queryset_or_ids: Union[QuerySet, Iterable[Any]]
+    ) -> list[Task]:
+        """Serialize and upload several rows again asynchronously.
+        The rows are read in batches of `indexing_batch_size` primary keys,
+        with their related and computed fields.
+
+        Args:
+            queryset_or_ids (Union[QuerySet, Iterable[Any]]): Rows of the
+            documents, or their primary keys.
+
+        Returns:
+            list[Task]: List of Meilisearch task objects.
+        """
+
+        index = cls.get_index()
+        batches = []
+        for keys in cls._key_batches(queryset_or_ids):
+            queryset = cls.model.objects.filter(
+                **{f"{cls.primary_key_field}__in": keys}
+            )
+            batches.extend(cls._add_batches(index, queryset=queryset))
+
+        tasks = [client.get_task(batch.task_uid) for batch in batches]
+        cls.invalidate_search_cache()
+        return tasks
+
+    @classmethod
+    @instrumented("reindex_documents")
+    def reindex_documents(
+        cls, queryset_or_ids: Union[QuerySet, Iterable[Any]]
+    ) -> list[Task]:
+        """Serialize and upload several rows again.
+        The rows are read in batches of `indexing_batch_size` primary keys,
+        and the tasks of the batches are awaited at once.
+
+        Args:
+            queryset_or_ids (Union[QuerySet, Iterable[Any]]): Rows of the
+            documents, or their primary keys.
+
+        Returns:
+            list[Task]: List of Meilisearch task objects.
+        """
+
+        tasks = cls.areindex_documents(queryset_or_ids)
+        tasks = cls.task_waiter.wait_many(task.uid for task in tasks)
+        cls.invalidate_search_cache()
+        return tasks
+
+    @classmethod
+    def get_dependent_keys(
+        cls, model: Type[Model], rows: Union[QuerySet, Iterable[Any]]
+    ) -> list[Any]:
+        """Get the primary keys of the documents reading rows of a model,
+        with a single query.
+
+        Args:
+            model (Type[Model]): The model of the rows, the index model or a
+            model read by the related and computed fields.
+            rows (Union[QuerySet, Iterable[Any]]): Rows of the model, or their
+            primary keys.
+
+        Returns:
+            list[Any]: Values of the `primary_key_field` of the documents.
+        """
+
+        if model is cls.model and not isinstance(rows, QuerySet):
+            if cls.primary_key_field == model._meta.pk.name:
+                return list(rows)
+            return list(
+                model.objects.filter(pk__in=rows).values_list(
+                    cls.primary_key_field, flat=True
+                )
+            )
+
+        condition = Q()
+        for lookup in cls.document_fields.dependencies.get(model, []):
+            condition |= Q(**{f"{lookup}__in": rows})
+        if not condition:
+            return []
+
+        return list(
+            cls.model.objects.filter(condition)
+            .values_list(cls.primary_key_field, flat=True)
+            .distinct()
+        )
@@ -34,3 +34,31 @@ class InvalidFilterableFieldError(Exception):
 
 class InvalidSortableFieldError(Exception):
     """Exception raised when an invalid sortable field is provided."""
+
+
+class TaskTimeoutError(Exception):
+    """Exception raised when a Meilisearch task does not finish in time."""
+
+
+class TaskNotFoundError(Exception):
+    """Exception raised when an awaited Meilisearch task does not exist."""
+
+
+class InvalidWatermarkFieldError(Exception):
+    """Exception raised when an invalid watermark field is provided."""
+
+
+class InvalidRelatedFieldError(Exception):
+    """Exception raised when an invalid related field is provided."""
+
+
+class InvalidComputedFieldError(Exception):
+    """Exception raised when an invalid computed field is provided."""
+
+
+class InvalidUpdateFieldError(Exception):
+    """Exception raised when an invalid field to update is provided."""
+
+
+class OutboxTaskError(Exception):
+    """Exception raised when a Meilisearch task of the outbox changes fails."""
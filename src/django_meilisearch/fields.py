@@ -0,0 +1,324 @@
+"""
+This module contains the DocumentFields class, which adds the related and
+computed fields of an index to its documents and plans the queries loading
+them.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import DateTimeField, Model, QuerySet
+from rest_framework import serializers
+
+from django_meilisearch.exceptions import (
+    InvalidComputedFieldError,
+    InvalidRelatedFieldError,
+)
+from django_meilisearch.serializers import (
+    AnnotationField,
+    ComputedValueField,
+    RelatedPathField,
+    TimestampField,
+)
+
+
+@dataclass(frozen=True)
+class ComputedField:
+    """Document field computed from each instance by a function.
+
+    Args:
+        function (Callable): Function receiving the model instance.
+        depends_on (Sequence[str]): `__`-separated relations read by the
+        function, loaded with `select_related` or `prefetch_related`.
+    """
+
+    function: Callable[[Any], Any]
+    depends_on: Sequence[str] = ()
+
+
+class QueryPlan:
+    """Relations and annotations loaded with the rows of an index.
+
+    Attributes:
+        select_related (list[str]): Relations loaded with `select_related`.
+        prefetch_related (list[str]): Relations loaded with
+        `prefetch_related`.
+        annotations (dict[str, Any]): Expressions annotated on the rows.
+    """
+
+    def __init__(self) -> None:
+        self.select_related: list[str] = []
+        self.prefetch_related: list[str] = []
+        self.annotations: dict[str, Any] = {}
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.select_related or self.prefetch_related or self.annotations
+        )
+
+    def apply(self, queryset: QuerySet) -> QuerySet:
+        """Load the relations and annotations with a queryset.
+
+        Args:
+            queryset (QuerySet): Rows of the model.
+
+        Returns:
+            QuerySet: The rows, with their related rows and annotations.
+        """
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        if self.annotations:
+            queryset = queryset.annotate(**self.annotations)
+        return queryset
+
+    def add_relations(
+        self, lookups: list[tuple[str, str]], many: bool
+    ) -> None:
+        """Load a chain of relations with `select_related`, or with
+        `prefetch_related` when one of them is multi-valued.
+
+        Args:
+            lookups (list[tuple[str, str]]): Lookup and attribute of each
+            relation of the chain.
+            many (bool): Whether one of the relations is multi-valued.
+        """
+        if not lookups:
+            return
+
+        if many:
+            lookup = "__".join(attribute for _, attribute in lookups)
+            target = self.prefetch_related
+        else:
+            lookup = "__".join(segment for segment, _ in lookups)
+            target = self.select_related
+
+        # A chain already loaded by a longer one is not loaded twice.
+        if any(
+            loaded == lookup or loaded.startswith(f"{lookup}__")
+            for loaded in target
+        ):
+            return
+        target[:] = [
+            loaded for loaded in target if not lookup.startswith(f"{loaded}__")
+        ]
+        target.append(lookup)
+
+
+class DocumentFields:
+    """Related and computed fields of the documents of an index.
+
+    The relations of every path are resolved once, when the index class is
+    defined. The single-valued chains of relations are loaded with
+    `select_related` and the chains with a multi-valued relation with
+    `prefetch_related`, and the expressions are added as annotations, so a
+    batch of rows is read with the same number of queries whatever its size.
+
+    Args:
+        model (type[Model]): Django model.
+        related_fields (Iterable[str]): `__`-separated paths through the
+        relations of the model, ending with a field or a relation.
+        computed_fields (dict[str, Any]): Query expressions, functions or
+        `ComputedField` by document field name.
+        use_timestamp (bool): Represent the related datetimes as timestamps.
+
+    Attributes:
+        serializer_fields (dict[str, Field]): Serializer field of each
+        document field.
+        query_plan (QueryPlan): Relations and annotations loaded with the
+        rows.
+        dependencies (dict[type[Model], list[str]]): Lookups from the model
+        to each related model read by the fields, whose changes make the
+        documents stale.
+        through_models (dict[type[Model], type[Model]]): Model of the side
+        nearer to the model of each intermediate model of the many-to-many
+        relations read by the fields.
+
+    Raises:
+        InvalidRelatedFieldError: If a related path is not valid.
+        InvalidComputedFieldError: If a computed field is not valid.
+    """
+
+    def __init__(
+        self,
+        model: type[Model],
+        related_fields: Iterable[str] = (),
+        computed_fields: Optional[dict[str, Any]] = None,
+        use_timestamp: bool = False,
+    ):
+        self.model = model
+        self.use_timestamp = use_timestamp
+        self.serializer_fields: dict[str, serializers.Field] = {}
+        self.query_plan = QueryPlan()
+        self.dependencies: dict[type[Model], list[str]] = {}
+        self.through_models: dict[type[Model], type[Model]] = {}
+
+        model_field_names = {field.name for field in model._meta.fields}
+
+        if isinstance(related_fields, str):
+            raise InvalidRelatedFieldError(
+                f"{model.__name__}.related_fields must be a list"
+            )
+        for path in related_fields:
+            if path in model_field_names:
+                raise InvalidRelatedFieldError(
+                    f"{model.__name__}.{path} is already a document field"
+                )
+            self.serializer_fields[path] = self._related_field(path)
+
+        for name, value in (computed_fields or {}).items():
+            if name in model_field_names or name in self.serializer_fields:
+                raise InvalidComputedFieldError(
+                    f"{model.__name__}.{name} is already a document field"
+                )
+            self.serializer_fields[name] = self._computed_field(name, value)
+
+    @property
+    def names(self) -> list[str]:
+        """Names of the related and computed document fields."""
+        return list(self.serializer_fields)
+
+    @property
+    def needs_query(self) -> bool:
+        """Whether the fields need relations or annotations loaded with the
+        rows."""
+        return bool(self.query_plan)
+
+    def apply(self, queryset: QuerySet) -> QuerySet:
+        """Load the relations and annotations of the fields with a queryset.
+
+        Args:
+            queryset (QuerySet): Rows of the model.
+
+        Returns:
+            QuerySet: The rows, with their related rows and annotations.
+        """
+        return self.query_plan.apply(queryset)
+
+    def _related_field(self, path: str) -> RelatedPathField:
+        """Resolve a related path and plan the loading of its relations."""
+        model = self.model
+        relations: list[tuple[str, bool]] = []
+        lookups: list[tuple[str, str]] = []
+        many = False
+        leaf = None
+
+        segments = path.split("__")
+        for position, segment in enumerate(segments):
+            try:
+                field = model._meta.get_field(segment)
+            except FieldDoesNotExist as error:
+                raise InvalidRelatedFieldError(
+                    f"{model.__name__} does not have a field named {segment}"
+                    f" in the related field {path}"
+                ) from error
+
+            if not field.is_relation:
+                if position != len(segments) - 1 or not relations:
+                    raise InvalidRelatedFieldError(
+                        f"{path} must follow a relation of"
+                        f" {self.model.__name__} and end with its last field"
+                    )
+                leaf = self._leaf_field(field)
+                break
+
+            if field.related_model is None:
+                raise InvalidRelatedFieldError(
+                    f"{path} follows the generic relation {segment}"
+                )
+
+            field_many = bool(field.many_to_many or field.one_to_many)
+            attribute = self._attribute(field)
+            relations.append((attribute, field_many))
+            lookups.append((segment, attribute))
+            many = many or field_many
+            self._add_dependency(model, field, lookups)
+            model = field.related_model
+
+        self.query_plan.add_relations(lookups, many)
+        return RelatedPathField(relations, leaf, many)
+
+    def _leaf_field(self, model_field) -> serializers.Field:
+        """Build the serializer field of the last column of a related path."""
+        if self.use_timestamp and isinstance(model_field, DateTimeField):
+            return TimestampField(source=model_field.attname)
+
+        (
+            field_class,
+            kwargs,
+        ) = serializers.ModelSerializer().build_standard_field(
+            model_field.name, model_field
+        )
+        return field_class(source=model_field.attname, **kwargs)
+
+    def _computed_field(self, name: str, value: Any) -> serializers.Field:
+        """Build the serializer field of a computed field and plan its
+        annotation or the loading of its relations."""
+        if hasattr(value, "resolve_expression"):
+            self.query_plan.annotations[name] = value
+            return AnnotationField()
+
+        if callable(value):
+            value = ComputedField(value)
+
+        if not isinstance(value, ComputedField):
+            raise InvalidComputedFieldError(
+                f"{self.model.__name__}.computed_fields[{name!r}] must be an"
+                " expression, a function or a ComputedField"
+            )
+
+        for path in value.depends_on:
+            self._plan_dependency(name, path)
+        return ComputedValueField(value.function)
+
+    def _plan_dependency(self, name: str, path: str) -> None:
+        """Plan the loading of a chain of relations read by a function."""
+        model = self.model
+        lookups = []
+        many = False
+        for segment in path.split("__"):
+            try:
+                field = model._meta.get_field(segment)
+            except FieldDoesNotExist as error:
+                raise InvalidComputedFieldError(
+                    f"{model.__name__} does not have a relation named"
+                    f" {segment} in the dependencies of {name}"
+                ) from error
+
+            if not field.is_relation or field.related_model is None:
+                raise InvalidComputedFieldError(
+                    f"{model.__name__}.{segment} is not a relation in the"
+                    f" dependencies of {name}"
+                )
+
+            lookups.append((segment, self._attribute(field)))
+            many = many or bool(field.many_to_many or field.one_to_many)
+            self._add_dependency(model, field, lookups)
+            model = field.related_model
+
+        self.query_plan.add_relations(lookups, many)
+
+    @staticmethod
+    def _attribute(field: Any) -> str:
+        """Name of the attribute of the instances holding a relation."""
+        if hasattr(field, "get_accessor_name"):
+            return field.get_accessor_name()
+        return field.name
+
+    def _add_dependency(
+        self, model: type[Model], field, lookups: list[tuple[str, str]]
+    ) -> None:
+        """Record the lookup to the model of a relation of a model, and the
+        intermediate model of a many-to-many relation."""
+        lookup = "__".join(segment for segment, _ in lookups)
+        related_lookups = self.dependencies.setdefault(field.related_model, [])
+        if lookup not in related_lookups:
+            related_lookups.append(lookup)
+
+        if field.many_to_many:
+            through = getattr(field, "through", None)
+            if through is None:
+                through = field.remote_field.through
+            self.through_models[through] = model
@@ -0,0 +1,231 @@
+"""
+This module contains the IncrementalSyncMixin class, which uploads the rows
+changed since the last sync of an index, found with its watermark field, and
+deletes the documents of the deleted rows.
+"""
+
+from typing import Any, Iterator, Optional
+
+from django.db.models import IntegerField, Max
+from meilisearch.index import Index
+
+from django_meilisearch.batching import IndexingResult
+from django_meilisearch.exceptions import InvalidWatermarkFieldError
+from django_meilisearch.index_base import IndexBase
+from django_meilisearch.instrumentation import instrumented, record_documents
+
+
+class IncrementalSyncMixin(IndexBase):
+    """Incremental sync of the indexes with a `watermark_field`."""
+
+    @classmethod
+    @instrumented("sync")
+    def sync(cls, since: Any = None) -> IndexingResult:
+        """Bring the index up to date with the rows changed since the last sync.
+        Only the rows whose `watermark_field` is greater than or equal to `since`
+        are uploaded, `since` defaulting to the watermark stored by the last
+        successful sync. The documents of deleted rows are found by comparing
+        the primary keys of the index with the database, one range of
+        `sync_deletion_batch_size` rows at a time, read with a filter on the
+        integer `primary_key_field`, and deleted. Every document is still
+        read, so each sync sends about N / `sync_deletion_batch_size`
+        requests for an index of N documents, even when no row changed. The
+        first sync of an index uploads every row.
+
+        Args:
+            since (Any): Watermark to sync from. Defaults to the stored one.
+
+        Returns:
+            IndexingResult: List of Meilisearch task objects, with the
+            uploaded batches and the updated settings.
+
+        Raises:
+            InvalidWatermarkFieldError: If the index has no `watermark_field`.
+        """
+
+        if cls.watermark_field is None:
+            raise InvalidWatermarkFieldError(
+                f"{cls.__name__}.watermark_field must be set to sync the index"
+            )
+
+        if since is None:
+            since = cls.get_watermark()
+
+        # The watermark is read before the rows, so the rows changed during
+        # the sync are uploaded again by the next one.
+        queryset = cls.model.objects.all()
+        watermark = queryset.aggregate(watermark=Max(cls.watermark_field))[
+            "watermark"
+        ]
+        if since is not None:
+            queryset = queryset.filter(
+                **{f"{cls.watermark_field}__gte": since}
+            )
+
+        index = cls.get_index()
+        changes = cls.sync_settings()
+
+        batches = cls._add_batches(index, queryset=queryset)
+        task_uids = [batch.task_uid for batch in batches]
+        task_uids.extend(cls._delete_missing_documents(index))
+
+        tasks = cls.task_waiter.wait_many(task_uids)
+        cls.invalidate_search_cache()
+
+        if watermark is not None and all(
+            task.status == "succeeded" for task in tasks
+        ):
+            cls.set_watermark(watermark)
+
+        return IndexingResult(tasks, batches, changes)
+
+    @classmethod
+    def get_watermark(cls) -> Any:
+        """Get the watermark stored by the last successful sync of the index.
+
+        Returns:
+            Any: Watermark, `None` if the index was never synced.
+        """
+
+        # pylint: disable=import-outside-toplevel
+        from django_meilisearch.models import IndexWatermark
+
+        value = (
+            IndexWatermark.objects.filter(index_name=cls.name)
+            .values_list("value", flat=True)
+            .first()
+        )
+        if value is None or cls.watermark_field is None:
+            return None
+
+        # The watermark field is a concrete field, checked by the metaclass.
+        fields = {field.name: field for field in cls.model._meta.fields}
+        return fields[cls.watermark_field].to_python(value)
+
+    @classmethod
+    def set_watermark(cls, value: Any) -> None:
+        """Store the watermark of the index, `None` to sync every row again.
+
+        Args:
+            value (Any): Watermark.
+        """
+
+        # pylint: disable=import-outside-toplevel
+        from django_meilisearch.models import IndexWatermark
+
+        # DjangoJSONEncoder truncates the datetimes to milliseconds
+        if hasattr(value, "isoformat"):
+            value = value.isoformat()
+
+        IndexWatermark.objects.update_or_create(
+            index_name=cls.name, defaults={"value": value}
+        )
+
+    @classmethod
+    def _delete_missing_documents(cls, index: Index) -> list[int]:
+        """Delete the documents of the index whose row is deleted, one range
+        of primary keys at a time. The deletions of a range are sent once
+        every document of the range is read, so they never shift the pages
+        of the range still being read.
+
+        Args:
+            index (Index): Meilisearch index object.
+
+        Returns:
+            list[int]: UIDs of the deletion tasks.
+        """
+
+        task_uids = []
+        for key_range in cls._key_ranges():
+            deleted_keys = cls._deleted_keys(index, key_range)
+            if deleted_keys:
+                task_info = index.delete_documents(deleted_keys)
+                record_documents(len(deleted_keys))
+                task_uids.append(task_info.task_uid)
+        return task_uids
+
+    @classmethod
+    def _key_ranges(cls) -> Iterator[Optional[str]]:
+        """Split the primary keys of the rows into ranges of
+        `sync_deletion_batch_size` rows, read with keyset pagination. The
+        first and last ranges are open, so they also hold the documents
+        below and above every row. The primary keys which are not integers
+        are not split, since Meilisearch and the database may not order them
+        the same way.
+
+        Yields:
+            Optional[str]: Meilisearch filter of each range, `None` for
+            every document.
+        """
+
+        key_field = cls.primary_key_field
+        if not isinstance(cls.model._meta.get_field(key_field), IntegerField):
+            yield None
+            return
+
+        keys = cls.model.objects.order_by(key_field).values_list(
+            key_field, flat=True
+        )
+        lower = None
+        while True:
+            if lower is not None:
+                page = keys.filter(**{f"{key_field}__gt": lower})
+            else:
+                page = keys
+            size = cls.sync_deletion_batch_size
+            upper = page[size - 1 : size].first()
+
+            conditions = []
+            if lower is not None:
+                conditions.append(f"{key_field} > {lower}")
+            if upper is not None:
+                conditions.append(f"{key_field} <= {upper}")
+            yield " AND ".join(conditions) or None
+
+            if upper is None:
+                return
+            lower = upper
+
+    @classmethod
+    def _deleted_keys(
+        cls, index: Index, key_range: Optional[str]
+    ) -> list[Any]:
+        """Find the documents of a range of primary keys whose row is
+        deleted, by pages of `sync_deletion_batch_size` documents.
+
+        Args:
+            index (Index): Meilisearch index object.
+            key_range (Optional[str]): Meilisearch filter of the range.
+
+        Returns:
+            list[Any]: Primary keys of the deleted rows.
+        """
+
+        deleted_keys: list[Any] = []
+        offset = 0
+
+        while True:
+            parameters: dict[str, Any] = {
+                "fields": [cls.primary_key_field],
+                "offset": offset,
+                "limit": cls.sync_deletion_batch_size,
+            }
+            if key_range is not None:
+                parameters["filter"] = key_range
+            documents = index.get_documents(parameters).results
+
+            keys = [
+                getattr(document, cls.primary_key_field)
+                for document in documents
+            ]
+            existing_keys = set(
+                cls.model.objects.filter(
+                    **{f"{cls.primary_key_field}__in": keys}
+                ).values_list(cls.primary_key_field, flat=True)
+            )
+            deleted_keys.extend(
+                key for key in keys if key not in existing_keys
+            )
+            if len(documents) < cls.sync_deletion_batch_size:
+                return deleted_keys
+            offset += len(documents)
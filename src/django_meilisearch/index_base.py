@@ -0,0 +1,792 @@
+"""
+This module contains the IndexBase class, which holds the attributes of the
+indexes and the helpers shared by the methods of BaseIndex and of its mixins.
+"""
+
+import time
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+)
+
+from alive_progress import alive_bar
+from camel_converter import dict_to_camel
+from django.db.models import Case, IntegerField, Model, QuerySet, Value, When
+from meilisearch.errors import MeilisearchApiError
+from meilisearch.index import Index
+from meilisearch.models.task import Task
+from rest_framework.serializers import Serializer
+
+from django_meilisearch import async_client, client
+from django_meilisearch.batching import (
+    AdaptiveBatchSize,
+    BatchSizer,
+    BatchStats,
+)
+from django_meilisearch.cache import SearchCache
+from django_meilisearch.exceptions import InvalidUpdateFieldError
+from django_meilisearch.fields import DocumentFields
+from django_meilisearch.indexing_queue import IndexingQueue
+from django_meilisearch.instrumentation import (
+    Instrumentation,
+    operation,
+    record_documents,
+)
+from django_meilisearch.pipeline import PopulatePipeline
+from django_meilisearch.serializers import CompiledSerializer
+from django_meilisearch.types import OptParams
+from django_meilisearch.upload import DocumentStream
+from django_meilisearch.utils import (
+    diff_settings,
+    iterate_in_batches,
+    stream_in_batches,
+)
+from django_meilisearch.waiter import TaskWaiter
+
+
+class IndexBase:
+    """Attributes of the indexes and helpers shared by their methods.
+    The attributes are documented by `BaseIndex`, which extends this class
+    with the mixins of its optional features.
+    """
+
+    name: str
+    model: Type[Model]
+
+    # Resolved by the metaclass, from the model when they are not set.
+    primary_key_field: str
+    searchable_fields: Iterable[str]
+    filterable_fields: Iterable[str]
+    sortable_fields: Iterable[str]
+    related_fields: Optional[Iterable[str]] = None
+    computed_fields: Optional[dict[str, Any]] = None
+
+    use_timestamp: bool = False
+    use_compiled_serializer: bool = False
+    use_streamed_upload: bool = False
+    upload_compression: Optional[str] = "gzip"
+    indexing_batch_size: int = 100_000
+
+    task_waiter: TaskWaiter = TaskWaiter()
+    populate_pipeline: Optional[PopulatePipeline] = None
+    indexing_queue: Optional[IndexingQueue] = None
+    use_outbox: bool = False
+    search_cache: Optional[SearchCache] = None
+    watermark_field: Optional[str] = None
+    sync_deletion_batch_size: int = 1_000
+    instrumentation: Optional[Instrumentation] = None
+    adaptive_batch_size: Optional[AdaptiveBatchSize] = None
+
+    serializer: Type[Serializer]
+    compiled_serializer: Optional[CompiledSerializer]
+    document_fields: DocumentFields
+    _index_handle: Optional[Index]
+    _partial_serializers: dict[tuple[str, ...], Type[Serializer]]
+
+    @classmethod
+    def get_index(cls) -> Index:
+        """Get the Meilisearch index object of the index.
+        The object is created locally, without requesting the index to
+        Meilisearch, and kept until the index is created or destroyed again.
+
+        Returns:
+            Index: Meilisearch index object.
+        """
+
+        if cls._index_handle is None:
+            cls._index_handle = client.index(cls.name)
+        return cls._index_handle
+
+    @classmethod
+    def reset_index_handle(cls) -> None:
+        """Drop the Meilisearch index object of the index, which is created
+        again with the client of the process on its next use.
+        """
+
+        cls._index_handle = None
+
+    @classmethod
+    def get_index_settings(cls) -> dict[str, list[str]]:
+        """Get the Meilisearch settings defined by the index class.
+
+        Returns:
+            dict: Searchable, filterable and sortable attributes.
+        """
+
+        filterable_fields = list(cls.filterable_fields)
+        if (
+            cls.watermark_field is not None
+            and cls.primary_key_field not in filterable_fields
+        ):
+            # Read by the ranges of primary keys of `sync`.
+            filterable_fields.append(cls.primary_key_field)
+
+        return {
+            "searchableAttributes": list(cls.searchable_fields),
+            "filterableAttributes": filterable_fields,
+            "sortableAttributes": list(cls.sortable_fields),
+        }
+
+    @classmethod
+    def sync_settings(cls) -> dict[str, dict[str, Any]]:
+        """Update the index settings which differ from `get_index_settings`.
+        The current settings are fetched once and the changed ones are sent
+        in a single request, so that an unchanged index is not reindexed by
+        Meilisearch.
+
+        Returns:
+            dict: The changed settings, with their `old` and `new` values.
+        """
+
+        index = cls.get_index()
+        changes = diff_settings(index.get_settings(), cls.get_index_settings())
+        if changes:
+            index.update_settings(
+                {key: change["new"] for key, change in changes.items()}
+            )
+
+        return changes
+
+    @classmethod
+    def _add_batches_with_progress(cls, index: Index) -> list[BatchStats]:
+        """Upload the whole database in batches, showing a progress bar.
+
+        Args:
+            index (Index): Meilisearch index object.
+
+        Returns:
+            list[BatchStats]: Uploaded batches, in order.
+        """
+
+        db_count = cls.model.objects.count()
+
+        with alive_bar(db_count, title=f"Indexing {cls.name}") as progress:
+            return cls._add_batches(index, progress)
+
+    @classmethod
+    def _add_batches(
+        cls,
+        index: Index,
+        progress: Optional[Callable] = None,
+        queryset: Optional[QuerySet] = None,
+    ) -> list[BatchStats]:
+        """Serialize and upload the whole database in batches.
+        When `use_streamed_upload` is set, each batch is streamed from the
+        database cursor. Otherwise, when `populate_pipeline` is set, the
+        batches are serialized and uploaded by the pipeline while the next
+        batches are read from the database. When `adaptive_batch_size` is
+        set, the size of each batch is tuned from the previous ones.
+
+        Args:
+            index (Index): Meilisearch index object.
+            progress (Optional[Callable]): Called with the number of documents
+            of each uploaded batch.
+            queryset (Optional[QuerySet]): Rows to upload. Defaults to every
+            row of the model.
+
+        Returns:
+            list[BatchStats]: Uploaded batches, in order.
+        """
+
+        sizer = None
+        if cls.adaptive_batch_size is not None:
+            sizer = cls.adaptive_batch_size.start()
+
+        if cls.use_streamed_upload:
+            return cls._stream_batches(index, progress, queryset, sizer)
+
+        batches, serialize = cls._document_batches(queryset, sizer)
+        if sizer is not None:
+            serialize = cls._timed_serialize(serialize, sizer)
+
+        def upload(documents: list[dict]) -> BatchStats:
+            payload_bytes = None
+            with operation("add_documents"):
+                if sizer is None:
+                    task_info = index.add_documents(
+                        documents, cls.primary_key_field
+                    )
+                else:
+                    stream = DocumentStream([documents], compression=None)
+                    task_info = client.add_documents_stream(
+                        index.uid, stream, cls.primary_key_field
+                    )
+                    payload_bytes = stream.payload_bytes
+                    sizer.record_upload(
+                        len(documents), payload_bytes, task_info.task_uid
+                    )
+                record_documents(len(documents))
+            if progress is not None:
+                progress(len(documents))
+            return BatchStats(
+                len(documents), task_info.task_uid, payload_bytes
+            )
+
+        if cls.populate_pipeline is None:
+            return [upload(serialize(batch)) for batch in batches]
+
+        return cls.populate_pipeline.run(batches, serialize, upload)
+
+    @classmethod
+    def _stream_batches(
+        cls,
+        index: Index,
+        progress: Optional[Callable] = None,
+        queryset: Optional[QuerySet] = None,
+        sizer: Optional[BatchSizer] = None,
+    ) -> list[BatchStats]:
+        """Upload the whole database in batches streamed as NDJSON.
+        The rows of each batch are read from the database cursor, serialized
+        and compressed by chunks while the request is sent.
+
+        Args:
+            index (Index): Meilisearch index object.
+            progress (Optional[Callable]): Called with the number of documents
+            of each serialized chunk.
+            queryset (Optional[QuerySet]): Rows to upload. Defaults to every
+            row of the model.
+            sizer (Optional[BatchSizer]): Size of the next batch, tuned by the
+            uploaded ones. Defaults to batches of `indexing_batch_size` rows.
+
+        Returns:
+            list[BatchStats]: Uploaded batches, in order.
+        """
+
+        rows, key_getter, serialize = cls._document_rows(queryset)
+        serialize_seconds = 0.0
+
+        def documents(chunks: Iterator[list[Any]]) -> Iterator[list[dict]]:
+            nonlocal serialize_seconds
+            for chunk in chunks:
+                start = time.perf_counter()
+                chunk_documents = serialize(chunk)
+                serialize_seconds += time.perf_counter() - start
+                if progress is not None:
+                    progress(len(chunk_documents))
+                yield chunk_documents
+
+        batches = []
+        for chunks in stream_in_batches(
+            rows,
+            cls.primary_key_field,
+            sizer or cls.indexing_batch_size,
+            key_getter=key_getter,
+        ):
+            serialize_seconds = 0.0
+            with operation("add_documents"):
+                stream = DocumentStream(
+                    documents(chunks), cls.upload_compression
+                )
+                task_info = client.add_documents_stream(
+                    index.uid, stream, cls.primary_key_field
+                )
+                record_documents(stream.documents)
+            if sizer is not None:
+                sizer.record_serialize(stream.documents, serialize_seconds)
+                sizer.record_upload(
+                    stream.documents, stream.payload_bytes, task_info.task_uid
+                )
+            batches.append(
+                BatchStats(
+                    stream.documents, task_info.task_uid, stream.payload_bytes
+                )
+            )
+
+        return batches
+
+    @staticmethod
+    def _timed_serialize(
+        serialize: Callable[[list[Any]], list[dict]], sizer: BatchSizer
+    ) -> Callable[[list[Any]], list[dict]]:
+        """Record the serialization time of every batch in a sizer.
+
+        Args:
+            serialize (Callable): Function turning a batch into documents.
+            sizer (BatchSizer): Sizer recording the serialization times.
+
+        Returns:
+            Callable: Function turning a batch into documents.
+        """
+
+        def timed(batch: list[Any]) -> list[dict]:
+            start = time.perf_counter()
+            documents = serialize(batch)
+            sizer.record_serialize(len(documents), time.perf_counter() - start)
+            return documents
+
+        return timed
+
+    @classmethod
+    def _document_batches(
+        cls,
+        queryset: Optional[QuerySet] = None,
+        sizer: Optional[BatchSizer] = None,
+    ) -> tuple[Iterator[list[Any]], Callable[[list[Any]], list[dict]]]:
+        """Get the batches of the whole database and their serializer.
+
+        Args:
+            queryset (Optional[QuerySet]): Rows to read. Defaults to every
+            row of the model.
+            sizer (Optional[BatchSizer]): Size of the next batch. Defaults to
+            batches of `indexing_batch_size` rows.
+
+        Returns:
+            tuple: Iterator of batches and function turning a batch into
+            documents.
+        """
+
+        rows, key_getter, serialize = cls._document_rows(queryset)
+        batches = iterate_in_batches(
+            rows,
+            cls.primary_key_field,
+            sizer or cls.indexing_batch_size,
+            key_getter=key_getter,
+        )
+        return batches, serialize
+
+    @classmethod
+    def _document_rows(cls, queryset: Optional[QuerySet] = None) -> tuple[
+        QuerySet,
+        Optional[Callable[[Any], Any]],
+        Callable[[list[Any]], list[dict]],
+    ]:
+        """Get the rows of the whole database and their serializer.
+        The relations and annotations of the related and computed fields are
+        loaded with the rows. When `use_compiled_serializer` is set, the rows
+        are `values_list` rows serialized by the compiled serializer.
+
+        Args:
+            queryset (Optional[QuerySet]): Rows to read. Defaults to every
+            row of the model.
+
+        Returns:
+            tuple: QuerySet of the rows, function returning the primary key
+            of a row (`None` for model instances) and function turning rows
+            into documents.
+        """
+
+        if queryset is None:
+            queryset = cls.model.objects.all()
+        queryset = cls.document_fields.apply(queryset)
+
+        if cls.compiled_serializer is None:
+
+            def serialize(batch: list[Model]) -> list[dict]:
+                return cls.serializer(batch, many=True).data
+
+            return queryset, None, serialize
+
+        compiled = cls.compiled_serializer
+        key_position = compiled.columns.index(cls.primary_key_field)
+        return (
+            compiled.rows(queryset),
+            itemgetter(key_position),
+            compiled.to_documents,
+        )
+
+    @classmethod
+    def serialize_instances(
+        cls,
+        instances: Sequence[Model],
+        fields: Optional[Sequence[str]] = None,
+    ) -> list[dict]:
+        """Serialize model instances into documents.
+        When the related or computed fields need relations or annotations,
+        the instances are read again with them, with a constant number of
+        queries.
+
+        Args:
+            instances (Sequence[Model]): Django model instances.
+            fields (Optional[Sequence[str]]): Document fields to serialize,
+            with the primary key. Defaults to the whole documents.
+
+        Returns:
+            list[dict]: Documents of the instances.
+        """
+
+        serializer = cls.serializer
+        document_fields = cls.document_fields.names
+        if fields is not None:
+            serializer = cls._partial_serializer(fields)
+            document_fields = [
+                field for field in fields if field in document_fields
+            ]
+
+        if cls.document_fields.needs_query and document_fields:
+            keys = [
+                getattr(instance, cls.primary_key_field)
+                for instance in instances
+            ]
+            queryset = cls.document_fields.apply(
+                cls.model.objects.filter(
+                    **{f"{cls.primary_key_field}__in": keys}
+                )
+            )
+            return serializer(queryset, many=True).data
+
+        return serializer(instances, many=True).data
+
+    @classmethod
+    def get_changed_fields(cls, update_fields: Iterable[str]) -> list[str]:
+        """Get the document fields changed by a save with `update_fields`.
+        The related and computed fields are always included, since they may
+        be derived from the saved columns.
+
+        Args:
+            update_fields (Iterable[str]): Saved model fields, by name or
+            attribute name.
+
+        Returns:
+            list[str]: Document fields to update, without the primary key.
+        """
+
+        update_fields = set(update_fields)
+        changed = [
+            field.name
+            for field in cls.model._meta.fields
+            if field.name in cls.serializer.Meta.fields
+            and field.name != cls.primary_key_field
+            and (field.name in update_fields or field.attname in update_fields)
+        ]
+        return changed + cls.document_fields.names
+
+    @classmethod
+    def _partial_serializer(cls, fields: Sequence[str]) -> Type[Serializer]:
+        """Get the serializer of the primary key and some document fields.
+        The serializers are built once for each list of fields.
+
+        Args:
+            fields (Sequence[str]): Document fields to serialize.
+
+        Returns:
+            Type[Serializer]: Serializer of the partial documents.
+
+        Raises:
+            InvalidUpdateFieldError: If a field is not a document field.
+        """
+
+        names = tuple(dict.fromkeys([cls.primary_key_field, *fields]).keys())
+        serializer = cls._partial_serializers.get(names)
+        if serializer is not None:
+            return serializer
+
+        base = cls.serializer
+        unknown = [name for name in names if name not in base.Meta.fields]
+        if unknown:
+            raise InvalidUpdateFieldError(
+                f"{cls.__name__} does not have document fields named"
+                f" {', '.join(unknown)}"
+            )
+
+        def get_fields(self) -> dict[str, Any]:
+            all_fields = base.get_fields(self)
+            return {name: all_fields[name] for name in names}
+
+        serializer = type(
+            f"{base.__name__}Partial", (base,), {"get_fields": get_fields}
+        )
+        cls._partial_serializers[names] = serializer
+        return serializer
+
+    @classmethod
+    def _partial_queryset(
+        cls, queryset: QuerySet, fields: Sequence[str]
+    ) -> QuerySet:
+        """Read the columns of some document fields only.
+        The other columns are deferred, unless a related or computed field is
+        read, since they may be derived from any column.
+
+        Args:
+            queryset (QuerySet): Rows of the model.
+            fields (Sequence[str]): Document fields to read.
+
+        Returns:
+            QuerySet: The rows, with the columns of the fields.
+        """
+
+        if any(field in cls.document_fields.names for field in fields):
+            return cls.document_fields.apply(queryset)
+
+        return queryset.only(cls.primary_key_field, *fields)
+
+    @classmethod
+    def _search_params(
+        cls, to_queryset: bool, opt_params: OptParams
+    ) -> dict[str, Any]:
+        """Get the search parameters sent to Meilisearch.
+        The search is restricted to the `searchable_fields` by default, and
+        only the primary key of the hits is retrieved when `to_queryset` is
+        set.
+
+        Args:
+            to_queryset (bool): Whether the hits are turned into a QuerySet.
+            opt_params (OptParams): Search parameters, in snake case.
+
+        Returns:
+            dict: Search parameters, in camel case.
+        """
+
+        if not opt_params.get("attributes_to_search_on"):
+            opt_params["attributes_to_search_on"] = list(cls.searchable_fields)
+
+        if to_queryset:
+            opt_params["attributes_to_retrieve"] = [cls.primary_key_field]
+
+        return dict_to_camel(dict(opt_params))
+
+    @classmethod
+    def _search_results(
+        cls,
+        results: dict[str, Any],
+        to_queryset: bool,
+        select_related: Sequence[str],
+        prefetch_related: Sequence[str],
+    ) -> Union[dict[str, Any], QuerySet]:
+        """Count the hits of a search and turn them into a QuerySet when
+        `to_queryset` is set.
+
+        Args:
+            results (dict): Search results.
+            to_queryset (bool): Return the QuerySet of the hits.
+            select_related (Sequence[str]): Relations to select with the hits.
+            prefetch_related (Sequence[str]): Relations to prefetch with the
+            hits.
+
+        Returns:
+            Union[dict, QuerySet]: Search results, or the QuerySet of the hits
+            if `to_queryset` is set.
+        """
+
+        record_documents(len(results["hits"]))
+
+        if to_queryset:
+            return cls.hits_to_queryset(
+                results["hits"], select_related, prefetch_related
+            )
+
+        return results
+
+    @classmethod
+    def _search(cls, term: str, opt_params: dict[str, Any]) -> dict[str, Any]:
+        """Search the index, through the `search_cache` when it is set.
+
+        Args:
+            term (str): Search query term.
+            opt_params (dict): Search parameters, in camel case.
+
+        Returns:
+            dict: Search results.
+        """
+
+        # The results are only cached when the index has no unfinished task.
+        version = None
+        if cls.search_cache is not None:
+            version = cls.search_cache.version(cls.name)
+            results = cls.search_cache.get(cls.name, version, term, opt_params)
+            if results is not None:
+                return results
+            if not cls._search_settled(version):
+                version = None
+
+        try:
+            index = cls.get_index()
+            results = index.search(term, opt_params=opt_params)
+
+        except MeilisearchApiError as e:
+            return {"hits": [], **e.__dict__}
+
+        if cls.search_cache is not None and version is not None:
+            cls.search_cache.set(cls.name, version, term, opt_params, results)
+        return results
+
+    @classmethod
+    async def _asearch(
+        cls, term: str, opt_params: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Search the index with the async client, through the
+        `search_cache` when it is set.
+
+        Args:
+            term (str): Search query term.
+            opt_params (dict): Search parameters, in camel case.
+
+        Returns:
+            dict: Search results.
+        """
+
+        # The results are only cached when the index has no unfinished task.
+        version = None
+        if cls.search_cache is not None:
+            version = cls.search_cache.version(cls.name)
+            results = cls.search_cache.get(cls.name, version, term, opt_params)
+            if results is not None:
+                return results
+            if not await cls._asearch_settled(version):
+                version = None
+
+        try:
+            results = await async_client.search(
+                cls.name, {"q": term, **opt_params}
+            )
+
+        except MeilisearchApiError as e:
+            return {"hits": [], **e.__dict__}
+
+        if cls.search_cache is not None and version is not None:
+            cls.search_cache.set(cls.name, version, term, opt_params, results)
+        return results
+
+    @classmethod
+    def hits_to_queryset(
+        cls,
+        hits: list[dict[str, Any]],
+        select_related: Sequence[str] = (),
+        prefetch_related: Sequence[str] = (),
+    ) -> QuerySet:
+        """Get the model instances of search hits, in the order of the hits.
+        The instances are fetched with a single `__in` query on the primary
+        key field, ordered by the position of their hit.
+
+        Args:
+            hits (list[dict]): Search hits, holding at least the primary key.
+            select_related (Sequence[str]): Relations to select with the
+            instances.
+            prefetch_related (Sequence[str]): Relations to prefetch with the
+            instances.
+
+        Returns:
+            QuerySet: Model instances of the hits.
+        """
+
+        queryset = cls.model.objects.all()
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+
+        keys = [hit[cls.primary_key_field] for hit in hits]
+        if not keys:
+            return queryset.none()
+
+        return queryset.filter(
+            **{f"{cls.primary_key_field}__in": keys}
+        ).order_by(
+            Case(
+                *(
+                    When(**{cls.primary_key_field: key}, then=Value(position))
+                    for position, key in enumerate(keys)
+                ),
+                output_field=IntegerField(),
+            )
+        )
+
+    @classmethod
+    def _key_batches(
+        cls, queryset_or_ids: Union[QuerySet, Iterable[Any]]
+    ) -> Iterator[list[Any]]:
+        """Get the primary keys of rows or of a list of keys in batches.
+
+        Args:
+            queryset_or_ids (Union[QuerySet, Iterable[Any]]): Rows, or their
+            primary keys.
+
+        Yields:
+            list[Any]: At most `indexing_batch_size` primary keys.
+        """
+
+        if isinstance(queryset_or_ids, QuerySet):
+            yield from iterate_in_batches(
+                queryset_or_ids.values_list(cls.primary_key_field, flat=True),
+                cls.primary_key_field,
+                cls.indexing_batch_size,
+                key_getter=lambda key: key,
+            )
+            return
+
+        keys = list(queryset_or_ids)
+        for start in range(0, len(keys), cls.indexing_batch_size):
+            yield keys[start : start + cls.indexing_batch_size]
+
+    @classmethod
+    def invalidate_search_cache(cls) -> None:
+        """Drop the cached search results of the index, if any, by
+        incrementing its version in the `search_cache`.
+        """
+
+        if cls.search_cache is not None:
+            cls.search_cache.invalidate(cls.name)
+
+    @classmethod
+    def _search_settled(cls, version: int) -> bool:
+        """Check whether the search results of a version of the index can
+        be cached, polling the unfinished tasks of the index once unless
+        the version is already settled.
+
+        Args:
+            version (int): Version of the index.
+
+        Returns:
+            bool: Whether the index has no unfinished task.
+        """
+
+        if cls.search_cache is None:
+            return False
+        if cls.search_cache.settled(cls.name, version):
+            return True
+
+        results = client.get_tasks(
+            {
+                "indexUids": [cls.name],
+                "statuses": list(TaskWaiter.UNFINISHED_STATUSES),
+                "limit": 1,
+            }
+        )
+        return cls._settle_search(version, results.results)
+
+    @classmethod
+    async def _asearch_settled(cls, version: int) -> bool:
+        """Check whether the search results of a version of the index can
+        be cached, polling the unfinished tasks of the index once with the
+        async client unless the version is already settled.
+
+        Args:
+            version (int): Version of the index.
+
+        Returns:
+            bool: Whether the index has no unfinished task.
+        """
+
+        if cls.search_cache is None:
+            return False
+        if cls.search_cache.settled(cls.name, version):
+            return True
+
+        tasks = await async_client.get_index_tasks(
+            cls.name, list(TaskWaiter.UNFINISHED_STATUSES), limit=1
+        )
+        return cls._settle_search(version, tasks)
+
+    @classmethod
+    def _settle_search(cls, version: int, unfinished: list[Task]) -> bool:
+        """Settle a version of the index in the `search_cache` when it has
+        no unfinished task.
+
+        Args:
+            version (int): Version of the index.
+            unfinished (list[Task]): Unfinished tasks of the index.
+
+        Returns:
+            bool: Whether the index has no unfinished task.
+        """
+
+        if cls.search_cache is None or unfinished:
+            return False
+        cls.search_cache.settle(cls.name, version)
+        return True
@@ -3,22 +3,34 @@ This module contains the Document class, which provides methods for creating,
 populating, rebuilding, deleting, cleaning and searching an index in MeiliSearch.
 """
 
-from typing import Any, Iterable, Optional, Type
+from typing import Any, Iterable, Sequence, Union
 from typing_extensions import Unpack
 
-from alive_progress import alive_bar
-from camel_converter import dict_to_camel
-from django.db.models import Model
-from meilisearch.errors import MeilisearchApiError
+from django.db.models import Model, QuerySet
 from meilisearch.models.task import Task
-from rest_framework.serializers import Serializer
 
 from django_meilisearch import client
-from django_meilisearch.types import OptParams
+from django_meilisearch.async_indexes import AsyncIndexMixin
+from django_meilisearch.batching import IndexingResult
+from django_meilisearch.documents import DocumentsMixin
+from django_meilisearch.incremental import IncrementalSyncMixin
+from django_meilisearch.instrumentation import (
+    instrumented,
+    operation,
+    record_documents,
+)
 from django_meilisearch.metaclass import BaseIndexMetaclass
+from django_meilisearch.rebuild import RebuildMixin
+from django_meilisearch.types import OptParams
 
 
-class BaseIndex(metaclass=BaseIndexMetaclass):
+class BaseIndex(
+    AsyncIndexMixin,
+    DocumentsMixin,
+    IncrementalSyncMixin,
+    RebuildMixin,
+    metaclass=BaseIndexMetaclass,
+):
     """Index document for a Django model.
 
     Attributes:
@@ -32,38 +44,47 @@ class BaseIndex(metaclass=BaseIndexMetaclass):
         Defaults to all fields in the model.
         sortable_fields (list[str]): Fields to sort on.
         Defaults to all fields in the model.
+        related_fields (list[str]): `__`-separated paths through the relations
+        of the model (e.g. `author__name`) added to the documents, loaded with
+        `select_related` or `prefetch_related`.
+        computed_fields (dict[str, Any]): Query expressions, annotated on the
+        rows, functions of the instance or `ComputedField` added to the
+        documents, by name.
+        task_waiter (TaskWaiter): Waiter used by the synchronous methods to
+        wait for Meilisearch tasks. Each index gets a copy of the waiter of
+        its base class, unless it sets its own.
+        populate_pipeline (Optional[PopulatePipeline]): Pipeline used to overlap
+        the database reads, the serialization and the upload of the batches.
+        Defaults to a sequential populate.
+        indexing_queue (Optional[IndexingQueue]): Queue batching the documents
+        changed by the model signals until their transaction is committed.
+        Defaults to one request per saved or deleted instance.
+        use_outbox (bool): Write the documents changed by the model signals
+        to the outbox table, in the transaction of the changed rows, for the
+        `worker` action to send them to Meilisearch.
+        search_cache (Optional[SearchCache]): Cache of the search results,
+        invalidated by the writes to the index. Defaults to no cache.
+        watermark_field (Optional[str]): Field updated with every change of a
+        row (e.g. `updated_at`), used by `sync` to upload only the changed
+        rows. Defaults to no incremental sync.
+        sync_deletion_batch_size (int): Number of primary keys compared with
+        the database at a time by `sync` to find the deleted rows.
+        instrumentation (Optional[Instrumentation]): Receiver of the timing
+        and counters of every operation of the index. Defaults to no
+        instrumentation.
+        use_streamed_upload (bool): Upload the batches of `populate`, `rebuild`
+        and `sync` as NDJSON streamed from the database cursor, so that a
+        batch is never held in memory as a whole.
+        upload_compression (Optional[str]): `Content-Encoding` of the streamed
+        uploads, `gzip`, `deflate` or `None`.
+        adaptive_batch_size (Optional[AdaptiveBatchSize]): Tuning of the size
+        of the batches of `populate`, `rebuild` and `sync` from their payload
+        size, serialization time and task processing time. Defaults to
+        batches of `indexing_batch_size` rows.
     """
 
-    name: str
-    model: Type[Model]
-
-    primary_key_field: Optional[str] = None
-    searchable_fields: Optional[Iterable[str]] = None
-    filterable_fields: Optional[Iterable[str]] = None
-    sortable_fields: Optional[Iterable[str]] = None
-
-    use_timestamp: bool = False
-    indexing_batch_size: int = 100_000
-
-    serializer: Type[Serializer]
-
-    @classmethod
-    def __await_task_completion(cls, task_uid: int) -> Task:
-        """Wait for a task to complete.
-
-        Args:
-            task_uid (int): Task UID.
-
-        Returns:
-            Task: Meilisearch task object.
-        """
-
-        task = client.get_task(task_uid)
-        while task.status in ["enqueued", "processing"]:
-            task = client.get_task(task_uid)
-        return task
-
     @classmethod
+    @instrumented("acreate")
     def acreate(cls) -> Task:
         """Create the index asynchronously.
 
@@ -71,12 +92,14 @@ class BaseIndex(metaclass=BaseIndexMetaclass):
             Task: Meilisearch task object.
         """
 
+        cls.reset_index_handle()
         task_info = client.create_index(
             cls.name, {"primaryKey": cls.primary_key_field}
         )
         return client.get_task(task_info.task_uid)
 
     @classmethod
+    @instrumented("create")
     def create(cls) -> Task:
         """Create the index.
 
@@ -85,73 +108,53 @@ class BaseIndex(metaclass=BaseIndexMetaclass):
         """
 
         task = cls.acreate()
-        return cls.__await_task_completion(task.uid)
+        return cls.task_waiter.wait(task.uid)
 
     @classmethod
-    def apopulate(cls) -> list[Task]:
+    @instrumented("apopulate")
+    def apopulate(cls) -> IndexingResult:
         """Populate the index asynchronously.
         The method will index the entire database in batches of a number of documents
-        specified by the `indexing_batch_size` attribute.
+        specified by the `indexing_batch_size` attribute. Batches are fetched with
+        keyset pagination on the `primary_key_field`.
 
         Returns:
-            list[Task]: List of Meilisearch task objects.
+            IndexingResult: List of Meilisearch task objects, with the
+            uploaded batches and the updated settings.
         """
 
-        index = client.get_index(cls.name)
-
-        index.update_filterable_attributes(cls.filterable_fields)
-        index.update_searchable_attributes(cls.searchable_fields)
-        index.update_sortable_attributes(cls.sortable_fields)
+        index = cls.get_index()
+        changes = cls.sync_settings()
 
-        db_count = cls.model.objects.count()
-
-        tasks = []
-        for i in range(0, db_count, cls.indexing_batch_size):
-            batch = cls.model.objects.all()[i : i + cls.indexing_batch_size]
-            task_info = index.add_documents(
-                cls.serializer(batch, many=True).data,
-                cls.primary_key_field,
-            )
-            task = client.get_task(task_info.task_uid)
-            tasks.append(task)
-
-        return tasks
+        batches = cls._add_batches(index)
+        tasks = [client.get_task(batch.task_uid) for batch in batches]
+        cls.invalidate_search_cache()
+        return IndexingResult(tasks, batches, changes)
 
     @classmethod
-    def populate(cls) -> list[Task]:
+    @instrumented("populate")
+    def populate(cls) -> IndexingResult:
         """Populate the index.
         The method will index the entire database in batches of a number of documents
-        specified by the `indexing_batch_size` attribute.
+        specified by the `indexing_batch_size` attribute. Batches are fetched with
+        keyset pagination on the `primary_key_field`. Every batch is uploaded
+        before waiting, so all the batch tasks are awaited at once.
 
         Returns:
-            list[Task]: List of Meilisearch task objects.
+            IndexingResult: List of Meilisearch task objects, with the
+            uploaded batches and the updated settings.
         """
 
-        index = client.get_index(cls.name)
-
-        index.update_filterable_attributes(cls.filterable_fields)
-        index.update_searchable_attributes(cls.searchable_fields)
-        index.update_sortable_attributes(cls.sortable_fields)
+        index = cls.get_index()
+        changes = cls.sync_settings()
 
-        db_count = cls.model.objects.count()
-
-        tasks = []
-        with alive_bar(db_count, title=f"Indexing {cls.name}") as progress:
-            for i in range(0, db_count, cls.indexing_batch_size):
-                batch = cls.model.objects.all()[
-                    i : i + cls.indexing_batch_size
-                ]
-                task_info = index.add_documents(
-                    cls.serializer(batch, many=True).data,
-                    cls.primary_key_field,
-                )
-                task = cls.__await_task_completion(task_info.task_uid)
-                tasks.append(task)
-                progress(batch.count())  # pylint: disable=not-callable
-
-        return tasks
+        batches = cls._add_batches_with_progress(index)
+        tasks = cls.task_waiter.wait_many(batch.task_uid for batch in batches)
+        cls.invalidate_search_cache()
+        return IndexingResult(tasks, batches, changes)
 
     @classmethod
+    @instrumented("aclean")
     def aclean(cls) -> Task:
         """Delete all documents from the index asynchronously.
 
@@ -159,11 +162,14 @@ class BaseIndex(metaclass=BaseIndexMetaclass):
             Task: Meilisearch task object.
         """
 
-        index = client.get_index(cls.name)
+        index = cls.get_index()
         task_info = index.delete_all_documents()
-        return client.get_task(task_info.task_uid)
+        task = client.get_task(task_info.task_uid)
+        cls.invalidate_search_cache()
+        return task
 
     @classmethod
+    @instrumented("clean")
     def clean(cls) -> Task:
         """Delete all documents from the index.
 
@@ -172,17 +178,28 @@ class BaseIndex(metaclass=BaseIndexMetaclass):
         """
 
         task = cls.aclean()
-        return cls.__await_task_completion(task.uid)
+        task = cls.task_waiter.wait(task.uid)
+        cls.invalidate_search_cache()
+        return task
 
     @classmethod
+    @instrumented("search")
     def search(
-        cls, term: str, **opt_params: Unpack[OptParams]
-    ) -> dict[str, Any]:
+        cls,
+        term: str,
+        to_queryset: bool = False,
+        select_related: Sequence[str] = (),
+        prefetch_related: Sequence[str] = (),
+        **opt_params: Unpack[OptParams],
+    ) -> Union[dict[str, Any], QuerySet]:
         # pylint: disable=line-too-long
         """Do a search on the index.
 
         Args:
             term (str): Define the search query term.
+            to_queryset (bool): Return the model instances of the hits in their ranking order, fetched with a single query, instead of the search results. Only the primary key of the hits is retrieved from Meilisearch. (Default: False)
+            select_related (Sequence[str]): Relations passed to `select_related` when `to_queryset` is set.
+            prefetch_related (Sequence[str]): Relations passed to `prefetch_related` when `to_queryset` is set.
             limit (Optional[int]): Used with `offset` to paginate results, define the number of hits to return. (Default: 20)
             offset (Optional[int]): Used with `limit` to paginate results, define the offset of the first hit to return. (Default: 0)
             hits_per_page (Optional[int]): Used with `page` to paginate results, define the number of hits to return per page. (Default: 20)
@@ -205,28 +222,22 @@ class BaseIndex(metaclass=BaseIndexMetaclass):
             attributes_to_search_on (Optional[list[str]]): Define the attributes to search on. If not set, the default attributes to search on are used.
 
         Returns:
-            dict: Search results.
+            Union[dict, QuerySet]: Search results, from the `search_cache` when it is set, or the QuerySet of the hits if `to_queryset` is set.
 
         _(See the MeiliSearch documentation to learn more about the options available for the search method and their usage.)_
 
         https://www.meilisearch.com/docs/reference/api/search
         """
 
-        if not opt_params.get("attributes_to_search_on"):
-            opt_params["attributes_to_search_on"] = cls.searchable_fields
-
-        opt_params = dict_to_camel(opt_params)
-
-        try:
-            index = client.get_index(cls.name)
-            results = index.search(term, opt_params=opt_params)
-
-        except MeilisearchApiError as e:
-            results = {"hits": [], **e.__dict__}
-
-        return results
+        results = cls._search(
+            term, cls._search_params(to_queryset, opt_params)
+        )
+        return cls._search_results(
+            results, to_queryset, select_related, prefetch_related
+        )
 
     @classmethod
+    @instrumented("adestroy")
     def adestroy(cls) -> Task:
         """Delete the index asynchronously.
 
@@ -234,10 +245,14 @@ class BaseIndex(metaclass=BaseIndexMetaclass):
             Task: Meilisearch task object.
         """
 
+        cls.reset_index_handle()
         task_info = client.delete_index(cls.name)
-        return client.get_task(task_info.task_uid)
+        task = client.get_task(task_info.task_uid)
+        cls.invalidate_search_cache()
+        return task
 
     @classmethod
+    @instrumented("destroy")
     def destroy(cls) -> Task:
         """Delete the index.
 
@@ -246,9 +261,12 @@ class BaseIndex(metaclass=BaseIndexMetaclass):
         """
 
         task = cls.adestroy()
-        return cls.__await_task_completion(task.uid)
+        task = cls.task_waiter.wait(task.uid)
+        cls.invalidate_search_cache()
+        return task
 
     @classmethod
+    @instrumented("aadd_single_document")
     def aadd_single_document(cls, instance: Model) -> Task:
         """Add a single document to the index asynchronously.
 
@@ -259,14 +277,18 @@ class BaseIndex(metaclass=BaseIndexMetaclass):
             Task: Meilisearch task object.
         """
 
-        index = client.index(cls.name)
+        index = cls.get_index()
         task_info = index.add_documents(
-            [cls.serializer(instance).data],
+            cls.serialize_instances([instance]),
             cls.primary_key_field,
         )
-        return client.get_task(task_info.task_uid)
+        record_documents(1)
+        task = client.get_task(task_info.task_uid)
+        cls.invalidate_search_cache()
+        return task
 
     @classmethod
+    @instrumented("add_single_document")
     def add_single_document(cls, instance: Model) -> Task:
         """Add a single document to the index.
 
@@ -278,9 +300,134 @@ class BaseIndex(metaclass=BaseIndexMetaclass):
         """
 
         task = cls.aadd_single_document(instance)
-        return cls.__await_task_completion(task.uid)
+        task = cls.task_waiter.wait(task.uid)
+        cls.invalidate_search_cache()
+        return task
 
     @classmethod
+    @instrumented("aupdate_single_document")
+    def aupdate_single_document(
+        cls, instance: Model, fields: Sequence[str]
+    ) -> Task:
+        """Update some attributes of a single document asynchronously.
+        Only the primary key and the given fields are sent, and the other
+        attributes of the document are kept.
+
+        Args:
+            instance (django.db.models.Model): Django model instance.
+            fields (Sequence[str]): Document fields to update.
+
+        Returns:
+            Task: Meilisearch task object.
+        """
+
+        index = cls.get_index()
+        task_info = index.update_documents(
+            cls.serialize_instances([instance], fields),
+            cls.primary_key_field,
+        )
+        record_documents(1)
+        task = client.get_task(task_info.task_uid)
+        cls.invalidate_search_cache()
+        return task
+
+    @classmethod
+    @instrumented("update_single_document")
+    def update_single_document(
+        cls, instance: Model, fields: Sequence[str]
+    ) -> Task:
+        """Update some attributes of a single document.
+
+        Args:
+            instance (django.db.models.Model): Django model instance.
+            fields (Sequence[str]): Document fields to update.
+
+        Returns:
+            Task: Meilisearch task object.
+        """
+
+        task = cls.aupdate_single_document(instance, fields)
+        task = cls.task_waiter.wait(task.uid)
+        cls.invalidate_search_cache()
+        return task
+
+    @classmethod
+    @instrumented("aupdate_fields")
+    def aupdate_fields(
+        cls,
+        queryset_or_ids: Union[QuerySet, Iterable[Any]],
+        fields: Sequence[str],
+    ) -> list[Task]:
+        """Update some attributes of several documents asynchronously.
+        Only the primary key and the columns of the given fields are read,
+        and sent with one `update_documents` request per batch of
+        `indexing_batch_size` rows. The other attributes of the documents
+        are kept.
+
+        Args:
+            queryset_or_ids (Union[QuerySet, Iterable[Any]]): Rows of the
+            documents, or their primary keys.
+            fields (Sequence[str]): Document fields to update.
+
+        Returns:
+            list[Task]: List of Meilisearch task objects.
+
+        Raises:
+            InvalidUpdateFieldError: If a field is not a document field.
+        """
+
+        serializer = cls._partial_serializer(fields)
+        index = cls.get_index()
+        task_uids = []
+        for keys in cls._key_batches(queryset_or_ids):
+            rows = cls._partial_queryset(
+                cls.model.objects.filter(
+                    **{f"{cls.primary_key_field}__in": keys}
+                ),
+                fields,
+            )
+            with operation("update_documents"):
+                documents = serializer(rows, many=True).data
+                task_info = index.update_documents(
+                    documents, cls.primary_key_field
+                )
+                record_documents(len(documents))
+            task_uids.append(task_info.task_uid)
+
+        tasks = [client.get_task(task_uid) for task_uid in task_uids]
+        cls.invalidate_search_cache()
+        return tasks
+
+    @classmethod
+    @instrumented("update_fields")
+    def update_fields(
+        cls,
+        queryset_or_ids: Union[QuerySet, Iterable[Any]],
+        fields: Sequence[str],
+    ) -> list[Task]:
+        """Update some attributes of several documents.
+        The documents are updated in batches of `indexing_batch_size` rows,
+        and the tasks of the batches are awaited at once.
+
+        Args:
+            queryset_or_ids (Union[QuerySet, Iterable[Any]]): Rows of the
+            documents, or their primary keys.
+            fields (Sequence[str]): Document fields to update.
+
+        Returns:
+            list[Task]: List of Meilisearch task objects.
+
+        Raises:
+            InvalidUpdateFieldError: If a field is not a document field.
+        """
+
+        tasks = cls.aupdate_fields(queryset_or_ids, fields)
+        tasks = cls.task_waiter.wait_many(task.uid for task in tasks)
+        cls.invalidate_search_cache()
+        return tasks
+
+    @classmethod
+    @instrumented("aremove_single_document")
     def aremove_single_document(cls, instance: Model) -> Task:
         """Remove a single document from the index asynchronously.
 
@@ -291,11 +438,15 @@ class BaseIndex(metaclass=BaseIndexMetaclass):
             Task: Meilisearch task object.
         """
 
-        index = client.get_index(cls.name)
+        index = cls.get_index()
         task_info = index.delete_document(instance.pk)
-        return client.get_task(task_info.task_uid)
+        record_documents(1)
+        task = client.get_task(task_info.task_uid)
+        cls.invalidate_search_cache()
+        return task
 
     @classmethod
+    @instrumented("remove_single_document")
     def remove_single_document(cls, instance: Model) -> Task:
         """Remove a single document from the index.
 
@@ -307,9 +458,12 @@ class BaseIndex(metaclass=BaseIndexMetaclass):
         """
 
         task = cls.aremove_single_document(instance)
-        return cls.__await_task_completion(task.uid)
+        task = cls.task_waiter.wait(task.uid)
+        cls.invalidate_search_cache()
+        return task
 
     @classmethod
+    @instrumented("count")
     def count(cls) -> int:
         """Get the number of documents in the index.
 
@@ -317,5 +471,5 @@ class BaseIndex(metaclass=BaseIndexMetaclass):
             int: Number of documents in the index.
         """
 
-        index = client.get_index(cls.name)
+        index = cls.get_index()
         return index.get_stats().number_of_documents
@@ -0,0 +1,285 @@
+"""
+This module contains the IndexingQueue class, which collects the documents
+changed by the model signals and sends them to Meilisearch in batches once
+their transaction is committed.
+"""
+
+import atexit
+import logging
+import threading
+from functools import partial
+from typing import TYPE_CHECKING, Any, Optional
+
+from django.db import connections, transaction
+from django.db.models import Model
+
+from django_meilisearch.instrumentation import operation, record_documents
+
+if TYPE_CHECKING:
+    from django_meilisearch.indexes import BaseIndex
+
+logger = logging.getLogger("django_meilisearch")
+
+
+class IndexingQueue:
+    """Coalesce the signal driven document changes of the indexes.
+
+    The changes are only queued when the transaction of the saved or deleted
+    row is committed, so rolled back changes never reach Meilisearch. Pending
+    changes are deduplicated by document primary key: the last saved instance
+    wins and a deletion wins over any saved instance. The queue is flushed
+    when `batch_size` changes are pending or `flush_interval` seconds after
+    the first pending change, sending one `add_documents` and one
+    `delete_documents` request per index. When a flush fails, the changes
+    not sent are queued again, unless a newer change of their document is
+    pending, and the failure of a flush after `flush_interval` is logged.
+    The timed flushes run in a timer thread, which closes its database
+    connections once done. The queue is flushed when the interpreter exits,
+    and a failure of that last flush is logged with the number of changes
+    lost.
+
+    Args:
+        batch_size (int): Number of pending changes triggering a flush.
+        flush_interval (Optional[float]): Maximum time a change stays pending,
+        in seconds. Defaults to flushing only by size or on `flush` calls.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 1000,
+        flush_interval: Optional[float] = 1.0,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._lock = threading.Lock()
+        self._additions: dict["type[BaseIndex]", dict[Any, Model]] = {}
+        self._deletions: dict["type[BaseIndex]", set[Any]] = {}
+        self._pending = 0
+        self._timer: Optional[threading.Timer] = None
+
+        atexit.register(self._flush_at_exit)
+
+    def __len__(self) -> int:
+        return self._pending
+
+    def add(
+        self,
+        index_cls: "type[BaseIndex]",
+        instance: Model,
+        using: Optional[str] = None,
+    ) -> None:
+        """Queue the addition of an instance when its transaction commits.
+
+        Args:
+            index_cls (type[BaseIndex]): Index class of the document.
+            instance (Model): Django model instance.
+            using (Optional[str]): Database of the saved row. Defaults to the
+            default database.
+        """
+        key = getattr(instance, index_cls.primary_key_field)
+        transaction.on_commit(
+            partial(self._push, index_cls, key, instance), using=using
+        )
+
+    def remove(
+        self,
+        index_cls: "type[BaseIndex]",
+        instance: Model,
+        using: Optional[str] = None,
+    ) -> None:
+        """Queue the removal of an instance when its transaction commits.
+
+        Args:
+            index_cls (type[BaseIndex]): Index class of the document.
+            instance (Model): Django model instance.
+            using (Optional[str]): Database of the deleted row. Defaults to
+            the default database.
+        """
+        key = getattr(instance, index_cls.primary_key_field)
+        transaction.on_commit(
+            partial(self._push, index_cls, key, None), using=using
+        )
+
+    def flush(self) -> list[int]:
+        """Send the pending changes to Meilisearch.
+
+        Returns:
+            list[int]: Task UIDs of the sent requests.
+
+        Raises:
+            Exception: The error of a failed request, once the changes not
+            sent are queued again.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            additions, self._additions = self._additions, {}
+            deletions, self._deletions = self._deletions, {}
+            self._pending = 0
+
+        task_uids: list[int] = []
+        try:
+            self._send(additions, deletions, task_uids)
+        except Exception:
+            self._requeue(additions, deletions)
+            raise
+
+        return task_uids
+
+    def _send(
+        self,
+        additions: dict["type[BaseIndex]", dict[Any, Model]],
+        deletions: dict["type[BaseIndex]", set[Any]],
+        task_uids: list[int],
+    ) -> None:
+        """Send the changes of each index, dropping them once sent.
+
+        Args:
+            additions (dict): Saved instances by index and primary key.
+            deletions (dict): Deleted primary keys by index.
+            task_uids (list[int]): Extended with the UIDs of the tasks.
+        """
+        for index_cls in list(additions):
+            instances = additions[index_cls]
+            if not instances:
+                del additions[index_cls]
+                continue
+
+            with operation(
+                "flush_additions", index_cls.name, index_cls.instrumentation
+            ):
+                documents = index_cls.serialize_instances(
+                    list(instances.values())
+                )
+                index = index_cls.get_index()
+                task_info = index.add_documents(
+                    documents, index_cls.primary_key_field
+                )
+                record_documents(len(documents))
+            task_uids.append(task_info.task_uid)
+            index_cls.invalidate_search_cache()
+            del additions[index_cls]
+
+        for index_cls in list(deletions):
+            keys = deletions[index_cls]
+            if not keys:
+                del deletions[index_cls]
+                continue
+
+            with operation(
+                "flush_deletions", index_cls.name, index_cls.instrumentation
+            ):
+                index = index_cls.get_index()
+                task_info = index.delete_documents(list(keys))
+                record_documents(len(keys))
+            task_uids.append(task_info.task_uid)
+            index_cls.invalidate_search_cache()
+            del deletions[index_cls]
+
+    def _requeue(
+        self,
+        additions: dict["type[BaseIndex]", dict[Any, Model]],
+        deletions: dict["type[BaseIndex]", set[Any]],
+    ) -> None:
+        """Queue again the changes of a failed flush, unless a newer change
+        of their document is pending.
+
+        Args:
+            additions (dict): Saved instances not sent, by index and key.
+            deletions (dict): Deleted primary keys not sent, by index.
+        """
+        with self._lock:
+            for index_cls in additions.keys() | deletions.keys():
+                queued = self._additions.setdefault(index_cls, {})
+                removed = self._deletions.setdefault(index_cls, set())
+
+                for key, instance in additions.get(index_cls, {}).items():
+                    if key not in queued and key not in removed:
+                        queued[key] = instance
+                        self._pending += 1
+                for key in deletions.get(index_cls, ()):
+                    if key not in queued and key not in removed:
+                        removed.add(key)
+                        self._pending += 1
+
+            self._schedule()
+
+    def _flush_on_timer(self) -> None:
+        """Flush the queue from the timer thread, logging a failure."""
+        try:
+            self.flush()
+        # The changes are queued again, and the timer thread has no caller
+        # to raise to.
+        # pylint: disable-next=broad-exception-caught
+        except Exception:
+            logger.exception("Flush of the indexing queue failed")
+        finally:
+            # The connections opened by the serializers belong to the timer
+            # thread, which ends here.
+            connections.close_all()
+
+    def _flush_at_exit(self) -> None:
+        """Flush the queue when the interpreter exits, logging a failure
+        instead of raising it during the shutdown."""
+        try:
+            self.flush()
+        # The interpreter is exiting, so the changes queued again are lost.
+        # pylint: disable-next=broad-exception-caught
+        except Exception:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            logger.exception(
+                "Flush of the indexing queue at exit failed, %d change(s)"
+                " lost",
+                len(self),
+            )
+
+    def _push(
+        self, index_cls: "type[BaseIndex]", key: Any, instance: Optional[Model]
+    ) -> None:
+        """Record a committed change, flushing the queue if it is full.
+
+        Args:
+            index_cls (type[BaseIndex]): Index class of the document.
+            key (Any): Document primary key.
+            instance (Optional[Model]): Saved instance, `None` for a deletion.
+        """
+        with self._lock:
+            additions = self._additions.setdefault(index_cls, {})
+            deletions = self._deletions.setdefault(index_cls, set())
+
+            if instance is None:
+                if key not in deletions:
+                    self._pending += key not in additions
+                    additions.pop(key, None)
+                    deletions.add(key)
+            elif key not in deletions:
+                self._pending += key not in additions
+                additions[key] = instance
+
+            full = self._pending >= self.batch_size
+            if not full:
+                self._schedule()
+
+        if full:
+            self.flush()
+
+    def _schedule(self) -> None:
+        """Start the timer of the next flush of the pending changes, if not
+        started. The lock of the queue must be held.
+        """
+        if (
+            self._pending
+            and self._timer is None
+            and self.flush_interval is not None
+        ):
+            self._timer = threading.Timer(
+                self.flush_interval, self._flush_on_timer
+            )
+            self._timer.daemon = True
+            self._timer.start()
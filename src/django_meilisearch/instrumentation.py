@@ -0,0 +1,444 @@
+"""
+This module contains the instrumentation of the indexes: the OperationEvent
+emitted by every operation of an index, the Instrumentation class sending
+the events to sinks, and the LoggingSink, SignalSink and MetricsCollector
+sinks.
+"""
+
+import functools
+import inspect
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Sequence,
+    TYPE_CHECKING,
+)
+
+from django.dispatch import Signal
+
+if TYPE_CHECKING:
+    from django_meilisearch.indexes import BaseIndex
+
+logger = logging.getLogger("django_meilisearch")
+
+operation_finished = Signal()
+"""Sent by the SignalSink with the `event` of each finished operation."""
+
+
+@dataclass
+class OperationCounts:
+    """Traffic of a single operation of an index.
+
+    Attributes:
+        documents (int): Number of documents sent, deleted or found.
+        round_trips (int): Number of HTTP requests sent to Meilisearch.
+        bytes_sent (int): Size of the bodies of the requests, in bytes.
+        bytes_received (int): Size of the bodies of the responses, in bytes.
+    """
+
+    documents: int = 0
+    round_trips: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+
+@dataclass
+class OperationEvent:
+    """Measures of a single operation of an index.
+
+    Attributes:
+        operation (str): Operation name, e.g. `search` or `populate`.
+        index_name (str): Index name.
+        duration (float): Duration of the operation, in seconds.
+        counts (OperationCounts): Documents and HTTP requests of the
+        operation.
+        task_uids (list[int]): UIDs of the Meilisearch tasks enqueued.
+        parent (Optional[str]): Operation during which this one ran, e.g.
+        `populate` for its `add_documents` batches.
+        error (Optional[str]): Error raised by the operation, if any.
+    """
+
+    operation: str
+    index_name: str
+    duration: float = 0.0
+    counts: OperationCounts = field(default_factory=OperationCounts)
+    task_uids: list[int] = field(default_factory=list)
+    parent: Optional[str] = None
+    error: Optional[str] = None
+
+
+class Sink(Protocol):  # pylint: disable=too-few-public-methods
+    """Receiver of the events of the indexes."""
+
+    def emit(self, event: OperationEvent) -> None:
+        """Receive a finished operation."""
+
+
+@dataclass
+class Instrumentation:
+    """Send the events of the operations of an index to sinks.
+
+    A sink is any object with an `emit(event)` method. The errors raised by
+    a sink are logged, so a broken sink never fails an operation.
+
+    Args:
+        sinks (Sequence[Sink]): Receivers of the events.
+    """
+
+    sinks: Sequence[Sink] = ()
+
+    def emit(self, event: OperationEvent) -> None:
+        """Send an event to every sink.
+
+        Args:
+            event (OperationEvent): Finished operation.
+        """
+        for sink in self.sinks:
+            try:
+                sink.emit(event)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Instrumentation sink %r failed", sink)
+
+
+@dataclass
+class LoggingSink:
+    """Log every event, with its fields in the `meilisearch_event` extra.
+
+    Args:
+        logger_name (str): Name of the logger.
+        level (int): Level of the events. The failed operations are logged
+        at the `WARNING` level at least.
+    """
+
+    logger_name: str = "django_meilisearch"
+    level: int = logging.INFO
+
+    def emit(self, event: OperationEvent) -> None:
+        """Log an event."""
+        level = self.level
+        if event.error is not None:
+            level = max(level, logging.WARNING)
+
+        logging.getLogger(self.logger_name).log(
+            level,
+            "%s %s: %.1fms, %d documents, %d round-trips, %d bytes sent%s",
+            event.index_name,
+            event.operation,
+            event.duration * 1e3,
+            event.counts.documents,
+            event.counts.round_trips,
+            event.counts.bytes_sent,
+            "" if event.error is None else f", failed: {event.error}",
+            extra={"meilisearch_event": asdict(event)},
+        )
+
+
+@dataclass
+class SignalSink:
+    """Send the `operation_finished` signal for every event, with the index
+    name as sender."""
+
+    def emit(self, event: OperationEvent) -> None:
+        """Send the signal of an event."""
+        operation_finished.send(sender=event.index_name, event=event)
+
+
+class MetricsCollector:
+    """Aggregate the events into counters and duration histograms.
+
+    The metrics are labelled by index and operation, and `render` exposes
+    them in the OpenMetrics text format, e.g. from a view scraped by
+    Prometheus.
+
+    Args:
+        buckets (Iterable[float]): Upper bounds of the duration histogram
+        buckets, in seconds.
+        prefix (str): Prefix of the metric names.
+    """
+
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+    COUNTERS = (
+        ("operations", "Operations performed"),
+        ("errors", "Operations which raised an error"),
+        ("documents", "Documents sent, deleted or found"),
+        ("round_trips", "HTTP requests sent to Meilisearch"),
+        ("bytes_sent", "Size of the request bodies, in bytes"),
+        ("bytes_received", "Size of the response bodies, in bytes"),
+        ("tasks", "Meilisearch tasks enqueued"),
+    )
+
+    def __init__(
+        self,
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+        prefix: str = "django_meilisearch",
+    ):
+        self.buckets = sorted(buckets)
+        self.prefix = prefix
+
+        self._lock = threading.Lock()
+        self._series: dict[tuple[str, str], dict[str, Any]] = {}
+
+    def emit(self, event: OperationEvent) -> None:
+        """Add an event to the metrics."""
+        with self._lock:
+            series = self._series.get((event.index_name, event.operation))
+            if series is None:
+                series = {name: 0 for name, _ in self.COUNTERS}
+                series["duration_sum"] = 0.0
+                series["duration_buckets"] = [0] * len(self.buckets)
+                self._series[(event.index_name, event.operation)] = series
+
+            series["operations"] += 1
+            series["errors"] += event.error is not None
+            for name, value in asdict(event.counts).items():
+                series[name] += value
+            series["tasks"] += len(event.task_uids)
+            series["duration_sum"] += event.duration
+            for position, bound in enumerate(self.buckets):
+                if event.duration <= bound:
+                    series["duration_buckets"][position] += 1
+
+    def get(self, index_name: str, op_name: str) -> dict[str, Any]:
+        """Get the metrics of an operation of an index.
+
+        Args:
+            index_name (str): Index name.
+            op_name (str): Operation name.
+
+        Returns:
+            dict: Counters, `duration_sum` and cumulative `duration_buckets`.
+            Empty if the operation never finished.
+        """
+        with self._lock:
+            series = self._series.get((index_name, op_name), {})
+            return {
+                key: list(value) if isinstance(value, list) else value
+                for key, value in series.items()
+            }
+
+    def reset(self) -> None:
+        """Drop every metric."""
+        with self._lock:
+            self._series.clear()
+
+    def render(self) -> str:
+        """Render the metrics in the OpenMetrics text format.
+
+        Returns:
+            str: Metrics exposition, ending with `# EOF`.
+        """
+        with self._lock:
+            series = sorted(self._series.items())
+
+            lines = []
+            for name, description in self.COUNTERS:
+                metric = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {metric} counter")
+                lines.append(f"# HELP {metric} {description}.")
+                for labels, values in series:
+                    lines.append(
+                        f"{metric}_total{self._labels(*labels)} {values[name]}"
+                    )
+
+            metric = f"{self.prefix}_operation_duration_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            lines.append(f"# HELP {metric} Duration of the operations.")
+            for labels, values in series:
+                for bound, count in zip(
+                    self.buckets, values["duration_buckets"]
+                ):
+                    lines.append(
+                        f"{metric}_bucket"
+                        f"{self._labels(*labels, le=repr(float(bound)))}"
+                        f" {count}"
+                    )
+                lines.append(
+                    f"{metric}_bucket{self._labels(*labels, le='+Inf')}"
+                    f" {values['operations']}"
+                )
+                lines.append(
+                    f"{metric}_count{self._labels(*labels)}"
+                    f" {values['operations']}"
+                )
+                lines.append(
+                    f"{metric}_sum{self._labels(*labels)}"
+                    f" {values['duration_sum']}"
+                )
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _labels(index_name: str, op_name: str, **extra: str) -> str:
+        """Format the labels of a sample."""
+        labels = {"index": index_name, "operation": op_name, **extra}
+        return (
+            "{"
+            + ",".join(
+                f'{key}="{_escape(value)}"' for key, value in labels.items()
+            )
+            + "}"
+        )
+
+
+def _escape(value: str) -> str:
+    """Escape a label value of the OpenMetrics text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class _ActiveOperation(NamedTuple):
+    """Event of a running operation and the instrumentation receiving it."""
+
+    event: OperationEvent
+    instrumentation: Instrumentation
+
+
+# Operations running in the current thread or coroutine, innermost last.
+# The populate pipeline runs its threads in a copy of this context, so the
+# requests of its uploads are counted by the operation which started it.
+_active: ContextVar[tuple[_ActiveOperation, ...]] = ContextVar(
+    "django_meilisearch_operations", default=()
+)
+_record_lock = threading.Lock()
+
+
+@contextmanager
+def operation(
+    name: str,
+    index_name: Optional[str] = None,
+    instrumentation: Optional[Instrumentation] = None,
+) -> Iterator[Optional[OperationEvent]]:
+    """Measure an operation and emit its event when it finishes.
+
+    Without `instrumentation`, the operation is a child of the innermost
+    running operation, whose index and instrumentation it shares, and is not
+    measured when no operation is running. The requests and documents of an
+    operation are also counted by the operations it runs within.
+
+    Args:
+        name (str): Operation name.
+        index_name (Optional[str]): Index name. Defaults to the index of the
+        parent operation.
+        instrumentation (Optional[Instrumentation]): Receiver of the event.
+        Defaults to the instrumentation of the parent operation.
+
+    Yields:
+        Optional[OperationEvent]: Event of the operation, `None` when it is
+        not measured.
+    """
+    stack = _active.get()
+    parent = stack[-1] if stack else None
+
+    if instrumentation is None:
+        if parent is None:
+            yield None
+            return
+        instrumentation = parent.instrumentation
+        index_name = index_name or parent.event.index_name
+
+    event = OperationEvent(
+        name,
+        index_name or "",
+        parent=None if parent is None else parent.event.operation,
+    )
+    token = _active.set((*stack, _ActiveOperation(event, instrumentation)))
+    start = time.perf_counter()
+    try:
+        yield event
+    except BaseException as e:
+        event.error = repr(e)
+        raise
+    finally:
+        event.duration = time.perf_counter() - start
+        _active.reset(token)
+        instrumentation.emit(event)
+
+
+def instrumented(name: str) -> Callable:
+    """Measure every call of a method of an index with an `instrumentation`.
+
+    A call made during another measured operation of the same index, e.g.
+    `acreate` called by `create`, is counted by that operation only.
+
+    Args:
+        name (str): Operation name.
+
+    Returns:
+        Callable: Decorator of a synchronous or asynchronous method.
+    """
+
+    def should_measure(cls: "type[BaseIndex]") -> bool:
+        if cls.instrumentation is None:
+            return False
+        return not any(
+            active.event.index_name == cls.name for active in _active.get()
+        )
+
+    def decorator(method: Callable) -> Callable:
+        if inspect.iscoroutinefunction(method):
+
+            @functools.wraps(method)
+            async def async_wrapper(cls, *args, **kwargs):
+                if not should_measure(cls):
+                    return await method(cls, *args, **kwargs)
+                with operation(name, cls.name, cls.instrumentation):
+                    return await method(cls, *args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(cls, *args, **kwargs):
+            if not should_measure(cls):
+                return method(cls, *args, **kwargs)
+            with operation(name, cls.name, cls.instrumentation):
+                return method(cls, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def is_recording() -> bool:
+    """Whether an operation is measured in the current context."""
+    return bool(_active.get())
+
+
+def record_request(
+    bytes_sent: int, bytes_received: int, task_uid: Optional[int] = None
+) -> None:
+    """Count an HTTP request in the running operations.
+
+    Args:
+        bytes_sent (int): Size of the request body, in bytes.
+        bytes_received (int): Size of the response body, in bytes.
+        task_uid (Optional[int]): UID of the task enqueued by the request.
+    """
+    with _record_lock:
+        for active in _active.get():
+            active.event.counts.round_trips += 1
+            active.event.counts.bytes_sent += bytes_sent
+            active.event.counts.bytes_received += bytes_received
+            if task_uid is not None:
+                active.event.task_uids.append(task_uid)
+
+
+def record_documents(count: int) -> None:
+    """Count documents sent, deleted or found in the running operations.
+
+    Args:
+        count (int): Number of documents.
+    """
+    with _record_lock:
+        for active in _active.get():
+            active.event.counts.documents += count
@@ -2,10 +2,29 @@
 Django MeiliSearch management command to interact with MeiliSearch indexes.
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple, Optional, Type
+
+from alive_progress import config_handler
 from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connections
 
 from django_meilisearch import client
+from django_meilisearch.batching import IndexingResult
 from django_meilisearch.indexes import BaseIndex
+from django_meilisearch.outbox import OutboxWorker
+
+
+class ActionResult(NamedTuple):
+    """
+    Result of an action performed on an index.
+    """
+
+    index_name: str
+    succeeded: bool
+    elapsed: float
 
 
 class Command(BaseCommand):
@@ -26,9 +45,14 @@ class Command(BaseCommand):
         "populate",
         "clean",
         "rebuild",
+        "sync",
+        "worker",
     ]
 
-    current_indexes = [index.uid for index in client.get_indexes()["results"]]
+    current_indexes: list[str] = []
+
+    _local = threading.local()
+    _output_lock = threading.Lock()
 
     def add_arguments(self, parser):
         """
@@ -47,6 +71,49 @@ class Command(BaseCommand):
             action="store_true",
             help="Confirm before executing the action",
         )
+        parser.add_argument(
+            "--parallel",
+            "-p",
+            type=int,
+            default=1,
+            metavar="N",
+            help=(
+                "Number of indexes processed at the same time, without the"
+                " progress bars, each index reporting the start and end of"
+                " its action instead"
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10_000,
+            metavar="N",
+            help="Number of outbox changes sent at a time by the worker",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=10,
+            metavar="N",
+            help="Number of attempts of an outbox change by the worker",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            metavar="SECONDS",
+            help="Time the worker waits for new changes once drained",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Stop the worker once the outbox is drained",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database of the outbox drained by the worker",
+        )
 
     def acreate(self, index_name: str, index_cls: type) -> None:
         """
@@ -77,6 +144,7 @@ class Command(BaseCommand):
             return
 
         task = index_cls.create()
+        self._wait_stats(index_cls)
         if task.status == "failed":
             self.error(f'Failed to create index: "{index_name}"')
             self.error(f"Error: {task.details}")
@@ -99,6 +167,7 @@ class Command(BaseCommand):
             return
 
         tasks = index_cls.apopulate()
+        self._settings_changes(tasks)
         count = sum(task.details["receivedDocuments"] for task in tasks)
         self.success(f'Document being populated: "{index_name}"')
         self.success(f"Documents being indexed: {count}")
@@ -117,6 +186,9 @@ class Command(BaseCommand):
             return
 
         tasks = index_cls.populate()
+        self._settings_changes(tasks)
+        self._batch_stats(tasks)
+        self._wait_stats(index_cls)
         count = sum(task.details["indexedDocuments"] for task in tasks)
 
         if all(task.status == "succeeded" for task in tasks):
@@ -129,6 +201,47 @@ class Command(BaseCommand):
                 self.error(f'Failed to populate index: "{index_name}"')
                 self.error(f"Error: {task.details}")
 
+    def sync(self, index_name: str, index_cls: Type[BaseIndex]) -> None:
+        """
+        Synchronous method to upload the rows changed since the last sync of
+        an index and delete the documents of the deleted rows.
+
+        Args:
+            index_name (str): Index name.
+            index_cls (Type[BaseIndex]): Index class
+        """
+        if index_cls.name not in self.current_indexes:
+            self.error(f'Index does not exist: "{index_name}"')
+            return
+
+        if index_cls.watermark_field is None:
+            self.error(f'Index has no watermark field: "{index_name}"')
+            return
+
+        since = index_cls.get_watermark()
+        tasks = index_cls.sync()
+        self._settings_changes(tasks)
+        self._batch_stats(tasks)
+        self._wait_stats(index_cls)
+        indexed = sum(
+            task.details.get("indexedDocuments") or 0 for task in tasks
+        )
+        deleted = sum(
+            task.details.get("deletedDocuments") or 0 for task in tasks
+        )
+
+        if all(task.status == "succeeded" for task in tasks):
+            self.success(f'Index synced successfully: "{index_name}"')
+            self.info(f"Changed since: {since or 'never synced'}")
+            self.success(f"Documents indexed: {indexed}")
+            self.success(f"Documents deleted: {deleted}")
+            return
+
+        for task in tasks:
+            if task.status != "succeeded":
+                self.error(f'Failed to sync index: "{index_name}"')
+                self.error(f"Error: {task.details}")
+
     def adestroy(self, index_name: str, index_cls: type) -> None:
         """
         Asynchronous method to destroy an index.
@@ -151,6 +264,7 @@ class Command(BaseCommand):
             return
 
         task = index_cls.destroy()
+        self._wait_stats(index_cls)
 
         if task.status == "failed":
             self.error(f'Failed to destroy index: "{index_name}"')
@@ -161,9 +275,9 @@ class Command(BaseCommand):
             self.info(f'Index destroying status: "{task.status}"')
             self.info(f"Details: {task.details}")
 
-    def aclear(self, index_name: str, index_cls: type) -> None:
+    def aclean(self, index_name: str, index_cls: type) -> None:
         """
-        Asynchronous method to clear an index.
+        Asynchronous method to clean an index.
 
         Args:
             index_name (str): Index name.
@@ -177,9 +291,9 @@ class Command(BaseCommand):
         self.success(f'Index cleared: "{index_name}"')
         self.info(f"Task ID: {task.uid}")
 
-    def clear(self, index_name: str, index_cls: type) -> None:
+    def clean(self, index_name: str, index_cls: type) -> None:
         """
-        Synchronous method to clear an index.
+        Synchronous method to clean an index.
 
         Args:
             index_name (str): Index name.
@@ -190,6 +304,7 @@ class Command(BaseCommand):
             return
 
         task = index_cls.clean()
+        self._wait_stats(index_cls)
         count = task.details["deletedDocuments"]
 
         if task.status == "failed":
@@ -202,69 +317,182 @@ class Command(BaseCommand):
             self.info(f'Index destroying status: "{task.status}"')
             self.info(f"Details: {task.details}")
 
-    def arebuild(self, index_name: str, index_cls: type) -> None:
+    def arebuild(self, index_name: str, index_cls: Type[BaseIndex]) -> None:
         """
-        Asynchronous method to rebuild an index.
+        Asynchronous method to rebuild an index through a shadow index.
 
         Args:
             index_name (str): Index name.
-            index_cls (type): Index class
+            index_cls (Type[BaseIndex]): Index class
         """
         if index_cls.name not in self.current_indexes:
             self.error(f'Index does not exist: "{index_name}"')
             return
 
-        index_cls.aclean()
-        tasks = index_cls.apopulate()
+        tasks = index_cls.arebuild()
         count = sum(task.details["receivedDocuments"] for task in tasks)
 
         self.success(f'Index being rebuilt: "{index_name}"')
         self.success(f"Documents being reindexed: {count}")
         self.info(f"Task ID: {', '.join(str(task.uid) for task in tasks)}")
 
-    def rebuild(self, index_name: str, index_cls: type) -> None:
+    def rebuild(self, index_name: str, index_cls: Type[BaseIndex]) -> None:
         """
-        Synchronous method to rebuild an index.
+        Synchronous method to rebuild an index through a shadow index.
 
         Args:
             index_name (str): Index name.
-            index_cls (type): Index class
+            index_cls (Type[BaseIndex]): Index class
         """
         if index_cls.name not in self.current_indexes:
             self.error(f'Index does not exist: "{index_name}"')
             return
 
-        index_cls.clean()
-        tasks = index_cls.populate()
+        tasks = index_cls.rebuild()
+        self._batch_stats(tasks)
+        self._wait_stats(index_cls)
         count = sum(task.details["indexedDocuments"] for task in tasks)
 
         if all(task.status == "succeeded" for task in tasks):
-            self.success(f'Index populated successfully: "{index_name}"')
+            self.success(f'Index rebuilt successfully: "{index_name}"')
             self.success(f"Documents indexed: {count}")
             return
 
         for task in tasks:
             if task.status != "succeeded":
-                self.error(f'Failed to populate index: "{index_name}"')
+                self.error(f'Failed to rebuild index: "{index_name}"')
                 self.error(f"Error: {task.details}")
 
+    # pylint: disable=too-many-arguments
+    def worker(
+        self,
+        index_classes,
+        *,
+        batch_size: int,
+        max_attempts: int,
+        interval: float,
+        once: bool,
+        database: str,
+    ) -> None:
+        """
+        Send the changes of the outbox to Meilisearch until interrupted, or
+        until the outbox is drained with `once`.
+
+        Args:
+            index_classes (Optional[list[type]]): Index classes whose changes
+            are sent, `None` for every index.
+            batch_size (int): Number of changes sent at a time.
+            max_attempts (int): Number of attempts of a change.
+            interval (float): Time waited for new changes once drained.
+            once (bool): Stop once the outbox is drained.
+            database (str): Database of the outbox.
+        """
+        worker = OutboxWorker(
+            index_classes,
+            batch_size=batch_size,
+            max_attempts=max_attempts,
+            using=database,
+        )
+        sent = failed = 0
+
+        self.info("Outbox worker started")
+        given_up = worker.given_up().count()
+        if given_up:
+            self.error(
+                f"Changes given up after {max_attempts} attempts: {given_up}"
+            )
+        try:
+            while True:
+                close_old_connections()
+                stats = worker.drain()
+                sent += stats.sent
+                failed += stats.failed
+                if stats.sent:
+                    self.success(f"Changes sent: {stats.sent}")
+                if stats.failed:
+                    self.error(f"Changes failed: {stats.failed}")
+                if stats.given_up:
+                    self.error(f"Changes given up: {stats.given_up}")
+
+                if stats.drained:
+                    if once:
+                        break
+                    time.sleep(interval)
+        except KeyboardInterrupt:
+            self.info("Outbox worker stopped")
+
+        self.info(f"Sent {sent} change(s) with {failed} failed attempt(s)")
+
     def handle(self, *args, **kwargs):
         """
         Command handler function to perform the action on the indexes.
         """
 
         action = kwargs.get("action")
-        indexes = kwargs.get("indexes")
-        confirm = kwargs.get("yes")
-
         if action not in self.ACTION_CHOICES:
             self.error(f'Invalid action: "{action}"')
             return
 
-        if not indexes:
-            indexes = BaseIndex.INDEX_NAMES.keys()
+        selected_indexes = self._select_indexes(
+            action, kwargs.get("indexes"), bool(kwargs.get("yes"))
+        )
+
+        if action == "worker":
+            # Without index names, the changes of the indexes which no
+            # longer exist are dropped too.
+            index_classes = None
+            if kwargs.get("indexes"):
+                if not selected_indexes:
+                    return
+                index_classes = [
+                    index_cls for _, index_cls in selected_indexes
+                ]
+
+            self.worker(
+                index_classes,
+                batch_size=kwargs.get("batch_size", 10_000),
+                max_attempts=kwargs.get("max_attempts", 10),
+                interval=kwargs.get("interval", 1.0),
+                once=bool(kwargs.get("once")),
+                database=kwargs.get("database", DEFAULT_DB_ALIAS),
+            )
+            return
+
+        if selected_indexes:
+            self.current_indexes = self._get_current_indexes()
+
+        parallel = kwargs.get("parallel") or 1
+        if parallel > 1 and len(selected_indexes) > 1:
+            results = self._run_parallel_actions(
+                action, selected_indexes, parallel
+            )
+        else:
+            results = [
+                self._run_action(action, index_name, index_cls)
+                for index_name, index_cls in selected_indexes
+            ]
+
+        if len(results) > 1:
+            self._summary(action, results)
+
+    def _select_indexes(
+        self, action: str, indexes: Optional[list[str]], confirm: bool
+    ) -> list[tuple[str, type]]:
+        """
+        Find the indexes of the action, asking to confirm each of them
+        unless `confirm` is set.
+
+        Args:
+            action (str): Action name.
+            indexes (Optional[list[str]]): Index names or class paths,
+            every index when empty.
+            confirm (bool): Skip the confirmations.
 
-        for index in indexes:
+        Returns:
+            list[tuple[str, type]]: Names and classes of the indexes.
+        """
+        selected_indexes = []
+        for index in indexes or BaseIndex.INDEX_NAMES.keys():
             if (
                 index not in BaseIndex.REGISTERED_INDEXES
                 and index not in BaseIndex.INDEX_NAMES
@@ -275,7 +503,7 @@ class Command(BaseCommand):
             index_name = BaseIndex.INDEX_NAMES.get(index, index)
             index_cls = BaseIndex.REGISTERED_INDEXES[index_name]
 
-            if not confirm:
+            if not confirm and action != "worker":
                 self.question(
                     f"Are you sure you want to perform the action"
                     f' "{action}" on index "{index_name}"? (y/n):'
@@ -287,20 +515,212 @@ class Command(BaseCommand):
                     )
                     continue
 
+            selected_indexes.append((index_name, index_cls))
+        return selected_indexes
+
+    def _run_parallel_actions(
+        self,
+        action: str,
+        selected_indexes: list[tuple[str, type]],
+        parallel: int,
+    ) -> list[ActionResult]:
+        """
+        Perform an action on up to `parallel` indexes at the same time. The
+        progress bars of concurrent actions would overwrite each other, so
+        they are disabled and the actions report their start and end
+        instead.
+
+        Args:
+            action (str): Action name.
+            selected_indexes (list[tuple[str, type]]): Names and classes of
+            the indexes.
+            parallel (int): Number of indexes processed at the same time.
+
+        Returns:
+            list[ActionResult]: Results of the action, in the order of the
+            indexes.
+        """
+        config_handler.set_global(disable=True)
+        try:
+            with ThreadPoolExecutor(max_workers=parallel) as executor:
+                return list(
+                    executor.map(
+                        lambda selected: self._run_parallel_action(
+                            action, *selected
+                        ),
+                        selected_indexes,
+                    )
+                )
+        finally:
+            config_handler.reset()
+
+    def _get_current_indexes(self) -> list[str]:
+        """
+        Get the names of the indexes existing in Meilisearch.
+
+        Returns:
+            list[str]: Index names.
+        """
+        names: list[str] = []
+        offset = 0
+        while True:
+            page: dict[str, Any] = client.get_indexes(
+                {"offset": offset, "limit": 100}
+            )
+            names.extend(index.uid for index in page["results"])
+            offset += len(page["results"])
+            if not page["results"] or offset >= page["total"]:
+                return names
+
+    def _run_action(
+        self, action: str, index_name: str, index_cls: type
+    ) -> ActionResult:
+        """
+        Perform an action on an index, reporting its exceptions as errors
+        so they do not abort the action on the other indexes.
+
+        Args:
+            action (str): Action name.
+            index_name (str): Index name.
+            index_cls (type): Index class
+
+        Returns:
+            ActionResult: Result of the action.
+        """
+        self._local.errors = 0
+        start = time.monotonic()
+
+        try:
             action_method = getattr(self, action)
             action_method(index_name, index_cls)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.error(
+                f'Action failed: "{action}" on index "{index_name}": {e!r}'
+            )
+
+        return ActionResult(
+            index_name, self._local.errors == 0, time.monotonic() - start
+        )
+
+    def _run_parallel_action(
+        self, action: str, index_name: str, index_cls: type
+    ) -> ActionResult:
+        """
+        Perform an action on an index from a worker thread, prefixing its
+        messages with the index name.
+
+        Args:
+            action (str): Action name.
+            index_name (str): Index name.
+            index_cls (type): Index class
+
+        Returns:
+            ActionResult: Result of the action.
+        """
+        self._local.prefix = f"({index_name}) "
+        try:
+            self.info(f'Action started: "{action}"')
+            result = self._run_action(action, index_name, index_cls)
+            self.info(f'Action finished in {result.elapsed:.2f}s: "{action}"')
+            return result
+        finally:
+            connections.close_all()
+
+    def _summary(self, action: str, results: list[ActionResult]) -> None:
+        """
+        Report the results of an action performed on several indexes.
+
+        Args:
+            action (str): Action name.
+            results (list[ActionResult]): Results of the action.
+        """
+        width = max(len(result.index_name) for result in results)
+        failed = sum(not result.succeeded for result in results)
+
+        self.info(f'Summary of the action "{action}":')
+        for result in results:
+            status = "succeeded" if result.succeeded else "failed"
+            self.info(
+                f"  {result.index_name:<{width}}  {status:<9}"
+                f"  {result.elapsed:.2f}s"
+            )
+
+        if failed:
+            self.error(f"Action failed on {failed} of {len(results)} indexes")
+        else:
+            self.success(f"Action succeeded on {len(results)} indexes")
+
+    def _wait_stats(self, index_cls: Type[BaseIndex]) -> None:
+        """
+        Report the statistics of the last task wait of an index, read from
+        its own waiter, so the indexes processed in parallel do not report
+        the waits of each other.
+
+        Args:
+            index_cls (Type[BaseIndex]): Index class
+        """
+        stats = index_cls.task_waiter.last_stats
+        if stats is None:
+            return
+
+        self.info(
+            f"Waited {stats.elapsed:.2f}s for {len(stats.task_uids)}"
+            f" task(s) with {stats.polls} poll(s)"
+        )
+
+    def _batch_stats(self, result: IndexingResult) -> None:
+        """
+        Report the sizes of the batches uploaded by a populate.
+
+        Args:
+            result (IndexingResult): Result of the populate
+        """
+        sizes = [batch.size for batch in result.batches]
+        if not sizes:
+            return
+
+        self.info(
+            f"Uploaded {len(sizes)} batch(es) of {min(sizes)} to"
+            f" {max(sizes)} document(s)"
+        )
+
+    def _settings_changes(self, result: IndexingResult) -> None:
+        """
+        Report the settings updated by a populate.
+
+        Args:
+            result (IndexingResult): Result of the populate
+        """
+        if not result.settings_changes:
+            self.info("Settings unchanged")
+            return
+
+        for key, change in result.settings_changes.items():
+            self.info(
+                f"Setting updated: {key} {change['old']} -> {change['new']}"
+            )
+
+    def write(self, message, style_func=None, ending=None):
+        """Write a message, prefixed with the index name in worker threads"""
+        prefix = getattr(self._local, "prefix", "")
+        with self._output_lock:
+            self.stdout.write(
+                f"{prefix}{message}", style_func=style_func, ending=ending
+            )
 
     def error(self, message):
         """Error message styling"""
-        self.stdout.write(self.style.ERROR(f"[ERROR]:   {message}"))
+        if hasattr(self._local, "errors"):
+            self._local.errors += 1
+        self.write(self.style.ERROR(f"[ERROR]:   {message}"))
 
     def success(self, message):
         """Success message styling"""
-        self.stdout.write(self.style.SUCCESS(f"[SUCCESS]: {message}"))
+        self.write(self.style.SUCCESS(f"[SUCCESS]: {message}"))
 
     def info(self, message):
         """Info message styling"""
-        self.stdout.write(f"[INFO]:    {message}")
+        self.write(f"[INFO]:    {message}")
 
     def question(self, message):
         """Question message styling"""
@@ -4,10 +4,14 @@ This module defines the Document metaclass that is used to create the Document c
 The Document class is used to define the structure of the index that will be created in MeiliSearch.
 """
 
-from typing import Type
-from weakref import WeakValueDictionary
+import os
+import weakref
+from functools import partial
+from typing import Any, Iterator, Type
+from weakref import WeakKeyDictionary, WeakValueDictionary
 
-from django.db.models import Model, signals, DateTimeField
+from django.db import transaction
+from django.db.models import Model, QuerySet, signals, DateTimeField
 from rest_framework.serializers import ModelSerializer
 
 from django_meilisearch.exceptions import (
@@ -15,14 +19,17 @@ from django_meilisearch.exceptions import (
     InvalidIndexNameError,
     MissingRequiredFieldError,
 )
+from django_meilisearch.fields import DocumentFields
+from django_meilisearch.changes import ADD, REMOVE, record_changes
 from django_meilisearch.utils import exists_field_in_namespace
 from django_meilisearch.validators import (
     validate_filterable_fields,
     validate_primary_key_field,
     validate_searchable_fields,
     validate_sortable_fields,
+    validate_watermark_field,
 )
-from django_meilisearch.serializers import TimestampField
+from django_meilisearch.serializers import CompiledSerializer, TimestampField
 
 
 class BaseIndexMetaclass(type):
@@ -38,120 +45,534 @@ class BaseIndexMetaclass(type):
     REGISTERED_INDEXES: dict[str, Type] = WeakValueDictionary()
     INDEX_NAMES: dict[str, str] = {}
 
-    # pylint: disable=unused-argument
+    # Labels of the indexes of each model, updated on registration.
+    MODEL_INDEXES: dict[Type[Model], list[str]] = {}
+
+    # Labels of the indexes of each model sending signals, including the
+    # indexes of the models it is a proxy or a child of, resolved on its
+    # first signal and cleared on registration.
+    DISPATCH_TABLE: dict[Type[Model], tuple[str, ...]] = {}
+
+    # Identifiers of the single receiver of each signal for each indexed
+    # model, and for each related model.
+    DISPATCH_UID = "django_meilisearch"
+    RELATED_DISPATCH_UID = "django_meilisearch.related"
+
+    # Primary keys of the rows deleted by each `QuerySet.delete` call, by
+    # index, removed in batches when the deletion is committed.
+    BULK_REMOVALS: WeakKeyDictionary = WeakKeyDictionary()
+
+    # Labels of the indexes whose documents read each related model, or
+    # each intermediate model of a many-to-many relation.
+    DEPENDENCIES: dict[Type[Model], set[str]] = {}
+
+    # Primary keys of the documents reading the rows deleted by each
+    # deletion, by index, reindexed when the deletion is committed. The
+    # deletions are keyed by the model and primary key of the deleted
+    # instance, or by the `QuerySet.delete` call, and dropped with it.
+    DEPENDENT_REINDEXES: dict[tuple[Type[Model], Any], dict] = {}
+
     @staticmethod
-    def post_save_handler(sender, instance, **kwargs):
+    def reset_index_handles():
         """
-        The post_save signal handler that adds the document to the index.
+        Drop the Meilisearch index objects of the indexes, which are built
+        again with the client of the process on their next use.
         """
         for index in BaseIndexMetaclass.REGISTERED_INDEXES.values():
-            if isinstance(instance, index.model):
+            index.reset_index_handle()
+
+    @staticmethod
+    def model_indexes(sender: Type[Model]) -> Iterator[Type]:
+        """
+        The registered indexes of a model, or of the models it is a proxy or
+        a child of, looked up in the dispatch table.
+        """
+        table = BaseIndexMetaclass.DISPATCH_TABLE
+        labels = table.get(sender)
+        if labels is None:
+            labels = table[sender] = tuple(
+                label
+                for model in sender.__mro__
+                for label in BaseIndexMetaclass.MODEL_INDEXES.get(model, ())
+            )
+
+        for label in labels:
+            index = BaseIndexMetaclass.REGISTERED_INDEXES.get(label)
+            if index is not None:
+                yield index
+
+    @staticmethod
+    def model_senders(model: Type[Model]) -> list[Type[Model]]:
+        """
+        A model and the known models which are its proxies or children,
+        whose instances send their own signals.
+        """
+        senders = [model]
+        for sender in senders:
+            senders.extend(
+                subclass
+                for subclass in sender.__subclasses__()
+                if subclass not in senders
+            )
+        return senders
+
+    @staticmethod
+    def connect_model(model: Type[Model]) -> None:
+        """
+        Connect the save and delete receivers to a model and its proxies and
+        children, once per model.
+        """
+        mcs = BaseIndexMetaclass
+        for sender in mcs.model_senders(model):
+            signals.post_save.connect(
+                mcs.post_save_handler,
+                sender=sender,
+                dispatch_uid=mcs.DISPATCH_UID,
+            )
+            signals.post_delete.connect(
+                mcs.post_delete_handler,
+                sender=sender,
+                dispatch_uid=mcs.DISPATCH_UID,
+            )
+
+    # pylint: disable=unused-argument
+    @staticmethod
+    def class_prepared_handler(sender, **kwargs):
+        """
+        The class_prepared signal handler that connects the receivers to the
+        proxies and children of the indexed models defined after their
+        indexes.
+        """
+        mcs = BaseIndexMetaclass
+        mcs.DISPATCH_TABLE.pop(sender, None)
+        if any(model in mcs.MODEL_INDEXES for model in sender.__mro__[1:]):
+            mcs.connect_model(sender)
+
+    @staticmethod
+    def unregister(label: str, model: Type[Model]) -> None:
+        """
+        Remove an index label from the dispatch tables, and disconnect the
+        receivers of the models left without indexes.
+        """
+        mcs = BaseIndexMetaclass
+        labels = mcs.MODEL_INDEXES.get(model, [])
+        if label in labels:
+            labels.remove(label)
+        if not labels:
+            mcs.MODEL_INDEXES.pop(model, None)
+        for dependents in mcs.DEPENDENCIES.values():
+            dependents.discard(label)
+        mcs.DISPATCH_TABLE.clear()
+
+        for sender in mcs.model_senders(model):
+            if next(mcs.model_indexes(sender), None) is None:
+                signals.post_save.disconnect(
+                    sender=sender, dispatch_uid=mcs.DISPATCH_UID
+                )
+                signals.post_delete.disconnect(
+                    sender=sender, dispatch_uid=mcs.DISPATCH_UID
+                )
+
+    # pylint: disable=unused-argument
+    @staticmethod
+    def post_save_handler(
+        sender, instance, using, created=False, update_fields=None, **kwargs
+    ):
+        """
+        The post_save signal handler that adds the document to the index,
+        writes it to the outbox when the index uses one, or queues it when
+        the index has an indexing queue. A save with `update_fields` only
+        updates the attributes of the saved fields.
+        """
+        for index in BaseIndexMetaclass.model_indexes(sender):
+            if index.use_outbox:
+                record_changes(
+                    index,
+                    [getattr(instance, index.primary_key_field)],
+                    ADD,
+                    using,
+                )
+            elif index.indexing_queue is not None:
+                index.indexing_queue.add(index, instance, using)
+            elif update_fields and not created:
+                fields = index.get_changed_fields(update_fields)
+                if fields:
+                    index.aupdate_single_document(instance, fields)
+            else:
                 index.aadd_single_document(instance)
 
     # pylint: disable=unused-argument
     @staticmethod
-    def post_delete_handler(sender, instance, **kwargs):
+    def post_delete_handler(sender, instance, using, origin=None, **kwargs):
         """
-        The post_delete signal handler that removes the document from the index.
+        The post_delete signal handler that removes the document from the index,
+        writes the removal to the outbox when the index uses one, or queues it
+        when the index has an indexing queue. The rows deleted by a
+        `QuerySet.delete` call are removed in batches once the deletion is
+        committed.
         """
-        for index in BaseIndexMetaclass.REGISTERED_INDEXES.values():
-            if isinstance(instance, index.model):
+        for index in BaseIndexMetaclass.model_indexes(sender):
+            if index.use_outbox:
+                record_changes(
+                    index,
+                    [getattr(instance, index.primary_key_field)],
+                    REMOVE,
+                    using,
+                )
+            elif index.indexing_queue is not None:
+                index.indexing_queue.remove(index, instance, using)
+            elif isinstance(origin, QuerySet):
+                BaseIndexMetaclass.bulk_remove(index, instance, origin, using)
+            else:
                 index.aremove_single_document(instance)
 
-    # pylint: disable=too-many-locals
-    def __new__(mcs, name: str, bases: tuple, namespace: dict):
+    @staticmethod
+    def bulk_remove(index, instance, origin, using):
         """
-        The new method of the metaclass that validates the fields of the class.
+        Collect the primary key of a row deleted by a `QuerySet.delete` call.
+        A single `aremove_documents` call per index removes the collected rows
+        when the transaction of the deletion is committed.
         """
-        if name != "BaseIndex":
-            if any(
-                not exists_field_in_namespace(field, namespace)
-                for field in BaseIndexMetaclass.__REQUIRED_FIELDS__
-            ):
-                raise MissingRequiredFieldError(
-                    f"{name} must have at least {BaseIndexMetaclass.__REQUIRED_FIELDS__} fields"
-                )
+        removals = BaseIndexMetaclass.BULK_REMOVALS.setdefault(origin, {})
+        keys = removals.get(index)
+        if keys is None:
+            keys = removals[index] = []
+            transaction.on_commit(
+                partial(index.aremove_documents, keys), using=using
+            )
+        keys.append(getattr(instance, index.primary_key_field))
 
-            model = namespace["model"]
+    @staticmethod
+    def dependent_indexes(sender: Type[Model]) -> Iterator[Type]:
+        """
+        The registered indexes whose documents read the rows of a model.
+        """
+        for label in tuple(BaseIndexMetaclass.DEPENDENCIES.get(sender, ())):
+            index = BaseIndexMetaclass.REGISTERED_INDEXES.get(label)
+            if index is not None:
+                yield index
 
-            if not isinstance(namespace["name"], str):
-                raise InvalidIndexNameError(f"{name}.name must be a string")
+    @staticmethod
+    def reindex_dependents(index, keys, using: str) -> None:
+        """
+        Reindex the documents reading changed rows once the change is
+        committed, or write them to the outbox when the index uses one.
+        """
+        if not keys:
+            return
 
-            if not issubclass(model, Model):
-                raise InvalidDjangoModelError(
-                    f"{name}.model must be a Django Model"
-                )
+        if index.use_outbox:
+            record_changes(index, keys, ADD, using)
+        else:
+            transaction.on_commit(
+                partial(index.areindex_documents, keys), using=using
+            )
 
-            model_field_names = [field.name for field in model._meta.fields]
+    @staticmethod
+    def deletion_reindexes(deletion: Any) -> dict:
+        """
+        The primary keys of the documents to reindex after a deletion, by
+        index. The deletion of an instance is keyed by its model and primary
+        key, so the instances of a row share their reindexes, and the entry
+        is dropped when the deleted instance or queryset is collected.
+        """
+        if isinstance(deletion, Model):
+            key = (type(deletion), deletion.pk)
+        else:
+            key = (deletion.model, id(deletion))
 
-            searchable_fields = namespace.get("searchable_fields")
-            if not searchable_fields or searchable_fields == "__all__":
-                searchable_fields = model_field_names
+        table = BaseIndexMetaclass.DEPENDENT_REINDEXES
+        reindexes = table.get(key)
+        if reindexes is None:
+            reindexes = table[key] = {}
+            weakref.finalize(deletion, table.pop, key, None)
+        return reindexes
 
-            filterable_fields = namespace.get("filterable_fields")
-            if not filterable_fields or filterable_fields == "__all__":
-                filterable_fields = model_field_names
+    # pylint: disable=unused-argument
+    @staticmethod
+    def related_save_handler(sender, instance, using, **kwargs):
+        """
+        The post_save signal handler of the related models, which reindexes
+        the documents reading the saved row once the save is committed. The
+        documents are found with a single query.
+        """
+        for index in BaseIndexMetaclass.dependent_indexes(sender):
+            BaseIndexMetaclass.reindex_dependents(
+                index, index.get_dependent_keys(sender, [instance.pk]), using
+            )
+
+    # pylint: disable=unused-argument
+    @staticmethod
+    def related_delete_handler(sender, instance, using, origin=None, **kwargs):
+        """
+        The pre_delete signal handler of the related models, which finds the
+        documents reading the deleted row while it still exists. The rows
+        deleted by a `QuerySet.delete` call of the related model are looked
+        up with a single query, and the documents of a deletion are
+        reindexed once, when it is committed.
+        """
+        whole = isinstance(origin, QuerySet) and origin.model is sender
+        deletion = instance if origin is None else origin
 
-            sortable_fields = namespace.get("sortable_fields")
-            if not sortable_fields or sortable_fields == "__all__":
-                sortable_fields = model_field_names
+        for index in BaseIndexMetaclass.dependent_indexes(sender):
+            reindexes = BaseIndexMetaclass.deletion_reindexes(deletion)
+            keys = reindexes.get(index)
+            if keys is not None and whole:
+                continue
 
-            primary_key_field = namespace.get(
-                "primary_key_field", model._meta.pk.name
+            if keys is None:
+                keys = reindexes[index] = set()
+
+            found = index.get_dependent_keys(
+                sender, origin if whole else [instance.pk]
             )
+            if index.use_outbox:
+                record_changes(index, set(found) - keys, ADD, using)
+            elif found and not keys:
+                transaction.on_commit(
+                    partial(index.areindex_documents, keys), using=using
+                )
+            keys.update(found)
 
-            validate_primary_key_field(model, primary_key_field)
-            validate_searchable_fields(model, searchable_fields)
-            validate_filterable_fields(model, filterable_fields)
-            validate_sortable_fields(model, sortable_fields)
+    # pylint: disable=unused-argument,too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    @staticmethod
+    def related_m2m_handler(
+        sender, instance, action, model, pk_set, using, **kwargs
+    ):
+        """
+        The m2m_changed signal handler of the intermediate models, which
+        reindexes the documents reading the rows of the side of the changed
+        relations nearer to the index model, once the change is committed.
+        The relations cleared from a row are looked up before they are
+        removed.
+        """
+        if action not in ("post_add", "post_remove", "pre_clear"):
+            return
 
-            signals.post_save.connect(mcs.post_save_handler, sender=model)
-            signals.post_delete.connect(mcs.post_delete_handler, sender=model)
+        for index in BaseIndexMetaclass.dependent_indexes(sender):
+            near = index.document_fields.through_models[sender]
+            if isinstance(instance, near):
+                keys = index.get_dependent_keys(near, [instance.pk])
+            elif pk_set:
+                keys = index.get_dependent_keys(near, pk_set)
+            else:
+                keys = index.get_dependent_keys(type(instance), [instance.pk])
 
-            cls = super().__new__(mcs, name, bases, namespace)
+            BaseIndexMetaclass.reindex_dependents(index, keys, using)
 
-            cls.primary_key_field = primary_key_field
-            cls.searchable_fields = searchable_fields
-            cls.filterable_fields = filterable_fields
-            cls.sortable_fields = sortable_fields
+    def __new__(mcs, name: str, bases: tuple, namespace: dict):
+        """
+        The new method of the metaclass that validates the fields of the class.
+        """
+        if name == "BaseIndex":
+            return super().__new__(mcs, name, bases, namespace)
 
-            Meta = type(
-                "Meta",
-                (),
-                {"model": model, "fields": model_field_names},
-            )
+        validate_namespace(name, namespace)
 
-            datetime_fields = {}
-            if bool(namespace.get("use_timestamp")):
-                for field_name in model_field_names:
-                    field_class = getattr(model, field_name)
-                    if isinstance(field_class.field, DateTimeField):
-                        datetime_fields[field_name] = TimestampField()
-
-            cls.serializer = type(
-                f"{name}Serializer",
-                (ModelSerializer,),
-                {"Meta": Meta, **datetime_fields},
-            )
+        model = namespace["model"]
+        document_fields = DocumentFields(
+            model,
+            namespace.get("related_fields") or [],
+            namespace.get("computed_fields"),
+            bool(namespace.get("use_timestamp")),
+        )
+        fields = index_fields(model, namespace, document_fields)
+        namespace["_index_handle"] = None
+        namespace["_partial_serializers"] = {}
+        index_label = f"{model._meta.app_label}.{namespace['__qualname__']}"
+        namespace["_index_label"] = index_label
 
-            index_label = f"{namespace['model']._meta.app_label}.{namespace['__qualname__']}"
-            mcs.REGISTERED_INDEXES[index_label] = cls
-            mcs.INDEX_NAMES[namespace["name"]] = index_label
-            return cls
+        cls = super().__new__(mcs, name, bases, namespace)
+        setup_index(cls, name, namespace, document_fields, fields)
 
-        return super().__new__(mcs, name, bases, namespace)
+        mcs.register(cls, index_label)
+        mcs.connect_dependencies(index_label, document_fields)
+        return cls
+
+    @staticmethod
+    def register(index, index_label: str) -> None:
+        """
+        Register an index by its label and name, replacing a previous index
+        of the same label, and connect the signal receivers of its model.
+        """
+        mcs = BaseIndexMetaclass
+        previous = mcs.REGISTERED_INDEXES.get(index_label)
+        if previous is not None and previous.model is not index.model:
+            mcs.unregister(index_label, previous.model)
+
+        mcs.REGISTERED_INDEXES[index_label] = index
+        mcs.INDEX_NAMES[index.name] = index_label
+
+        labels = mcs.MODEL_INDEXES.setdefault(index.model, [])
+        if index_label not in labels:
+            labels.append(index_label)
+        mcs.DISPATCH_TABLE.clear()
+        mcs.connect_model(index.model)
+
+    @staticmethod
+    def connect_dependencies(
+        index_label: str, document_fields: DocumentFields
+    ) -> None:
+        """
+        Connect the signal receivers of the related models and intermediate
+        models read by the documents of an index.
+        """
+        mcs = BaseIndexMetaclass
+        for related_model in document_fields.dependencies:
+            mcs.DEPENDENCIES.setdefault(related_model, set()).add(index_label)
+            signals.post_save.connect(
+                mcs.related_save_handler,
+                sender=related_model,
+                dispatch_uid=mcs.RELATED_DISPATCH_UID,
+            )
+            signals.pre_delete.connect(
+                mcs.related_delete_handler,
+                sender=related_model,
+                dispatch_uid=mcs.RELATED_DISPATCH_UID,
+            )
+        for through in document_fields.through_models:
+            mcs.DEPENDENCIES.setdefault(through, set()).add(index_label)
+            signals.m2m_changed.connect(
+                mcs.related_m2m_handler,
+                sender=through,
+                dispatch_uid=mcs.RELATED_DISPATCH_UID,
+            )
 
     def __del__(cls):
         """
-        The delete method of the metaclass that removes the signal handlers.
+        The delete method of the metaclass that removes the index from the
+        dispatch tables, unless another index was registered with its label.
         """
+        label = cls.__dict__.get("_index_label")
+        if label is None or label in BaseIndexMetaclass.REGISTERED_INDEXES:
+            return
+
+        BaseIndexMetaclass.unregister(label, cls.model)
+
+        if BaseIndexMetaclass.INDEX_NAMES.get(cls.name) == label:
+            del BaseIndexMetaclass.INDEX_NAMES[cls.name]
+
 
-        signals.post_save.disconnect(
-            BaseIndexMetaclass.post_save_handler, sender=cls.model
+def validate_namespace(name: str, namespace: dict) -> None:
+    """
+    Validate the required fields of an index class.
+    """
+    if any(
+        not exists_field_in_namespace(field, namespace)
+        for field in BaseIndexMetaclass.__REQUIRED_FIELDS__
+    ):
+        raise MissingRequiredFieldError(
+            f"{name} must have at least {BaseIndexMetaclass.__REQUIRED_FIELDS__} fields"
         )
-        signals.post_delete.disconnect(
-            BaseIndexMetaclass.post_delete_handler, sender=cls.model
+
+    if not isinstance(namespace["name"], str):
+        raise InvalidIndexNameError(f"{name}.name must be a string")
+
+    if not issubclass(namespace["model"], Model):
+        raise InvalidDjangoModelError(f"{name}.model must be a Django Model")
+
+
+def index_fields(
+    model: Type[Model], namespace: dict, document_fields: DocumentFields
+) -> dict[str, Any]:
+    """
+    Resolve and validate the primary key, searchable, filterable and
+    sortable fields of an index class. The fields not set, or set to
+    `__all__`, default to all the fields of the documents.
+    """
+    field_names = [
+        field.name for field in model._meta.fields
+    ] + document_fields.names
+
+    fields = {
+        "primary_key_field": namespace.get(
+            "primary_key_field", model._meta.pk.name
         )
+    }
+    for attribute in (
+        "searchable_fields",
+        "filterable_fields",
+        "sortable_fields",
+    ):
+        value = namespace.get(attribute)
+        if not value or value == "__all__":
+            value = field_names
+        fields[attribute] = value
 
-        if cls.name in BaseIndexMetaclass.INDEX_NAMES:
-            del BaseIndexMetaclass.INDEX_NAMES[cls.name]
+    # The related and computed fields are not model attributes.
+    def model_fields(attribute):
+        value = fields[attribute]
+        if not isinstance(value, list):
+            return value
+        return [field for field in value if field not in document_fields.names]
+
+    validate_primary_key_field(model, fields["primary_key_field"])
+    validate_searchable_fields(model, model_fields("searchable_fields"))
+    validate_filterable_fields(model, model_fields("filterable_fields"))
+    validate_sortable_fields(model, model_fields("sortable_fields"))
+    validate_watermark_field(model, namespace.get("watermark_field"))
+    return fields
+
+
+def setup_index(
+    index,
+    name: str,
+    namespace: dict,
+    document_fields: DocumentFields,
+    fields: dict[str, Any],
+) -> None:
+    """
+    Set the resolved fields, the serializers and the task waiter of a new
+    index class.
+    """
+    model = namespace["model"]
+    for attribute, value in fields.items():
+        setattr(index, attribute, value)
+
+    model_field_names = [field.name for field in model._meta.fields]
+    Meta = type(
+        "Meta",
+        (),
+        {"model": model, "fields": model_field_names + document_fields.names},
+    )
+
+    datetime_fields = {}
+    if bool(namespace.get("use_timestamp")):
+        for field_name in model_field_names:
+            field_class = getattr(model, field_name)
+            if isinstance(field_class.field, DateTimeField):
+                datetime_fields[field_name] = TimestampField()
+
+    index.serializer = type(
+        f"{name}Serializer",
+        (ModelSerializer,),
+        {
+            "Meta": Meta,
+            **datetime_fields,
+            **document_fields.serializer_fields,
+        },
+    )
+    index.document_fields = document_fields
+
+    # Each index waits with its own waiter, so the statistics of its waits
+    # are not mixed with the waits of the other indexes.
+    if "task_waiter" not in namespace:
+        index.task_waiter = index.task_waiter.copy()
+
+    index.compiled_serializer = None
+    if bool(namespace.get("use_compiled_serializer")):
+        index.compiled_serializer = CompiledSerializer(index.serializer)
+
+
+# The proxies and children of the indexed models defined after their indexes
+# get their receivers when they are prepared.
+signals.class_prepared.connect(
+    BaseIndexMetaclass.class_prepared_handler,
+    dispatch_uid=BaseIndexMetaclass.DISPATCH_UID,
+)
+
+# The index objects keep the connections of the client which built them, so
+# forked processes must not reuse the ones of their parent.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=BaseIndexMetaclass.reset_index_handles)
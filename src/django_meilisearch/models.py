@@ -0,0 +1,61 @@
+"""
+This module contains the models of the library, which store the state of the
+indexes in the database.
+"""
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+
+from django_meilisearch.changes import ADD, REMOVE
+
+
+class IndexWatermark(models.Model):
+    """
+    The watermark of the last incremental sync of an index.
+
+    Attributes:
+        index_name (models.CharField): The index name.
+        value (models.JSONField): The greatest `watermark_field` value of the
+        rows synchronized by the last sync.
+        synced_at (models.DateTimeField): The date and time of the last sync.
+    """
+
+    index_name = models.CharField(max_length=255, unique=True)
+    value = models.JSONField(encoder=DjangoJSONEncoder, null=True)
+    synced_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.index_name}: {self.value}"
+
+
+class OutboxEntry(models.Model):
+    """
+    A document change written by the model signals of an index with
+    `use_outbox`, sent to Meilisearch by the `worker` action.
+
+    Attributes:
+        index_name (models.CharField): The index name.
+        key (models.JSONField): The primary key of the document.
+        operation (models.CharField): `add` to upload the row again,
+        `remove` to delete the document.
+        attempts (models.PositiveIntegerField): The number of failed sends.
+        available_at (models.DateTimeField): The date and time of the next
+        send.
+        last_error (models.TextField): The error of the last failed send.
+    """
+
+    index_name = models.CharField(max_length=255)
+    key = models.JSONField(encoder=DjangoJSONEncoder)
+    operation = models.CharField(
+        max_length=6, choices=[(ADD, "Add"), (REMOVE, "Remove")]
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    available_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["available_at"])]
+
+    def __str__(self):
+        return f"{self.index_name}: {self.operation} {self.key}"
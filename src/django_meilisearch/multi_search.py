@@ -0,0 +1,182 @@
+"""
+This module contains the multi_search functions, which run the searches of
+several indexes with a single request to Meilisearch.
+"""
+
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Union
+
+from camel_converter import dict_to_camel
+from meilisearch.errors import MeilisearchApiError
+
+from django_meilisearch import async_client, client
+
+if TYPE_CHECKING:
+    from django_meilisearch.indexes import BaseIndex
+
+SearchSpec = Union[
+    tuple["type[BaseIndex]", str],
+    tuple["type[BaseIndex]", str, dict[str, Any]],
+]
+
+
+def _build_queries(searches: Sequence[SearchSpec]) -> list[dict[str, Any]]:
+    """Build the queries of a multi search.
+
+    Args:
+        searches (Sequence[SearchSpec]): `(index_cls, term)` or
+        `(index_cls, term, opt_params)` tuples, where `opt_params` are the
+        parameters of the `search` method of the index.
+
+    Returns:
+        list[dict]: Queries of the `/multi-search` route.
+    """
+
+    queries = []
+    for index_cls, term, *rest in searches:
+        opt_params = dict(rest[0]) if rest else {}
+        if not opt_params.get("attributes_to_search_on"):
+            opt_params["attributes_to_search_on"] = index_cls.searchable_fields
+
+        queries.append(
+            {
+                "indexUid": index_cls.name,
+                "q": term,
+                **dict_to_camel(opt_params),
+            }
+        )
+
+    return queries
+
+
+def _map_results(
+    searches: Sequence[SearchSpec],
+    response: dict[str, Any],
+    federation: Optional[dict[str, Any]],
+) -> Union[dict[type, dict[str, Any]], dict[str, Any]]:
+    """Map the response of a multi search to the index classes.
+
+    Args:
+        searches (Sequence[SearchSpec]): Searches of the multi search.
+        response (dict): Response of the `/multi-search` route.
+        federation (Optional[dict]): Federation of the multi search.
+
+    Returns:
+        Union[dict[type, dict], dict]: Search results of each index class,
+        or the merged search results of a federated search.
+    """
+
+    if federation is not None:
+        return response
+
+    return {
+        search[0]: results
+        for search, results in zip(searches, response["results"])
+    }
+
+
+def _check_searches(searches: Sequence[SearchSpec], federated: bool) -> None:
+    """Check the results of the searches can be mapped to their index class.
+
+    Raises:
+        ValueError: If an index class is searched several times without
+        federation.
+    """
+
+    index_classes = [search[0] for search in searches]
+    if not federated and len(set(index_classes)) < len(index_classes):
+        raise ValueError(
+            "An index can only be searched once by a multi search "
+            "without federation"
+        )
+
+
+def _error_response(
+    searches: Sequence[SearchSpec],
+    federation: Optional[dict[str, Any]],
+    error: MeilisearchApiError,
+) -> dict[str, Any]:
+    """Build the response of a failed multi search, with the same error
+    in the results of every search, as the `search` method does.
+    """
+
+    results = {"hits": [], **error.__dict__}
+    if federation is not None:
+        return results
+    return {"results": [results for _ in searches]}
+
+
+def multi_search(
+    searches: Sequence[SearchSpec],
+    federation: Optional[dict[str, Any]] = None,
+) -> Union[dict[type, dict[str, Any]], dict[str, Any]]:
+    """Search several indexes with a single request.
+
+    Args:
+        searches (Sequence[SearchSpec]): `(index_cls, term)` or
+        `(index_cls, term, opt_params)` tuples, where `opt_params` are the
+        parameters of the `search` method of the index.
+        federation (Optional[dict]): Merge the hits of every search in a
+        single list, paginated by the `offset` and `limit` keys of the
+        dictionary. Defaults to separate results for each search.
+
+    Returns:
+        Union[dict[type, dict], dict]: Search results of each index class,
+        or the merged search results if `federation` is set.
+
+    Raises:
+        ValueError: If an index class is searched several times without
+        federation.
+    """
+
+    _check_searches(searches, federation is not None)
+    if not searches:
+        return {} if federation is None else {"hits": []}
+
+    # The federation argument is only sent when it is set, since the clients
+    # released before the federated search do not accept it.
+    kwargs = {}
+    if federation is not None:
+        kwargs["federation"] = dict_to_camel(federation)
+
+    try:
+        response = client.multi_search(_build_queries(searches), **kwargs)
+
+    except MeilisearchApiError as e:
+        response = _error_response(searches, federation, e)
+
+    return _map_results(searches, response, federation)
+
+
+async def amulti_search(
+    searches: Sequence[SearchSpec],
+    federation: Optional[dict[str, Any]] = None,
+) -> Union[dict[type, dict[str, Any]], dict[str, Any]]:
+    """Search several indexes with a single request without blocking the
+    event loop. It accepts the same parameters as the `multi_search`
+    function.
+
+    Args:
+        searches (Sequence[SearchSpec]): Searches of the indexes.
+        federation (Optional[dict]): Federation of the searches.
+
+    Returns:
+        Union[dict[type, dict], dict]: Search results of each index class,
+        or the merged search results if `federation` is set.
+    """
+
+    _check_searches(searches, federation is not None)
+    if not searches:
+        return {} if federation is None else {"hits": []}
+
+    try:
+        response = await async_client.multi_search(
+            _build_queries(searches),
+            federation=(
+                None if federation is None else dict_to_camel(federation)
+            ),
+        )
+
+    except MeilisearchApiError as e:
+        response = _error_response(searches, federation, e)
+
+    return _map_results(searches, response, federation)
@@ -0,0 +1,300 @@
+"""
+This module contains the OutboxWorker class, which sends to Meilisearch the
+document changes written to the outbox table by the model signals of the
+indexes with `use_outbox` (see `django_meilisearch.changes`).
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+from itertools import groupby
+from operator import attrgetter
+from typing import Iterable, Optional, Type
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils import timezone
+
+from django_meilisearch.changes import ADD, REMOVE
+from django_meilisearch.exceptions import OutboxTaskError
+from django_meilisearch.indexes import BaseIndex
+from django_meilisearch.models import OutboxEntry
+
+logger = logging.getLogger("django_meilisearch")
+
+
+@dataclass
+class DrainStats:
+    """Result of a single drain of the outbox.
+
+    Attributes:
+        sent (int): Number of changes sent to Meilisearch.
+        failed (int): Number of changes which failed, retried unless given up.
+        given_up (int): Number of failed changes which reached
+        `max_attempts`, no longer sent.
+        drained (bool): Whether the outbox had no more changes ready to send.
+    """
+
+    sent: int = 0
+    failed: int = 0
+    given_up: int = 0
+    drained: bool = True
+
+
+class OutboxWorker:
+    """Send the changes of the outbox to Meilisearch in batches.
+
+    Each drain locks the oldest `batch_size` changes ready to send with
+    `SELECT ... FOR UPDATE SKIP LOCKED`, in a transaction held until they
+    are sent, so several workers draining the same outbox send different
+    changes. The other changes of their documents, e.g. older ones waiting
+    for a retry, are locked and merged with them, the last one winning, so
+    a document is uploaded again from its current row or deleted with a
+    single request per index and is never held back by a superseded
+    change. The documents with a change locked by another worker are left
+    to it. The changes are deleted from the outbox once the tasks of their
+    index succeeded. Otherwise they are retried after `retry_delay` seconds,
+    doubled after each attempt up to `max_retry_delay`, and given up after
+    `max_attempts` attempts: they are logged, counted by the drain and kept
+    in the outbox, see `given_up`.
+
+    Args:
+        indexes (Optional[Iterable[type]]): Index classes whose changes are
+        sent. Defaults to every registered index.
+        batch_size (int): Maximum number of changes read by a drain.
+        max_attempts (int): Number of attempts of a change.
+        retry_delay (float): Delay before the first retry, in seconds.
+        max_retry_delay (float): Maximum delay between two attempts, in
+        seconds.
+        using (str): Database of the outbox.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        indexes: Optional[Iterable[type]] = None,
+        batch_size: int = 10_000,
+        max_attempts: int = 10,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 300.0,
+        using: str = DEFAULT_DB_ALIAS,
+    ):
+        self.indexes = None if indexes is None else list(indexes)
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.using = using
+
+    def entries(self):
+        """Get the changes of the indexes of the worker.
+
+        Returns:
+            QuerySet: Outbox entries.
+        """
+
+        entries = OutboxEntry.objects.using(self.using).all()
+        if self.indexes is not None:
+            entries = entries.filter(
+                index_name__in=[index_cls.name for index_cls in self.indexes]
+            )
+        return entries
+
+    def pending(self):
+        """Get the changes of the indexes of the worker which are not given
+        up.
+
+        Returns:
+            QuerySet: Outbox entries.
+        """
+
+        return self.entries().filter(attempts__lt=self.max_attempts)
+
+    def given_up(self):
+        """Get the changes of the indexes of the worker which failed
+        `max_attempts` times. They are no longer sent, unless a newer change
+        of their document is, and are kept with their `last_error` until
+        deleted, e.g. with `given_up().delete()`.
+
+        Returns:
+            QuerySet: Outbox entries.
+        """
+
+        return self.entries().filter(attempts__gte=self.max_attempts)
+
+    def drain(self) -> DrainStats:
+        """Send a batch of changes to Meilisearch.
+
+        Returns:
+            DrainStats: Number of changes sent, failed and given up.
+        """
+
+        now = timezone.now()
+        with transaction.atomic(using=self.using):
+            entries = list(
+                self.pending()
+                .filter(available_at__lte=now)
+                .select_for_update(skip_locked=True)
+                .order_by("id")[: self.batch_size]
+            )
+            stats = DrainStats(drained=len(entries) < self.batch_size)
+
+            batches = self._lock_documents(entries)
+            if not batches:
+                stats.drained = True
+
+            for index_name, batch in batches.items():
+                self._drain_index(index_name, batch, stats, now)
+
+        return stats
+
+    def _lock_documents(self, entries: list) -> dict[str, list]:
+        """Lock the other changes of the documents of some changes, and
+        group them by index.
+
+        Args:
+            entries (list[OutboxEntry]): Changes locked by the drain.
+
+        Returns:
+            dict[str, list[OutboxEntry]]: Changes of the documents which are
+            not locked by another worker, by index name, oldest first.
+        """
+
+        batches: dict[str, list] = {}
+        for entry in entries:
+            batches.setdefault(entry.index_name, []).append(entry)
+
+        for index_name, batch in batches.items():
+            others = (
+                OutboxEntry.objects.using(self.using)
+                .filter(
+                    index_name=index_name,
+                    key__in=list({entry.key for entry in batch}),
+                )
+                .exclude(pk__in=[entry.pk for entry in batch])
+            )
+            locked = list(others.select_for_update(skip_locked=True))
+            busy = set(
+                others.exclude(
+                    pk__in=[entry.pk for entry in locked]
+                ).values_list("key", flat=True)
+            )
+            batches[index_name] = [
+                entry
+                for entry in sorted([*batch, *locked], key=attrgetter("pk"))
+                if entry.key not in busy
+            ]
+
+        return {
+            index_name: batch for index_name, batch in batches.items() if batch
+        }
+
+    def _drain_index(
+        self, index_name: str, batch: list, stats: DrainStats, now
+    ) -> None:
+        """Send the changes of an index, then delete them or delay their
+        next attempt.
+
+        Args:
+            index_name (str): Index name of the changes.
+            batch (list[OutboxEntry]): Changes of the index, oldest first.
+            stats (DrainStats): Counters of the drain, updated.
+            now (datetime): Date and time of the drain.
+        """
+
+        label = BaseIndex.INDEX_NAMES.get(index_name)
+        index_cls = None
+        if label is not None:
+            index_cls = BaseIndex.REGISTERED_INDEXES.get(label)
+        if index_cls is None:
+            logger.warning(
+                "Outbox changes of the unknown index %s dropped", index_name
+            )
+            self._delete(batch)
+            return
+
+        try:
+            self._send(index_cls, batch)
+        # Any error of an index is retried without stopping the others.
+        # pylint: disable-next=broad-exception-caught
+        except Exception as error:
+            logger.warning(
+                "Outbox changes of the index %s failed: %r", index_name, error
+            )
+            stats.failed += len(batch)
+            stats.given_up += self._retry(batch, error, now)
+        else:
+            self._delete(batch)
+            stats.sent += len(batch)
+
+    def _send(self, index_cls: Type[BaseIndex], batch: list) -> None:
+        """Send the merged changes of an index and wait for their tasks.
+
+        Args:
+            index_cls (Type[BaseIndex]): Index class of the changes.
+            batch (list[OutboxEntry]): Changes of the index, oldest first.
+
+        Raises:
+            OutboxTaskError: If a task of the changes failed.
+        """
+        operations = {entry.key: entry.operation for entry in batch}
+        additions = [key for key, op in operations.items() if op == ADD]
+        removals = [key for key, op in operations.items() if op == REMOVE]
+
+        tasks = []
+        if removals:
+            tasks.extend(index_cls.aremove_documents(removals))
+        if additions:
+            tasks.extend(index_cls.areindex_documents(additions))
+
+        tasks = index_cls.task_waiter.wait_many(task.uid for task in tasks)
+        for task in tasks:
+            if task.status != "succeeded":
+                raise OutboxTaskError(
+                    f"Task {task.uid} {task.status}: {task.error}"
+                )
+
+    def _retry(self, batch: list, error: Exception, now) -> int:
+        """Delay the next attempt of failed changes.
+
+        Args:
+            batch (list[OutboxEntry]): Failed changes.
+            error (Exception): Error of the attempt.
+            now (datetime): Date and time of the attempt.
+
+        Returns:
+            int: Number of changes given up by this attempt.
+        """
+
+        entries = OutboxEntry.objects.using(self.using)
+        given_up = 0
+        batch = sorted(batch, key=attrgetter("attempts"))
+        for attempts, group in groupby(batch, key=attrgetter("attempts")):
+            failed = list(group)
+            delay = min(self.retry_delay * 2**attempts, self.max_retry_delay)
+            entries.filter(pk__in=[entry.pk for entry in failed]).update(
+                attempts=attempts + 1,
+                available_at=now + timedelta(seconds=delay),
+                last_error=repr(error),
+            )
+            if attempts + 1 == self.max_attempts:
+                given_up += len(failed)
+                logger.error(
+                    "Outbox changes of the index %s given up after %d"
+                    " attempts: %r",
+                    failed[0].index_name,
+                    self.max_attempts,
+                    error,
+                )
+
+        return given_up
+
+    def _delete(self, batch: list) -> None:
+        """Delete sent changes from the outbox.
+
+        Args:
+            batch (list[OutboxEntry]): Sent changes.
+        """
+
+        OutboxEntry.objects.using(self.using).filter(
+            pk__in=[entry.pk for entry in batch]
+        ).delete()
@@ -0,0 +1,189 @@
+"""
+This module contains the PopulatePipeline class, which overlaps the database
+reads, the serialization and the upload of the batches of a populate.
+"""
+
+import contextvars
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, ClassVar, Iterable, Optional, TypeVar
+
+from django.db import connections
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class PopulatePipeline:
+    """Run the populate stages concurrently with bounded queues.
+
+    The batches are read from the database by the calling thread, serialized
+    by a pool of `serialize_workers` threads and uploaded by a dedicated
+    thread. The stages are connected by bounded queues, so a slow stage
+    blocks the previous ones and at most `serialize_queue_size +
+    serialize_workers + upload_queue_size + 1` batches are held in memory.
+
+    Args:
+        serialize_workers (int): Number of serializer threads.
+        serialize_queue_size (int): Maximum number of batches read from the
+        database waiting to be serialized.
+        upload_queue_size (int): Maximum number of serialized batches waiting
+        to be uploaded.
+    """
+
+    serialize_workers: int = 2
+    serialize_queue_size: int = 2
+    upload_queue_size: int = 2
+
+    def run(
+        self,
+        batches: Iterable[list[Any]],
+        serialize: Callable[[list[Any]], list[dict]],
+        upload: Callable[[list[dict]], T],
+    ) -> list[T]:
+        """Serialize and upload the batches.
+
+        Args:
+            batches (Iterable[list[Any]]): Batches of model instances.
+            serialize (Callable): Function turning a batch into documents.
+            upload (Callable): Function uploading documents and returning
+            the result of the upload, e.g. the Meilisearch task UID.
+
+        Returns:
+            list: Results of the uploads, in the order of the batches.
+        """
+        run = _PipelineRun(
+            serialize,
+            upload,
+            queue.Queue(self.serialize_queue_size),
+            queue.Queue(self.upload_queue_size),
+        )
+        return run.execute(batches, self.serialize_workers)
+
+
+@dataclass
+class _PipelineRun:
+    """State of a single execution of a PopulatePipeline."""
+
+    _DONE: ClassVar[object] = object()
+
+    serialize: Callable[[list[Any]], list[dict]]
+    upload: Callable[[list[dict]], Any]
+    serialize_queue: queue.Queue
+    upload_queue: queue.Queue
+    stop: threading.Event = field(default_factory=threading.Event)
+    error: Optional[BaseException] = None
+    results: dict[int, Any] = field(default_factory=dict)
+
+    def execute(
+        self, batches: Iterable[list[Any]], serialize_workers: int
+    ) -> list[Any]:
+        """Run the pipeline until every batch is uploaded."""
+        # Each thread runs in a copy of the context of the caller, so the
+        # uploads are measured by the operation which started the pipeline.
+        serializers = [
+            threading.Thread(
+                target=contextvars.copy_context().run,
+                args=(self._serialize_worker,),
+                daemon=True,
+            )
+            for _ in range(serialize_workers)
+        ]
+        uploader = threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(self._upload_worker,),
+            daemon=True,
+        )
+        for thread in [*serializers, uploader]:
+            thread.start()
+
+        try:
+            for position, batch in enumerate(batches):
+                if not self._put(self.serialize_queue, (position, batch)):
+                    break
+        except BaseException as e:  # pylint: disable=broad-exception-caught
+            self._fail(e)
+
+        for _ in serializers:
+            self._put(self.serialize_queue, self._DONE)
+        for thread in serializers:
+            thread.join()
+
+        self._put(self.upload_queue, self._DONE)
+        uploader.join()
+
+        if self.error is not None:
+            raise self.error
+
+        return [self.results[key] for key in sorted(self.results)]
+
+    def _serialize_worker(self) -> None:
+        """Serialize the batches of the serialize queue."""
+        try:
+            while True:
+                item = self._get(self.serialize_queue)
+                if item is self._DONE:
+                    return
+
+                position, batch = item
+                documents = self.serialize(batch)
+                if not self._put(self.upload_queue, (position, documents)):
+                    return
+        except BaseException as e:  # pylint: disable=broad-exception-caught
+            self._fail(e)
+        finally:
+            connections.close_all()
+
+    def _upload_worker(self) -> None:
+        """Upload the documents of the upload queue."""
+        try:
+            while True:
+                item = self._get(self.upload_queue)
+                if item is self._DONE:
+                    return
+
+                position, documents = item
+                self.results[position] = self.upload(documents)
+        except BaseException as e:  # pylint: disable=broad-exception-caught
+            self._fail(e)
+
+    def _fail(self, error: BaseException) -> None:
+        """Record the first error and stop every stage."""
+        if self.error is None:
+            self.error = error
+        self.stop.set()
+
+    def _put(self, target: queue.Queue, item: Any) -> bool:
+        """Put an item in a queue unless the pipeline is stopped.
+
+        Sentinels are always delivered so that the workers can exit.
+        """
+        while item is self._DONE or not self.stop.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                if item is self._DONE and self.stop.is_set():
+                    self._drain(target)
+        return False
+
+    def _get(self, source: queue.Queue) -> Any:
+        """Get an item from a queue, returning the sentinel once stopped."""
+        while True:
+            if self.stop.is_set():
+                self._drain(source)
+                return self._DONE
+            try:
+                return source.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+    @staticmethod
+    def _drain(target: queue.Queue) -> None:
+        """Discard the pending items of a queue."""
+        while True:
+            try:
+                target.get_nowait()
+            except queue.Empty:
+                return
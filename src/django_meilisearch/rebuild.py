@@ -0,0 +1,116 @@
+"""
+This module contains the RebuildMixin class, which rebuilds the indexes
+through a shadow index swapped with them, without downtime.
+"""
+
+from meilisearch.errors import MeilisearchApiError
+from meilisearch.index import Index
+
+from django_meilisearch import client
+from django_meilisearch.batching import IndexingResult
+from django_meilisearch.index_base import IndexBase
+from django_meilisearch.instrumentation import instrumented
+
+
+class RebuildMixin(IndexBase):
+    """Rebuild of the indexes through a shadow index named `<name>_tmp`."""
+
+    @classmethod
+    @instrumented("arebuild")
+    def arebuild(cls) -> IndexingResult:
+        """Rebuild the index asynchronously, without downtime.
+        The documents are indexed in a shadow index named `<name>_tmp`, created
+        with the settings of the index, which is then swapped with the index.
+        The previous documents, left in the shadow index by the swap, are
+        deleted afterwards. Meilisearch processes the tasks in the order they
+        are enqueued, so the index is searchable during the whole rebuild.
+
+        Returns:
+            IndexingResult: List of Meilisearch task objects of the batches,
+            with the uploaded batches.
+        """
+
+        shadow = cls._prepare_shadow_index(wait=False)
+        batches = cls._add_batches(shadow)
+
+        client.swap_indexes([{"indexes": [cls.name, shadow.uid]}])
+        client.delete_index(shadow.uid)
+        cls.invalidate_search_cache()
+
+        return IndexingResult(
+            [client.get_task(batch.task_uid) for batch in batches], batches
+        )
+
+    @classmethod
+    @instrumented("rebuild")
+    def rebuild(cls) -> IndexingResult:
+        """Rebuild the index without downtime.
+        The documents are indexed in a shadow index named `<name>_tmp`, created
+        with the settings of the index, which is then swapped with the index
+        once every batch is indexed. The shadow index, holding the previous
+        documents after the swap, is then destroyed.
+
+        Returns:
+            IndexingResult: List of Meilisearch task objects of the batches,
+            with the uploaded batches.
+        """
+
+        shadow = cls._prepare_shadow_index(wait=True)
+        batches = cls._add_batches_with_progress(shadow)
+        tasks = cls.task_waiter.wait_many(batch.task_uid for batch in batches)
+
+        if all(task.status == "succeeded" for task in tasks):
+            task_info = client.swap_indexes(
+                [{"indexes": [cls.name, shadow.uid]}]
+            )
+            cls.task_waiter.wait(task_info.task_uid)
+
+        task_info = client.delete_index(shadow.uid)
+        cls.task_waiter.wait(task_info.task_uid)
+        cls.invalidate_search_cache()
+
+        return IndexingResult(tasks, batches)
+
+    @classmethod
+    def _prepare_shadow_index(cls, wait: bool) -> Index:
+        """Create an empty shadow index with the settings of the index.
+        A shadow index left by an interrupted rebuild is deleted first and
+        the index is created if it does not exist, so that it can be swapped.
+
+        Args:
+            wait (bool): Whether to wait for the tasks to finish.
+
+        Returns:
+            Index: Meilisearch shadow index object.
+        """
+
+        shadow_name = f"{cls.name}_tmp"
+
+        try:
+            settings = cls.get_index().get_settings()
+        except MeilisearchApiError:
+            settings = None
+
+        task_infos = [client.delete_index(shadow_name)]
+        if settings is None:
+            task_infos.append(
+                client.create_index(
+                    cls.name, {"primaryKey": cls.primary_key_field}
+                )
+            )
+        task_infos.append(
+            client.create_index(
+                shadow_name, {"primaryKey": cls.primary_key_field}
+            )
+        )
+        if wait:
+            cls.task_waiter.wait_many(
+                task_info.task_uid for task_info in task_infos
+            )
+
+        shadow = client.index(shadow_name)
+        shadow.update_settings(
+            {**(settings or {}), **cls.get_index_settings()}
+        )
+
+        return shadow
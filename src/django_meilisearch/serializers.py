@@ -4,9 +4,17 @@ that handle to serialize models to populate index.
 """
 
 from datetime import datetime
+from typing import Any, Callable, Iterable, Optional, Type
 
+from django.db.models import FileField, QuerySet
 from django.utils.timezone import get_current_timezone
 from rest_framework import serializers
+from rest_framework.relations import PKOnlyObject, RelatedField
+
+from django_meilisearch.exceptions import (
+    InvalidComputedFieldError,
+    InvalidRelatedFieldError,
+)
 
 
 class TimestampField(serializers.DateTimeField):
@@ -30,3 +38,223 @@ class TimestampField(serializers.DateTimeField):
         """
         tz = get_current_timezone()
         return datetime.fromtimestamp(value, tz)
+
+
+class RelatedPathField(serializers.Field):
+    """
+    Read a value through a chain of relations of the instance.
+
+    The relations are followed with their attributes, so the related rows
+    must be loaded by `select_related` or `prefetch_related` to avoid a query
+    per instance. When a relation of the chain is multi-valued, the values of
+    every related row are returned as a list.
+    """
+
+    def __init__(
+        self,
+        relations: list[tuple[str, bool]],
+        leaf: Optional[serializers.Field],
+        many: bool,
+        **kwargs,
+    ):
+        """
+        :param relations: the attribute of each relation and whether it is
+        multi-valued
+        :param leaf: the field of the column read on the last related rows,
+        or `None` to read their primary keys
+        :param many: whether a relation of the chain is multi-valued
+        """
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+        self.relations = relations
+        self.leaf = leaf
+        self.many = many
+
+    def to_representation(self, value: Any) -> Any:
+        """
+        Follow the relations of an instance and represent the values read
+        :param value: the model instance
+        :return: the value, or the list of values of a multi-valued chain
+        """
+        objects = [value]
+        for attribute, many in self.relations:
+            related = []
+            for obj in objects:
+                if many:
+                    related.extend(getattr(obj, attribute).all())
+                elif (item := getattr(obj, attribute, None)) is not None:
+                    related.append(item)
+            objects = related
+
+        values = [self.represent_leaf(obj) for obj in objects]
+        if self.many:
+            return values
+        return values[0] if values else None
+
+    def represent_leaf(self, obj: Any) -> Any:
+        """
+        Represent the column read on a related row
+        :param obj: the last related row
+        :return: its primary key, or the representation of the column
+        """
+        if self.leaf is None:
+            return obj.pk
+
+        value = getattr(obj, self.leaf.source)
+        return None if value is None else self.leaf.to_representation(value)
+
+    def to_internal_value(self, data: Any) -> Any:
+        """
+        Refuse to deserialize the field, read from the related rows
+        :param data: the primitive value
+        :raise ValidationError: always, the field is read-only
+        """
+        raise serializers.ValidationError("This field is read-only.")
+
+
+class ComputedValueField(serializers.Field):
+    """
+    Compute a value from the instance with a function.
+    """
+
+    def __init__(self, function: Callable[[Any], Any], **kwargs):
+        """
+        :param function: the function receiving the model instance
+        """
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+        self.function = function
+
+    def to_representation(self, value: Any) -> Any:
+        """
+        Compute the value of an instance
+        :param value: the model instance
+        :return: the computed value
+        """
+        return self.function(value)
+
+    def to_internal_value(self, data: Any) -> Any:
+        """
+        Refuse to deserialize the field, computed from the instance
+        :param data: the primitive value
+        :raise ValidationError: always, the field is read-only
+        """
+        raise serializers.ValidationError("This field is read-only.")
+
+
+class AnnotationField(serializers.ReadOnlyField):
+    """
+    Read a value annotated on the rows of the queryset.
+    """
+
+    def to_internal_value(self, data: Any) -> Any:
+        """
+        Refuse to deserialize the field, annotated by the queryset
+        :param data: the primitive value
+        :raise ValidationError: always, the field is read-only
+        """
+        raise serializers.ValidationError("This field is read-only.")
+
+
+class CompiledSerializer:
+    """
+    Serialize documents from `values_list` rows instead of model instances.
+
+    The extraction plan is computed once from the readable fields of a
+    `ModelSerializer`: each document attribute is paired with the model column
+    to read and the serializer field used to represent it. Documents are then
+    built from plain tuples, without instantiating the model nor walking the
+    serializer field tree, and are equal to the ones of the original serializer.
+    """
+
+    def __init__(self, serializer_class: Type[serializers.ModelSerializer]):
+        model = serializer_class.Meta.model
+
+        self.field_names: list[str] = []
+        self.columns: list[str] = []
+        self.converters: list[Callable[[Any], Any]] = []
+
+        for field in serializer_class().fields.values():
+            if field.write_only:
+                continue
+
+            self.field_names.append(field.field_name)
+            if isinstance(field, AnnotationField):
+                self.columns.append(field.source)
+                self.converters.append(field.to_representation)
+            elif isinstance(field, RelatedPathField):
+                self.columns.append(field.field_name)
+                self.converters.append(self._compile_related(field))
+            elif isinstance(field, ComputedValueField):
+                raise InvalidComputedFieldError(
+                    f"{field.field_name} is computed by a function and can not"
+                    " be read by the compiled serializer"
+                )
+            else:
+                model_field = model._meta.get_field(field.source)
+                self.columns.append(field.source)
+                self.converters.append(self._compile_field(field, model_field))
+
+    @staticmethod
+    def _compile_related(field: RelatedPathField) -> Callable:
+        """
+        Build the function converting a related column value
+        :param field: the serializer field of the related path
+        :return: a function receiving a non null column value
+        """
+        if field.many:
+            raise InvalidRelatedFieldError(
+                f"{field.field_name} is multi-valued and can not be read by"
+                " the compiled serializer"
+            )
+
+        if field.leaf is None:
+            return lambda value: value
+
+        return field.leaf.to_representation
+
+    @staticmethod
+    def _compile_field(field: serializers.Field, model_field) -> Callable:
+        """
+        Build the function converting a column value to its representation
+        :param field: the serializer field
+        :param model_field: the model field of the column
+        :return: a function receiving a non null column value
+        """
+        if isinstance(field, RelatedField):
+            return lambda value: field.to_representation(PKOnlyObject(value))
+
+        if isinstance(model_field, FileField):
+            # The file only needs its instance to be saved or deleted.
+            return lambda value: field.to_representation(
+                model_field.attr_class(
+                    None, model_field, value  # type: ignore[arg-type]
+                )
+            )
+
+        return field.to_representation
+
+    def rows(self, queryset: QuerySet) -> QuerySet:
+        """
+        Select the columns read by the compiled serializer
+        :param queryset: the queryset of the model of the serializer
+        :return: the `values_list` queryset of the rows
+        """
+        return queryset.values_list(*self.columns)
+
+    def to_documents(self, rows: Iterable[tuple]) -> list[dict]:
+        """
+        Serialize `values_list` rows selected with the `rows` method
+        :param rows: the rows to serialize
+        :return: the list of documents
+        """
+        plan = list(zip(self.field_names, self.converters))
+        return [
+            {
+                name: None if value is None else convert(value)
+                for (name, convert), value in zip(plan, row)
+            }
+            for row in rows
+        ]
@@ -0,0 +1,92 @@
+"""
+Test cases for the AsyncClient class.
+"""
+
+import asyncio
+import json
+
+import httpx
+from django.test import SimpleTestCase
+from meilisearch.errors import MeilisearchApiError
+
+from django_meilisearch.async_client import AsyncClient
+
+
+class AsyncClientTestCase(SimpleTestCase):
+    """
+    Test cases for the AsyncClient class.
+    """
+
+    def setUp(self):
+        self.requests = []
+        self.client = AsyncClient("http://meilisearch", api_key="key")
+
+    def run_with_responses(self, coroutine_function, *responses):
+        """
+        Run a coroutine with a mocked transport answering the responses.
+        """
+        responses = list(responses)
+
+        def handler(request):
+            self.requests.append(request)
+            return responses.pop(0)
+
+        async def main():
+            # pylint: disable=protected-access
+            pool = self.client._pool()
+            pool._transport = httpx.MockTransport(handler)
+            try:
+                return await coroutine_function()
+            finally:
+                await self.client.aclose()
+
+        return asyncio.run(main())
+
+    def test_should_search_with_a_json_body(self):
+        """
+        Test the search sends the query as the JSON body.
+        """
+        results = self.run_with_responses(
+            lambda: self.client.search("posts", {"q": "term", "limit": 1}),
+            httpx.Response(200, json={"hits": [{"id": 1}]}),
+        )
+
+        request = self.requests[0]
+        self.assertEqual(results, {"hits": [{"id": 1}]})
+        self.assertEqual(request.method, "POST")
+        self.assertEqual(request.url.path, "/indexes/posts/search")
+        self.assertEqual(request.headers["Authorization"], "Bearer key")
+        self.assertEqual(
+            json.loads(request.content), {"q": "term", "limit": 1}
+        )
+
+    def test_should_share_the_pool_of_an_event_loop(self):
+        """
+        Test the requests of an event loop share the same HTTP client.
+        """
+
+        async def pools():
+            # pylint: disable=protected-access
+            first, second = self.client._pool(), self.client._pool()
+            await self.client.aclose()
+            return first, second
+
+        first, second = asyncio.run(pools())
+
+        self.assertIs(first, second)
+
+    def test_should_raise_meilisearch_errors(self):
+        """
+        Test the error responses raise a MeilisearchApiError.
+        """
+        with self.assertRaises(MeilisearchApiError) as context:
+            self.run_with_responses(
+                lambda: self.client.get_stats("posts"),
+                httpx.Response(
+                    404,
+                    json={"message": "Index not found", "code": "not_found"},
+                ),
+            )
+
+        self.assertEqual(context.exception.status_code, 404)
+        self.assertEqual(context.exception.code, "not_found")
@@ -0,0 +1,130 @@
+"""
+Test cases for the AdaptiveBatchSize class.
+"""
+
+from datetime import datetime, timedelta
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from django_meilisearch.batching import AdaptiveBatchSize
+
+
+class AdaptiveBatchSizeTestCase(SimpleTestCase):
+    """
+    Test cases for the AdaptiveBatchSize class.
+    """
+
+    def start(self, **kwargs):
+        """
+        Start a sizer without time targets unless they are given.
+        """
+        options = {
+            "initial_size": 100,
+            "min_size": 10,
+            "max_size": 1_000,
+            "target_bytes": 100_000,
+            "target_serialize_seconds": None,
+            "target_task_seconds": None,
+            "smoothing": 1.0,
+        }
+        options.update(kwargs)
+        return AdaptiveBatchSize(**options).start()
+
+    def test_should_start_with_the_initial_size(self):
+        """
+        Test the first batch has the initial size.
+        """
+        sizer = self.start()
+
+        self.assertEqual(sizer(), 100)
+
+    def test_should_grow_by_at_most_max_growth(self):
+        """
+        Test small documents double the batch size at each batch.
+        """
+        sizer = self.start()
+
+        sizes = []
+        for _ in range(4):
+            size = sizer()
+            sizes.append(size)
+            sizer.record_upload(size, size * 10, None)
+
+        self.assertEqual(sizes, [100, 200, 400, 800])
+        sizer.record_upload(sizer(), 8_000, None)
+        self.assertEqual(sizer(), 1_000)
+
+    def test_should_shrink_to_the_byte_target(self):
+        """
+        Test large documents shrink the next batch to the byte target.
+        """
+        sizer = self.start()
+
+        sizer.record_upload(sizer(), 100 * 5_000, None)
+
+        self.assertEqual(sizer(), 20)
+
+    def test_should_not_shrink_below_min_size(self):
+        """
+        Test the batch size is clamped to the minimum size.
+        """
+        sizer = self.start()
+
+        sizer.record_upload(sizer(), 100 * 1_000_000, None)
+
+        self.assertEqual(sizer(), 10)
+
+    def test_should_shrink_to_the_serialize_target(self):
+        """
+        Test a slow serialization shrinks the next batch.
+        """
+        sizer = self.start(target_serialize_seconds=1.0)
+
+        sizer.record_serialize(sizer(), 4.0)
+
+        self.assertEqual(sizer(), 25)
+
+    def test_should_shrink_to_the_task_target(self):
+        """
+        Test a slow Meilisearch task shrinks the next batch.
+        """
+        sizer = self.start(target_task_seconds=2.0)
+        started_at = datetime(2024, 1, 1)
+        task = mock.Mock(
+            started_at=started_at,
+            finished_at=started_at + timedelta(seconds=10),
+        )
+
+        with mock.patch(
+            "django_meilisearch.batching.client.get_task", return_value=task
+        ) as get_task:
+            sizer.record_upload(sizer(), 1_000, 42)
+
+        get_task.assert_called_once_with(42)
+        self.assertEqual(sizer(), 20)
+
+    def test_should_check_an_unfinished_task_again(self):
+        """
+        Test a task still processing is checked with the next batch.
+        """
+        sizer = self.start(target_task_seconds=2.0)
+        started_at = datetime(2024, 1, 1)
+        processing = mock.Mock(started_at=started_at, finished_at=None)
+        finished = mock.Mock(
+            started_at=started_at,
+            finished_at=started_at + timedelta(seconds=10),
+        )
+
+        with mock.patch(
+            "django_meilisearch.batching.client.get_task",
+            side_effect=[processing, finished, finished],
+        ) as get_task:
+            sizer.record_upload(sizer(), 1_000, 1)
+            self.assertEqual(sizer(), 200)
+            sizer.record_upload(sizer(), 2_000, 2)
+
+        self.assertEqual(
+            [call.args[0] for call in get_task.call_args_list], [1, 1]
+        )
+        self.assertEqual(sizer(), 20)
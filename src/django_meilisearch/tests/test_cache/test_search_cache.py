@@ -0,0 +1,304 @@
+"""
+Test cases for the search result caches.
+"""
+
+from types import SimpleNamespace
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase
+
+import django_meilisearch
+from django_meilisearch.cache import (
+    DjangoSearchCache,
+    LocalSearchCache,
+    SearchCache,
+)
+from example.indexes import PostIndexWithSearchCache
+
+
+class LocalSearchCacheTestCase(SimpleTestCase):
+    """
+    Test cases for the LocalSearchCache class.
+    """
+
+    def setUp(self):
+        self.cache = LocalSearchCache(ttl=60, max_entries=2)
+
+    def test_should_count_hits_and_misses(self):
+        """
+        Test the hits and misses are counted.
+        """
+        self.assertIsNone(self.cache.get("posts", 0, "term", {"limit": 1}))
+        self.cache.set("posts", 0, "term", {"limit": 1}, {"hits": [1]})
+
+        results = self.cache.get("posts", 0, "term", {"limit": 1})
+
+        self.assertEqual(results, {"hits": [1]})
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_should_ignore_the_order_of_the_parameters(self):
+        """
+        Test the parameters are normalized in the key.
+        """
+        self.cache.set("posts", 0, "term", {"limit": 1, "offset": 2}, {})
+
+        self.assertEqual(
+            self.cache.get("posts", 0, "term", {"offset": 2, "limit": 1}), {}
+        )
+
+    def test_should_expire_entries(self):
+        """
+        Test the entries expire after the TTL.
+        """
+        with mock.patch("django_meilisearch.cache.time.monotonic") as now:
+            now.return_value = 100
+            self.cache.set("posts", 0, "term", {}, {"hits": []})
+            now.return_value = 160
+
+            self.assertIsNone(self.cache.get("posts", 0, "term", {}))
+
+        self.assertEqual(len(self.cache), 0)
+
+    def test_should_evict_the_least_recently_used_entry(self):
+        """
+        Test the least recently used entry is evicted when full.
+        """
+        self.cache.set("posts", 0, "a", {}, {"hits": ["a"]})
+        self.cache.set("posts", 0, "b", {}, {"hits": ["b"]})
+        self.cache.get("posts", 0, "a", {})
+        self.cache.set("posts", 0, "c", {}, {"hits": ["c"]})
+
+        self.assertIsNotNone(self.cache.get("posts", 0, "a", {}))
+        self.assertIsNone(self.cache.get("posts", 0, "b", {}))
+        self.assertIsNotNone(self.cache.get("posts", 0, "c", {}))
+
+    def test_should_invalidate_an_index(self):
+        """
+        Test the invalidation increments the version of the index and only
+        drops its entries.
+        """
+        self.cache.set("posts", 0, "term", {}, {"hits": []})
+        self.cache.set("users", 0, "term", {}, {"hits": []})
+
+        self.cache.invalidate("posts")
+
+        self.assertEqual(self.cache.version("posts"), 1)
+        self.assertEqual(self.cache.version("users"), 0)
+        self.assertIsNone(self.cache.get("posts", 0, "term", {}))
+        self.assertIsNotNone(self.cache.get("users", 0, "term", {}))
+
+    def test_should_not_store_the_results_of_a_previous_version(self):
+        """
+        Test the results of a search started before a write are not cached.
+        """
+        self.cache.invalidate("posts")
+
+        self.cache.set("posts", 0, "term", {}, {"hits": []})
+
+        self.assertEqual(len(self.cache), 0)
+
+    def test_should_settle_a_version(self):
+        """
+        Test only the settled version of an index is settled.
+        """
+        self.cache.settle("posts", 0)
+
+        self.assertTrue(self.cache.settled("posts", 0))
+        self.assertFalse(self.cache.settled("posts", 1))
+        self.assertFalse(self.cache.settled("users", 0))
+
+    def test_should_require_the_storage_methods(self):
+        """
+        Test the base class cannot be instantiated.
+        """
+        with self.assertRaises(TypeError):
+            SearchCache()  # pylint: disable=abstract-class-instantiated
+
+
+class DjangoSearchCacheTestCase(SimpleTestCase):
+    """
+    Test cases for the DjangoSearchCache class.
+    """
+
+    def setUp(self):
+        self.cache = DjangoSearchCache(ttl=60, key_prefix="test_search")
+        self.cache.cache.clear()
+
+    def test_should_store_results_in_the_django_cache(self):
+        """
+        Test the results are stored in the Django cache.
+        """
+        version = self.cache.version("posts")
+        self.cache.set("posts", version, "term", {"limit": 1}, {"hits": [1]})
+
+        results = self.cache.get("posts", version, "term", {"limit": 1})
+
+        self.assertEqual(results, {"hits": [1]})
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_should_share_the_version_of_an_index(self):
+        """
+        Test the version is stored once in the Django cache.
+        """
+        version = self.cache.version("posts")
+
+        self.assertEqual(
+            DjangoSearchCache(key_prefix="test_search").version("posts"),
+            version,
+        )
+
+    def test_should_invalidate_an_index(self):
+        """
+        Test the invalidation increments the version of the index only.
+        """
+        posts = self.cache.version("posts")
+        users = self.cache.version("users")
+
+        self.cache.invalidate("posts")
+        self.cache.invalidate("posts")
+
+        self.assertEqual(self.cache.version("posts"), posts + 2)
+        self.assertEqual(self.cache.version("users"), users)
+
+    def test_should_invalidate_an_index_without_version(self):
+        """
+        Test the invalidation creates the version of the index.
+        """
+        self.cache.invalidate("posts")
+
+        self.assertIsNotNone(self.cache.version("posts"))
+
+    def test_should_not_reuse_a_version_after_an_eviction(self):
+        """
+        Test a version evicted from the cache is created again above the
+        previous versions.
+        """
+        version = self.cache.version("posts")
+        self.cache.invalidate("posts")
+
+        self.cache.cache.delete("test_search:posts:version")
+
+        self.assertGreater(self.cache.version("posts"), version + 1)
+
+    def test_should_settle_a_version(self):
+        """
+        Test the settled versions are stored in the Django cache.
+        """
+        self.cache.settle("posts", 1)
+
+        self.assertTrue(
+            DjangoSearchCache(key_prefix="test_search").settled("posts", 1)
+        )
+        self.assertFalse(self.cache.settled("posts", 2))
+
+
+class IndexSearchCacheTestCase(SimpleTestCase):
+    """
+    Test cases for the search cache of the indexes.
+    """
+
+    def setUp(self):
+        self.cache = LocalSearchCache(ttl=60)
+        patcher = mock.patch.object(
+            PostIndexWithSearchCache, "search_cache", self.cache
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(django_meilisearch.client, "get_client")
+        self.client = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(
+            django_meilisearch.async_client, "get_client"
+        )
+        self.async_client = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+        self.index = mock.Mock()
+        self.index.search.return_value = {"hits": []}
+        self.async_client.search = mock.AsyncMock(return_value={"hits": []})
+        patcher = mock.patch.object(
+            PostIndexWithSearchCache, "get_index", return_value=self.index
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.poll()
+
+    def poll(self, *statuses):
+        """
+        Answer the polls of the unfinished tasks of the index.
+        """
+        tasks = [SimpleNamespace(uid=1, status=status) for status in statuses]
+        self.client.get_tasks.return_value = SimpleNamespace(results=tasks)
+        self.async_client.get_index_tasks = mock.AsyncMock(return_value=tasks)
+
+    def test_should_not_cache_while_a_task_is_unfinished(self):
+        """
+        Test the results are not cached until the tasks of the index are
+        finished.
+        """
+        self.poll("processing")
+
+        PostIndexWithSearchCache.search("term")
+        PostIndexWithSearchCache.search("term")
+
+        self.assertEqual(self.index.search.call_count, 2)
+        self.client.get_tasks.assert_called_with(
+            {
+                "indexUids": [PostIndexWithSearchCache.name],
+                "statuses": ["enqueued", "processing"],
+                "limit": 1,
+            }
+        )
+
+        self.poll()
+        PostIndexWithSearchCache.search("term")
+        PostIndexWithSearchCache.search("term")
+
+        self.assertEqual(self.index.search.call_count, 3)
+
+    def test_should_poll_once_per_version(self):
+        """
+        Test the tasks are not polled again once the version is settled.
+        """
+        PostIndexWithSearchCache.search("term")
+        PostIndexWithSearchCache.search("other")
+
+        self.assertEqual(self.client.get_tasks.call_count, 1)
+        self.assertEqual(self.index.search.call_count, 2)
+
+    def test_should_not_read_the_results_cached_before_a_write(self):
+        """
+        Test a write invalidates the results and settles again.
+        """
+        PostIndexWithSearchCache.search("term")
+
+        PostIndexWithSearchCache.invalidate_search_cache()
+        PostIndexWithSearchCache.search("term")
+        PostIndexWithSearchCache.search("term")
+
+        self.assertEqual(self.client.get_tasks.call_count, 2)
+        self.assertEqual(self.index.search.call_count, 2)
+
+    def test_should_share_the_cache_with_asearch(self):
+        """
+        Test the async search goes through the same cache.
+        """
+        self.poll("processing")
+
+        async_to_sync(PostIndexWithSearchCache.asearch)("term")
+        self.assertEqual(self.async_client.search.await_count, 1)
+
+        self.poll()
+        async_to_sync(PostIndexWithSearchCache.asearch)("term")
+        PostIndexWithSearchCache.search("term")
+
+        self.assertEqual(self.async_client.search.await_count, 2)
+        self.async_client.get_index_tasks.assert_awaited_with(
+            PostIndexWithSearchCache.name, ["enqueued", "processing"], limit=1
+        )
+        self.index.search.assert_not_called()
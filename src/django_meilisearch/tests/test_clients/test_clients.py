@@ -0,0 +1,146 @@
+"""
+Test cases for the Client and LazyClient classes.
+"""
+
+from threading import Thread
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from django_meilisearch.clients import (
+    Client,
+    ConnectionPool,
+    LazyClient,
+    client_options,
+)
+
+
+class ClientTestCase(SimpleTestCase):
+    """
+    Test cases for the Client class.
+    """
+
+    def setUp(self):
+        self.client = Client(
+            "http://meilisearch", api_key="key", pool=ConnectionPool(size=4)
+        )
+
+    def test_should_send_the_requests_with_the_session(self):
+        """
+        Test the requests of the client reuse the connections of its session.
+        """
+        response = mock.Mock(status_code=200, content=b"{}")
+        response.json.return_value = {"status": "available"}
+
+        with mock.patch.object(
+            self.client.session, "request", return_value=response
+        ) as request:
+            self.assertEqual(self.client.health(), {"status": "available"})
+
+        request.assert_called_once()
+        self.assertEqual(
+            request.call_args.args, ("GET", "http://meilisearch/health")
+        )
+
+    def test_should_share_the_session_with_the_indexes(self):
+        """
+        Test the indexes of the client use its session.
+        """
+        index = self.client.index("posts")
+
+        self.assertIs(index.http.session, self.client.session)
+        self.assertIs(index.task_handler.http.session, self.client.session)
+
+    def test_should_give_each_thread_its_own_session(self):
+        """
+        Test the threads sending requests with the client use their own
+        session.
+        """
+        sessions = []
+        thread = Thread(target=lambda: sessions.append(self.client.session))
+        thread.start()
+        thread.join()
+
+        self.assertIs(self.client.session, self.client.session)
+        self.assertIsNot(sessions[0], self.client.session)
+        self.assertEqual(
+            sessions[0].get_adapter("http://meilisearch")._pool_maxsize, 4
+        )
+
+    def test_should_size_the_connection_pool(self):
+        """
+        Test the connection pool has the configured size.
+        """
+        adapter = self.client.session.get_adapter("http://meilisearch")
+
+        # pylint: disable=protected-access
+        self.assertEqual(adapter._pool_maxsize, 4)
+
+    def test_should_close_the_connections_without_keep_alive(self):
+        """
+        Test the connections are closed after each request without keep-alive.
+        """
+        client = Client(
+            "http://meilisearch", pool=ConnectionPool(keep_alive=False)
+        )
+
+        self.assertEqual(client.session.headers["Connection"], "close")
+
+    def test_should_group_the_pool_settings(self):
+        """
+        Test the pool keys of the setting are grouped in a ConnectionPool.
+        """
+        options = {"url": "http://meilisearch", "pool_size": 4}
+
+        self.assertEqual(
+            client_options(options),
+            {
+                "url": "http://meilisearch",
+                "pool": ConnectionPool(keep_alive=True, size=4),
+            },
+        )
+        self.assertIn("pool_size", options)
+
+
+class LazyClientTestCase(SimpleTestCase):
+    """
+    Test cases for the LazyClient class.
+    """
+
+    def setUp(self):
+        self.factory = mock.Mock(side_effect=lambda: mock.Mock())
+        self.client = LazyClient(self.factory)
+
+    def test_should_build_the_client_on_first_use(self):
+        """
+        Test the client is only built when an attribute is used.
+        """
+        self.factory.assert_not_called()
+
+        first = self.client.get_client()
+        self.client.get_indexes()
+
+        self.factory.assert_called_once()
+        self.assertIs(self.client.get_client(), first)
+        first.get_indexes.assert_called_once()
+
+    def test_should_build_a_client_in_each_process(self):
+        """
+        Test a forked process does not reuse the client of its parent.
+        """
+        parent = self.client.get_client()
+
+        with mock.patch("os.getpid", return_value=-1):
+            child = self.client.get_client()
+
+        self.assertIsNot(child, parent)
+        self.assertEqual(self.factory.call_count, 2)
+
+    def test_should_build_the_client_again_after_a_reset(self):
+        """
+        Test the client is built again after a reset.
+        """
+        first = self.client.get_client()
+        self.client.reset()
+
+        self.assertIsNot(self.client.get_client(), first)
@@ -0,0 +1,179 @@
+"""
+Test cases for the DocumentFields class.
+"""
+
+from django.db.models import Count, F
+from django.test import SimpleTestCase
+from rest_framework.serializers import ValidationError
+
+from django_meilisearch.exceptions import (
+    InvalidComputedFieldError,
+    InvalidRelatedFieldError,
+)
+from django_meilisearch.fields import ComputedField, DocumentFields
+from django_meilisearch.serializers import (
+    AnnotationField,
+    ComputedValueField,
+    RelatedPathField,
+    TimestampField,
+)
+from example.models import Comment, Post, Tag
+
+
+class DocumentFieldsTestCase(SimpleTestCase):
+    """
+    Test cases for the DocumentFields class.
+    """
+
+    def test_should_select_a_single_valued_relation(self):
+        """
+        Test a forward foreign key is loaded with select_related.
+        """
+        fields = DocumentFields(Comment, ["post__title"])
+
+        field = fields.serializer_fields["post__title"]
+        self.assertIsInstance(field, RelatedPathField)
+        self.assertFalse(field.many)
+        self.assertEqual(fields.query_plan.select_related, ["post"])
+        self.assertEqual(fields.query_plan.prefetch_related, [])
+
+    def test_should_prefetch_a_multi_valued_relation(self):
+        """
+        Test a reverse foreign key is loaded with prefetch_related.
+        """
+        fields = DocumentFields(Post, ["comments__author", "comments"])
+
+        self.assertTrue(fields.serializer_fields["comments__author"].many)
+        self.assertIsNone(fields.serializer_fields["comments"].leaf)
+        self.assertEqual(fields.query_plan.prefetch_related, ["comments"])
+        self.assertEqual(fields.query_plan.select_related, [])
+
+    def test_should_load_a_chain_once(self):
+        """
+        Test a relation already loaded by a longer chain is not loaded again.
+        """
+        fields = DocumentFields(
+            Comment,
+            ["post__title"],
+            {
+                "comments": ComputedField(
+                    lambda comment: comment.post.comments.count(),
+                    depends_on=["post__comments"],
+                ),
+            },
+        )
+
+        self.assertEqual(fields.query_plan.select_related, ["post"])
+        self.assertEqual(
+            fields.query_plan.prefetch_related, ["post__comments"]
+        )
+
+    def test_should_record_the_dependencies(self):
+        """
+        Test the lookups to every related model of a chain are recorded.
+        """
+        fields = DocumentFields(
+            Comment, ["post__title", "post__tags__name", "post__comments"]
+        )
+
+        self.assertEqual(
+            fields.dependencies,
+            {Post: ["post"], Tag: ["post__tags"], Comment: ["post__comments"]},
+        )
+        self.assertEqual(fields.through_models, {Tag.posts.through: Post})
+
+    def test_should_use_timestamps_for_related_datetimes(self):
+        """
+        Test the related datetimes follow the use_timestamp flag.
+        """
+        fields = DocumentFields(
+            Comment, ["post__created_at"], use_timestamp=True
+        )
+
+        leaf = fields.serializer_fields["post__created_at"].leaf
+        self.assertIsInstance(leaf, TimestampField)
+
+    def test_should_annotate_the_expressions(self):
+        """
+        Test the expressions are annotated and the functions are called.
+        """
+        count = Count("comments")
+        fields = DocumentFields(
+            Post,
+            computed_fields={
+                "comment_count": count,
+                "title_length": lambda post: len(post.title),
+            },
+        )
+
+        self.assertEqual(
+            fields.query_plan.annotations, {"comment_count": count}
+        )
+        self.assertIsInstance(
+            fields.serializer_fields["comment_count"], AnnotationField
+        )
+        self.assertIsInstance(
+            fields.serializer_fields["title_length"], ComputedValueField
+        )
+        self.assertEqual(fields.names, ["comment_count", "title_length"])
+
+    def test_should_not_need_a_query_without_relations(self):
+        """
+        Test functions without dependencies do not need another query.
+        """
+        fields = DocumentFields(Post, computed_fields={"one": lambda post: 1})
+
+        self.assertFalse(fields.needs_query)
+        self.assertTrue(
+            DocumentFields(
+                Post, computed_fields={"next_id": F("id") + 1}
+            ).needs_query
+        )
+
+    def test_should_reject_an_unknown_field(self):
+        """
+        Test a path through an unknown field is rejected.
+        """
+        with self.assertRaises(InvalidRelatedFieldError):
+            DocumentFields(Comment, ["post__unknown"])
+
+    def test_should_reject_a_path_without_relation(self):
+        """
+        Test a path must follow a relation and end with a field.
+        """
+        with self.assertRaises(InvalidRelatedFieldError):
+            DocumentFields(Post, ["title__length"])
+        with self.assertRaises(InvalidRelatedFieldError):
+            DocumentFields(Comment, ["post"])
+
+    def test_should_reject_an_invalid_computed_field(self):
+        """
+        Test the computed fields are expressions, functions or dependencies
+        through relations.
+        """
+        with self.assertRaises(InvalidComputedFieldError):
+            DocumentFields(Post, computed_fields={"one": 1})
+        with self.assertRaises(InvalidComputedFieldError):
+            DocumentFields(Post, computed_fields={"title": lambda post: 1})
+        with self.assertRaises(InvalidComputedFieldError):
+            DocumentFields(
+                Post,
+                computed_fields={
+                    "one": ComputedField(lambda post: 1, depends_on=["title"])
+                },
+            )
+
+    def test_should_not_deserialize_the_document_fields(self):
+        """
+        Test the related, computed and annotated fields are read-only.
+        """
+        fields = DocumentFields(
+            Comment,
+            ["post__title"],
+            {"length": lambda comment: 1, "count": Count("id")},
+        ).serializer_fields
+
+        for field in fields.values():
+            self.assertTrue(field.read_only)
+            with self.assertRaises(ValidationError):
+                field.to_internal_value(1)
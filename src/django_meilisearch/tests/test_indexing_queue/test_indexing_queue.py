@@ -0,0 +1,189 @@
+"""
+Test cases for the IndexingQueue class.
+"""
+
+from types import SimpleNamespace
+from unittest import mock
+
+from django.db import transaction
+from django.test import TestCase
+
+from django_meilisearch.indexing_queue import IndexingQueue
+from example.indexes import PostIndex
+from example.models import Post
+
+
+class IndexingQueueTestCase(TestCase):
+    """
+    Test cases for the IndexingQueue class.
+    """
+
+    def setUp(self):
+        self.queue = IndexingQueue(batch_size=100, flush_interval=None)
+        patcher = mock.patch.object(PostIndex, "get_index")
+        self.index = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.queue.flush)
+
+        self.index.add_documents.return_value = SimpleNamespace(task_uid=1)
+        self.index.delete_documents.return_value = SimpleNamespace(task_uid=2)
+
+    def test_should_queue_changes_on_commit(self):
+        """
+        Test the changes are only queued when the transaction commits.
+        """
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.queue.add(PostIndex, Post(id=1, title="a", content="a"))
+
+        self.assertEqual(len(self.queue), 0)
+        for callback in callbacks:
+            callback()
+        self.assertEqual(len(self.queue), 1)
+
+    def test_should_drop_rolled_back_changes(self):
+        """
+        Test the changes of a rolled back transaction are never queued.
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    self.queue.add(
+                        PostIndex, Post(id=1, title="a", content="a")
+                    )
+                    raise ValueError()
+            except ValueError:
+                pass
+
+        self.assertEqual(len(self.queue), 0)
+
+    def test_should_coalesce_changes_by_primary_key(self):
+        """
+        Test the last saved instance wins and a deletion wins over it.
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(10):
+                self.queue.add(PostIndex, Post(id=1, title=str(i), content=""))
+            self.queue.add(PostIndex, Post(id=2, title="a", content=""))
+            self.queue.remove(PostIndex, Post(id=2))
+            self.queue.add(PostIndex, Post(id=2, title="b", content=""))
+
+        self.assertEqual(len(self.queue), 2)
+        task_uids = self.queue.flush()
+
+        self.assertEqual(task_uids, [1, 2])
+        documents = self.index.add_documents.call_args.args[0]
+        self.assertEqual([doc["title"] for doc in documents], ["9"])
+        self.index.delete_documents.assert_called_once_with([2])
+        self.assertEqual(len(self.queue), 0)
+
+    def test_should_flush_when_full(self):
+        """
+        Test the queue is flushed in batches of `batch_size` changes.
+        """
+        self.queue.batch_size = 10
+
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(25):
+                self.queue.add(PostIndex, Post(id=i, title="a", content=""))
+
+        self.assertEqual(self.index.add_documents.call_count, 2)
+        self.assertEqual(len(self.queue), 5)
+
+    def test_should_flush_after_interval(self):
+        """
+        Test the queue is flushed once the flush interval is elapsed.
+        """
+        self.queue.flush_interval = 0.01
+
+        with mock.patch.object(self.queue, "flush") as flush:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.queue.add(PostIndex, Post(id=1, title="a", content=""))
+            self.queue._timer.join()  # pylint: disable=protected-access
+
+        flush.assert_called_once_with()
+
+    def test_should_requeue_the_changes_of_a_failed_flush(self):
+        """
+        Test the changes not sent by a failed flush are queued again, unless
+        a newer change of their document is pending.
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            self.queue.add(PostIndex, Post(id=1, title="a", content=""))
+            self.queue.add(PostIndex, Post(id=2, title="a", content=""))
+            self.queue.remove(PostIndex, Post(id=3))
+
+        self.index.add_documents.side_effect = ConnectionError()
+        with self.assertRaises(ConnectionError):
+            self.queue.flush()
+        self.index.delete_documents.assert_not_called()
+        self.assertEqual(len(self.queue), 3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.queue.add(PostIndex, Post(id=1, title="b", content=""))
+        self.index.add_documents.side_effect = None
+        self.queue.flush()
+
+        documents = self.index.add_documents.call_args.args[0]
+        self.assertCountEqual(
+            [(doc["id"], doc["title"]) for doc in documents],
+            [(1, "b"), (2, "a")],
+        )
+        self.index.delete_documents.assert_called_once_with([3])
+
+    def test_should_log_the_failure_of_a_timed_flush(self):
+        """
+        Test a flush failing in the timer thread is logged and retried.
+        """
+        self.queue.flush_interval = 0.01
+        self.index.add_documents.side_effect = [
+            ConnectionError(),
+            mock.DEFAULT,
+        ]
+
+        with self.assertLogs("django_meilisearch", "ERROR") as logs:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.queue.add(PostIndex, Post(id=1, title="a", content=""))
+            # pylint: disable-next=protected-access
+            while (timer := self.queue._timer) is not None:
+                timer.join()
+
+        self.assertIn("Flush of the indexing queue failed", logs.output[0])
+        self.assertEqual(self.index.add_documents.call_count, 2)
+        self.assertEqual(len(self.queue), 0)
+
+    def test_should_close_the_connections_of_the_timer_thread(self):
+        """
+        Test the timer thread closes its database connections once flushed.
+        """
+        self.queue.flush_interval = 0.01
+
+        with mock.patch(
+            "django_meilisearch.indexing_queue.connections"
+        ) as connections:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.queue.add(PostIndex, Post(id=1, title="a", content=""))
+            # pylint: disable-next=protected-access
+            while (timer := self.queue._timer) is not None:
+                timer.join()
+
+        self.index.add_documents.assert_called_once()
+        connections.close_all.assert_called_once_with()
+
+    def test_should_log_the_failure_of_the_flush_at_exit(self):
+        """
+        Test a flush failing when the interpreter exits is logged with the
+        number of changes lost, instead of raising.
+        """
+        self.queue.flush_interval = 60
+        with self.captureOnCommitCallbacks(execute=True):
+            self.queue.add(PostIndex, Post(id=1, title="a", content=""))
+            self.queue.remove(PostIndex, Post(id=2))
+        self.index.add_documents.side_effect = ConnectionError()
+
+        # pylint: disable=protected-access
+        with self.assertLogs("django_meilisearch", "ERROR") as logs:
+            self.queue._flush_at_exit()
+
+        self.assertIn("2 change(s) lost", logs.output[0])
+        self.assertIsNone(self.queue._timer)
+        self.index.add_documents.side_effect = None
@@ -0,0 +1,303 @@
+"""
+Test cases for the instrumentation of the indexes.
+"""
+
+import contextvars
+import logging
+import threading
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from django_meilisearch.clients import record_response
+from django_meilisearch.instrumentation import (
+    Instrumentation,
+    LoggingSink,
+    MetricsCollector,
+    OperationCounts,
+    OperationEvent,
+    SignalSink,
+    operation,
+    operation_finished,
+    record_documents,
+    record_request,
+)
+from example.indexes import PostIndex, PostIndexWithInstrumentation
+
+
+class RecordingSink:  # pylint: disable=too-few-public-methods
+    """
+    Sink keeping the events it receives.
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event):
+        """
+        Keep an event.
+        """
+        self.events.append(event)
+
+
+class OperationTestCase(SimpleTestCase):
+    """
+    Test cases for the operation context manager.
+    """
+
+    def setUp(self):
+        self.sink = RecordingSink()
+        self.instrumentation = Instrumentation([self.sink])
+
+    def test_should_emit_the_measures_of_an_operation(self):
+        """
+        Test the requests and documents of an operation are counted.
+        """
+        with operation("search", "posts", self.instrumentation):
+            record_request(10, 200)
+            record_documents(3)
+
+        [event] = self.sink.events
+        self.assertEqual(event.operation, "search")
+        self.assertEqual(event.index_name, "posts")
+        self.assertEqual(event.counts.round_trips, 1)
+        self.assertEqual(event.counts.bytes_sent, 10)
+        self.assertEqual(event.counts.bytes_received, 200)
+        self.assertEqual(event.counts.documents, 3)
+        self.assertGreater(event.duration, 0)
+
+    def test_should_count_the_children_in_their_parent(self):
+        """
+        Test a child operation is emitted and counted by its parent.
+        """
+        with operation("populate", "posts", self.instrumentation):
+            with operation("add_documents") as child:
+                record_request(100, 20, task_uid=7)
+            record_request(0, 50)
+
+        self.assertEqual(child.parent, "populate")
+        self.assertEqual(child.index_name, "posts")
+        self.assertEqual(child.task_uids, [7])
+
+        parent = self.sink.events[-1]
+        self.assertEqual(
+            [e.operation for e in self.sink.events],
+            ["add_documents", "populate"],
+        )
+        self.assertEqual(parent.counts.round_trips, 2)
+        self.assertEqual(parent.task_uids, [7])
+
+    def test_should_not_measure_orphan_children(self):
+        """
+        Test a child operation without parent is not measured.
+        """
+        with operation("wait_tasks") as event:
+            record_request(1, 1)
+
+        self.assertIsNone(event)
+
+    def test_should_record_the_errors(self):
+        """
+        Test a failed operation is emitted with its error.
+        """
+        with self.assertRaises(ValueError):
+            with operation("search", "posts", self.instrumentation):
+                raise ValueError("boom")
+
+        self.assertEqual(self.sink.events[0].error, "ValueError('boom')")
+
+    def test_should_measure_the_threads_of_the_context(self):
+        """
+        Test the requests of a thread running in a copy of the context are
+        counted.
+        """
+        with operation("populate", "posts", self.instrumentation) as event:
+            thread = threading.Thread(
+                target=contextvars.copy_context().run,
+                args=(record_request, 5, 5),
+            )
+            thread.start()
+            thread.join()
+
+        self.assertEqual(event.counts.round_trips, 1)
+
+    def test_should_ignore_the_failures_of_the_sinks(self):
+        """
+        Test a failing sink neither fails the operation nor the other sinks.
+        """
+        broken = mock.Mock()
+        broken.emit.side_effect = RuntimeError()
+        instrumentation = Instrumentation([broken, self.sink])
+
+        with self.assertLogs("django_meilisearch", logging.ERROR):
+            with operation("search", "posts", instrumentation):
+                pass
+
+        self.assertEqual(len(self.sink.events), 1)
+
+
+class InstrumentedIndexTestCase(SimpleTestCase):
+    """
+    Test cases for the instrumented methods of the indexes.
+    """
+
+    def setUp(self):
+        self.metrics = PostIndexWithInstrumentation.instrumentation.sinks[0]
+        self.metrics.reset()
+
+        patcher = mock.patch.object(PostIndexWithInstrumentation, "get_index")
+        self.index = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+    def test_should_measure_the_searches(self):
+        """
+        Test a search emits an event with its number of hits.
+        """
+        self.index.search.return_value = {"hits": [{"id": 1}, {"id": 2}]}
+
+        PostIndexWithInstrumentation.search("term")
+
+        search = self.metrics.get(PostIndexWithInstrumentation.name, "search")
+        self.assertEqual(search["operations"], 1)
+        self.assertEqual(search["documents"], 2)
+
+    def test_should_measure_the_nested_calls_once(self):
+        """
+        Test a method called by another one is counted by the caller only.
+        """
+        self.index.delete_document.return_value = SimpleNamespace(task_uid=1)
+        task = SimpleNamespace(uid=1, status="succeeded")
+
+        with mock.patch(
+            "django_meilisearch.indexes.client.get_task", return_value=task
+        ), mock.patch.object(
+            PostIndexWithInstrumentation.task_waiter,
+            "_poll",
+            return_value=[task],
+        ):
+            PostIndexWithInstrumentation.remove_single_document(
+                SimpleNamespace(pk=1)
+            )
+
+        name = PostIndexWithInstrumentation.name
+        self.assertEqual(
+            self.metrics.get(name, "remove_single_document")["documents"], 1
+        )
+        self.assertEqual(self.metrics.get(name, "aremove_single_document"), {})
+        self.assertEqual(self.metrics.get(name, "wait_tasks")["tasks"], 1)
+
+    def test_should_not_measure_the_indexes_without_instrumentation(self):
+        """
+        Test the indexes without instrumentation emit nothing.
+        """
+        with mock.patch.object(PostIndex, "get_index") as get_index:
+            get_index.return_value.search.return_value = {"hits": []}
+            PostIndex.search("term")
+
+        self.assertEqual(self.metrics.get(PostIndex.name, "search"), {})
+
+
+class RecordResponseTestCase(SimpleTestCase):
+    """
+    Test cases for the response hook of the Client class.
+    """
+
+    def response(self, status_code, body, content):
+        """
+        Build a response of the requests library.
+        """
+        response = mock.Mock(status_code=status_code, content=content)
+        response.request.body = body
+        response.json.return_value = {"taskUid": 42}
+        return response
+
+    def test_should_record_the_responses_of_the_operations(self):
+        """
+        Test the sizes and the task of a response are recorded.
+        """
+        sink = RecordingSink()
+        with operation("add", "posts", Instrumentation([sink])):
+            record_response(self.response(202, '[{"id": 1}]', b"{}" * 10))
+
+        event = sink.events[0]
+        self.assertEqual(event.counts.bytes_sent, 11)
+        self.assertEqual(event.counts.bytes_received, 20)
+        self.assertEqual(event.task_uids, [42])
+
+    def test_should_skip_the_responses_outside_operations(self):
+        """
+        Test a response outside any operation is not decoded.
+        """
+        response = self.response(202, None, b"")
+
+        record_response(response)
+
+        response.json.assert_not_called()
+
+
+class SinksTestCase(SimpleTestCase):
+    """
+    Test cases for the sinks.
+    """
+
+    def setUp(self):
+        self.event = OperationEvent(
+            "search",
+            "posts",
+            duration=0.02,
+            counts=OperationCounts(documents=3, round_trips=1),
+        )
+
+    def test_should_log_the_events(self):
+        """
+        Test the LoggingSink logs the events with their fields.
+        """
+        with self.assertLogs("django_meilisearch", logging.INFO) as logs:
+            LoggingSink().emit(self.event)
+
+        self.assertIn("posts search: 20.0ms, 3 documents", logs.output[0])
+        self.assertEqual(
+            logs.records[0].meilisearch_event["operation"], "search"
+        )
+
+    def test_should_send_the_signal(self):
+        """
+        Test the SignalSink sends the operation_finished signal.
+        """
+        receiver = mock.Mock()
+        operation_finished.connect(receiver)
+        self.addCleanup(operation_finished.disconnect, receiver)
+
+        SignalSink().emit(self.event)
+
+        receiver.assert_called_once_with(
+            signal=operation_finished, sender="posts", event=self.event
+        )
+
+    def test_should_render_the_metrics(self):
+        """
+        Test the MetricsCollector renders the OpenMetrics text format.
+        """
+        metrics = MetricsCollector(buckets=[0.01, 0.1])
+        metrics.emit(self.event)
+        metrics.emit(OperationEvent("search", "posts", 0.5, error="Error()"))
+
+        text = metrics.render()
+
+        labels = 'index="posts",operation="search"'
+        self.assertIn(
+            f"django_meilisearch_operations_total{{{labels}}} 2", text
+        )
+        self.assertIn(f"django_meilisearch_errors_total{{{labels}}} 1", text)
+        self.assertIn(
+            "django_meilisearch_operation_duration_seconds_bucket"
+            f'{{{labels},le="0.1"}} 1',
+            text,
+        )
+        self.assertIn(
+            "django_meilisearch_operation_duration_seconds_bucket"
+            f'{{{labels},le="+Inf"}} 2',
+            text,
+        )
+        self.assertTrue(text.endswith("# EOF\n"))
@@ -0,0 +1,237 @@
+"""
+Test cases for the OutboxWorker class.
+"""
+
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+from meilisearch.models.task import Task
+
+from django_meilisearch.changes import ADD, REMOVE, record_changes
+from django_meilisearch.models import OutboxEntry
+from django_meilisearch.outbox import OutboxWorker
+from example.indexes import PostIndex, PostIndexWithOutbox
+
+
+class OutboxWorkerTestCase(TestCase):
+    """
+    Test cases for the OutboxWorker class.
+    """
+
+    def setUp(self):
+        self.worker = OutboxWorker(batch_size=100, max_attempts=3)
+
+        self.patched = {}
+        for name in ("aremove_documents", "areindex_documents"):
+            patcher = mock.patch.object(PostIndexWithOutbox, name)
+            self.patched[name] = patcher.start()
+            self.patched[name].return_value = [SimpleNamespace(uid=1)]
+            self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(
+            PostIndexWithOutbox.task_waiter, "wait_many"
+        )
+        self.wait_many = patcher.start()
+        self.wait_many.side_effect = lambda task_uids: [
+            mock.Mock(spec=Task, uid=uid, status="succeeded")
+            for uid in task_uids
+        ]
+        self.addCleanup(patcher.stop)
+
+    def record(self, keys, operation, index_cls=PostIndexWithOutbox):
+        """
+        Write changes of an index to the outbox.
+        """
+        record_changes(index_cls, keys, operation, "default")
+
+    def test_should_merge_changes_by_primary_key(self):
+        """
+        Test the last change of each document wins, with a single request
+        per operation.
+        """
+        self.record([1, 1, 2], ADD)
+        self.record([2], REMOVE)
+        self.record([3], ADD)
+
+        stats = self.worker.drain()
+
+        self.assertEqual((stats.sent, stats.failed), (5, 0))
+        self.assertTrue(stats.drained)
+        self.patched["areindex_documents"].assert_called_once_with([1, 3])
+        self.patched["aremove_documents"].assert_called_once_with([2])
+        self.assertFalse(OutboxEntry.objects.exists())
+
+    def test_should_read_batches_oldest_first(self):
+        """
+        Test a drain reads at most `batch_size` changes, the oldest first.
+        """
+        self.worker.batch_size = 2
+        self.record([1, 2, 3], ADD)
+
+        stats = self.worker.drain()
+
+        self.assertFalse(stats.drained)
+        self.patched["areindex_documents"].assert_called_once_with([1, 2])
+        self.assertEqual(
+            list(OutboxEntry.objects.values_list("key", flat=True)), [3]
+        )
+
+    def test_should_retry_failed_changes_with_backoff(self):
+        """
+        Test the failed changes are kept and retried after a growing delay.
+        """
+        self.patched["areindex_documents"].side_effect = ConnectionError()
+        self.record([1], ADD)
+
+        before = timezone.now()
+        stats = self.worker.drain()
+
+        self.assertEqual((stats.sent, stats.failed), (0, 1))
+        entry = OutboxEntry.objects.get()
+        self.assertEqual(entry.attempts, 1)
+        self.assertIn("ConnectionError", entry.last_error)
+        self.assertGreaterEqual(
+            entry.available_at, before + timedelta(seconds=1)
+        )
+        self.assertEqual(self.worker.drain().failed, 0)
+
+        OutboxEntry.objects.update(available_at=timezone.now())
+        self.worker.drain()
+
+        entry.refresh_from_db()
+        self.assertEqual(entry.attempts, 2)
+        self.assertGreaterEqual(
+            entry.available_at, before + timedelta(seconds=2)
+        )
+
+    def test_should_fail_on_failed_tasks(self):
+        """
+        Test the changes whose task failed are retried.
+        """
+        self.wait_many.side_effect = lambda task_uids: [
+            mock.Mock(spec=Task, uid=uid, status="failed", error={})
+            for uid in task_uids
+        ]
+        self.record([1], ADD)
+
+        stats = self.worker.drain()
+
+        self.assertEqual(stats.failed, 1)
+        self.assertIn("OutboxTaskError", OutboxEntry.objects.get().last_error)
+
+    def test_should_supersede_the_changes_waiting_for_a_retry(self):
+        """
+        Test the newer change of a document is sent with its older changes
+        waiting for a retry, instead of waiting behind them.
+        """
+        self.record([1], ADD)
+        OutboxEntry.objects.update(
+            attempts=1, available_at=timezone.now() + timedelta(minutes=1)
+        )
+        self.record([1], REMOVE)
+        self.record([2], ADD)
+
+        stats = self.worker.drain()
+
+        self.assertEqual(stats.sent, 3)
+        self.patched["areindex_documents"].assert_called_once_with([2])
+        self.patched["aremove_documents"].assert_called_once_with([1])
+        self.assertFalse(OutboxEntry.objects.exists())
+
+    def test_should_lock_the_changes_it_sends(self):
+        """
+        Test the changes are read with `SELECT ... FOR UPDATE SKIP LOCKED`,
+        so the workers draining the same outbox send different changes.
+        """
+        self.record([1], ADD)
+
+        with mock.patch(
+            "django.db.models.QuerySet.select_for_update",
+            autospec=True,
+            side_effect=lambda queryset, **kwargs: queryset,
+        ) as select_for_update:
+            self.worker.drain()
+
+        self.assertTrue(select_for_update.call_args_list)
+        for call in select_for_update.call_args_list:
+            self.assertEqual(call.kwargs, {"skip_locked": True})
+
+    def test_should_leave_the_documents_locked_by_another_worker(self):
+        """
+        Test a document with a change locked by another worker is left to
+        it.
+        """
+        self.record([1, 2], ADD)
+        locked = OutboxEntry.objects.filter(key=1).first().id
+        self.record([1], REMOVE)
+
+        def skip_locked(queryset, **kwargs):
+            return queryset.exclude(id=locked)
+
+        with mock.patch(
+            "django.db.models.QuerySet.select_for_update",
+            autospec=True,
+            side_effect=skip_locked,
+        ):
+            stats = self.worker.drain()
+
+        self.assertEqual(stats.sent, 1)
+        self.patched["areindex_documents"].assert_called_once_with([2])
+        self.patched["aremove_documents"].assert_not_called()
+        self.assertEqual(OutboxEntry.objects.filter(key=1).count(), 2)
+
+    def test_should_give_up_after_max_attempts(self):
+        """
+        Test the changes failed `max_attempts` times are counted, logged and
+        kept but no longer sent.
+        """
+        self.patched["areindex_documents"].side_effect = ConnectionError()
+        self.record([1], ADD)
+        OutboxEntry.objects.update(attempts=2)
+
+        with self.assertLogs("django_meilisearch", "ERROR"):
+            stats = self.worker.drain()
+
+        self.assertEqual((stats.failed, stats.given_up), (1, 1))
+        self.assertEqual(
+            list(self.worker.given_up()), [OutboxEntry.objects.get()]
+        )
+
+        OutboxEntry.objects.update(available_at=timezone.now())
+        stats = self.worker.drain()
+
+        self.assertEqual((stats.sent, stats.failed), (0, 0))
+        self.assertEqual(self.patched["areindex_documents"].call_count, 1)
+        self.assertTrue(OutboxEntry.objects.exists())
+
+    def test_should_only_drain_its_indexes(self):
+        """
+        Test a worker of some indexes leaves the changes of the others.
+        """
+        worker = OutboxWorker(indexes=[PostIndexWithOutbox])
+        self.record([1], ADD)
+        self.record([1], ADD, index_cls=PostIndex)
+
+        stats = worker.drain()
+
+        self.assertEqual(stats.sent, 1)
+        self.assertEqual(
+            list(OutboxEntry.objects.values_list("index_name", flat=True)),
+            [PostIndex.name],
+        )
+
+    def test_should_drop_changes_of_unknown_indexes(self):
+        """
+        Test the changes of an index which no longer exists are dropped.
+        """
+        OutboxEntry.objects.create(
+            index_name="removed_index", key=1, operation=ADD
+        )
+
+        stats = self.worker.drain()
+
+        self.assertEqual((stats.sent, stats.failed), (0, 0))
+        self.assertFalse(OutboxEntry.objects.exists())
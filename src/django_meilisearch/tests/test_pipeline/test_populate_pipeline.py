@@ -0,0 +1,86 @@
+"""
+Test cases for the PopulatePipeline class.
+"""
+
+import threading
+
+from django.test import TestCase
+
+from django_meilisearch.pipeline import PopulatePipeline
+
+
+class PopulatePipelineTestCase(TestCase):
+    """
+    Test cases for the PopulatePipeline class.
+    """
+
+    def setUp(self):
+        self.pipeline = PopulatePipeline(
+            serialize_workers=3,
+            serialize_queue_size=1,
+            upload_queue_size=1,
+        )
+
+    def test_should_return_task_uids_in_batch_order(self):
+        """
+        Test the task UIDs are returned in the order of the batches.
+        """
+        batches = [[i] * 3 for i in range(20)]
+
+        task_uids = self.pipeline.run(
+            batches,
+            lambda batch: [{"id": item} for item in batch],
+            lambda documents: documents[0]["id"] * 10,
+        )
+
+        self.assertEqual(task_uids, [i * 10 for i in range(20)])
+
+    def test_should_bound_the_number_of_batches_in_flight(self):
+        """
+        Test the reader is blocked while the uploader is blocked.
+        """
+        read = []
+        release = threading.Event()
+
+        def batches():
+            for i in range(50):
+                read.append(i)
+                yield [i]
+
+        def upload(documents):
+            release.wait()
+            return documents[0]
+
+        thread = threading.Thread(
+            target=self.pipeline.run, args=(batches(), list, upload)
+        )
+        thread.start()
+        thread.join(0.5)
+        in_flight = len(read)
+        release.set()
+        thread.join()
+
+        # serialize queue + serializers + upload queue + uploader + reader
+        self.assertLessEqual(in_flight, 1 + 3 + 1 + 1 + 1)
+        self.assertEqual(len(read), 50)
+
+    def test_should_raise_the_error_of_a_stage(self):
+        """
+        Test an error in a stage stops the pipeline and is raised.
+        """
+        read = []
+
+        def batches():
+            for i in range(1000):
+                read.append(i)
+                yield [i]
+
+        def upload(documents):
+            if documents[0] == 3:
+                raise ValueError("upload failed")
+            return documents[0]
+
+        with self.assertRaisesMessage(ValueError, "upload failed"):
+            self.pipeline.run(batches(), list, upload)
+
+        self.assertLess(len(read), 1000)
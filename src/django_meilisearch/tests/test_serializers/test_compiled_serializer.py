@@ -0,0 +1,124 @@
+"""
+Test cases for the CompiledSerializer class.
+"""
+
+from django.test import TestCase
+from rest_framework.serializers import ModelSerializer
+
+from django_meilisearch.exceptions import (
+    InvalidComputedFieldError,
+    InvalidRelatedFieldError,
+)
+from django_meilisearch.fields import DocumentFields
+from django_meilisearch.serializers import CompiledSerializer
+from example.indexes import (
+    CommentIndex,
+    PostIndex,
+    PostIndexWithRelatedFields,
+    PostIndexWithUseTimestamp,
+)
+from example.models import Comment, Post
+
+
+class TestCompiledSerializer(TestCase):
+    """
+    Test cases for the CompiledSerializer class.
+    """
+
+    fixtures = ["posts.json"]
+
+    def assert_same_documents(self, serializer_class):
+        """
+        Assert the compiled serializer matches the DRF serializer.
+        """
+        compiled = CompiledSerializer(serializer_class)
+        posts = Post.objects.order_by("id")
+
+        expected = serializer_class(posts, many=True).data
+        documents = compiled.to_documents(compiled.rows(posts))
+
+        self.assertEqual(len(documents), len(expected))
+        for document, expected_document in zip(documents, expected):
+            self.assertEqual(list(document), list(expected_document))
+            self.assertEqual(document, dict(expected_document))
+
+    def test_columns(self):
+        """
+        Test the columns follow the serializer fields.
+        """
+        compiled = CompiledSerializer(PostIndex.serializer)
+
+        self.assertEqual(
+            compiled.columns, ["id", "title", "content", "created_at"]
+        )
+
+    def test_same_documents_as_model_serializer(self):
+        """
+        Test the documents are equal to the ModelSerializer ones.
+        """
+        self.assert_same_documents(PostIndex.serializer)
+
+    def test_same_documents_as_model_serializer_with_timestamp(self):
+        """
+        Test the documents are equal to the ones using TimestampField.
+        """
+        self.assert_same_documents(PostIndexWithUseTimestamp.serializer)
+
+    def test_null_values(self):
+        """
+        Test null values are not converted.
+        """
+        compiled = CompiledSerializer(PostIndexWithUseTimestamp.serializer)
+
+        documents = compiled.to_documents([(1, "title", "content", None)])
+
+        self.assertEqual(
+            documents,
+            [
+                {
+                    "id": 1,
+                    "title": "title",
+                    "content": "content",
+                    "created_at": None,
+                }
+            ],
+        )
+
+    def test_single_valued_related_field(self):
+        """
+        Test a single-valued related path is read as a joined column.
+        """
+        fields = DocumentFields(Comment, ["post__title"])
+        meta = type(
+            "Meta",
+            (),
+            {"model": Comment, "fields": ["id", "post", "post__title"]},
+        )
+        compiled = CompiledSerializer(
+            type(
+                "CommentSerializer",
+                (ModelSerializer,),
+                {"Meta": meta, **fields.serializer_fields},
+            )
+        )
+
+        self.assertEqual(
+            compiled.columns,
+            ["id", "post", "post__title"],
+        )
+        self.assertEqual(
+            compiled.to_documents([(1, 2, "title"), (3, 4, None)]),
+            [
+                {"id": 1, "post": 2, "post__title": "title"},
+                {"id": 3, "post": 4, "post__title": None},
+            ],
+        )
+
+    def test_unsupported_document_fields(self):
+        """
+        Test the multi-valued related paths and the functions are rejected.
+        """
+        with self.assertRaises(InvalidRelatedFieldError):
+            CompiledSerializer(PostIndexWithRelatedFields.serializer)
+        with self.assertRaises(InvalidComputedFieldError):
+            CompiledSerializer(CommentIndex.serializer)
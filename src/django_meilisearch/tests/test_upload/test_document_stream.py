@@ -0,0 +1,93 @@
+"""
+Test cases for the DocumentStream class.
+"""
+
+import json
+import zlib
+
+from django.test import SimpleTestCase
+
+from django_meilisearch.upload import DocumentStream
+
+
+class DocumentStreamTestCase(SimpleTestCase):
+    """
+    Test cases for the DocumentStream class.
+    """
+
+    chunks = [
+        [{"id": 1, "title": "Café"}, {"id": 2, "title": "Thé"}],
+        [{"id": 3, "title": "Eau"}],
+    ]
+
+    def decode(self, body):
+        """
+        Decode an NDJSON body.
+        """
+        return [json.loads(line) for line in body.decode().splitlines()]
+
+    def test_should_encode_the_documents_as_ndjson(self):
+        """
+        Test the uncompressed body holds one document per line.
+        """
+        stream = DocumentStream(self.chunks, compression=None)
+
+        body = b"".join(stream)
+
+        self.assertEqual(self.decode(body), [*self.chunks[0], *self.chunks[1]])
+        self.assertEqual(
+            stream.headers, {"Content-Type": "application/x-ndjson"}
+        )
+        self.assertEqual(stream.documents, 3)
+        self.assertEqual(stream.payload_bytes, len(body))
+        self.assertEqual(stream.bytes_sent, len(body))
+
+    def test_should_compress_the_body_with_gzip(self):
+        """
+        Test the gzip body is decompressed to the NDJSON documents.
+        """
+        stream = DocumentStream(self.chunks, compression="gzip")
+
+        body = b"".join(stream)
+
+        self.assertEqual(
+            self.decode(zlib.decompress(body, 16 + zlib.MAX_WBITS)),
+            [*self.chunks[0], *self.chunks[1]],
+        )
+        self.assertEqual(stream.headers["Content-Encoding"], "gzip")
+        self.assertEqual(stream.bytes_sent, len(body))
+        self.assertEqual(
+            stream.payload_bytes,
+            len(zlib.decompress(body, 16 + zlib.MAX_WBITS)),
+        )
+
+    def test_should_compress_the_body_with_deflate(self):
+        """
+        Test the deflate body is decompressed to the NDJSON documents.
+        """
+        body = b"".join(DocumentStream(self.chunks, compression="deflate"))
+
+        self.assertEqual(len(self.decode(zlib.decompress(body))), 3)
+
+    def test_should_encode_the_chunks_lazily(self):
+        """
+        Test a chunk is only read when the body reaches it.
+        """
+        read = []
+
+        def chunks():
+            for chunk in self.chunks:
+                read.append(chunk)
+                yield chunk
+
+        body = iter(DocumentStream(chunks(), compression=None))
+        next(body)
+
+        self.assertEqual(len(read), 1)
+
+    def test_should_reject_unknown_compressions(self):
+        """
+        Test an unsupported compression raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            DocumentStream(self.chunks, compression="br")
@@ -0,0 +1,63 @@
+"""
+Test cases for the diff_settings function.
+"""
+
+from django.test import TestCase
+
+from django_meilisearch.utils import diff_settings
+
+
+class DiffSettingsTestCase(TestCase):
+    """
+    Test cases for the diff_settings function.
+    """
+
+    def test_should_return_nothing_for_equal_settings(self):
+        """
+        Test the function returns no change for equal settings.
+        """
+        current = {
+            "searchableAttributes": ["title", "content"],
+            "filterableAttributes": ["content", "id"],
+            "displayedAttributes": ["*"],
+        }
+        desired = {
+            "searchableAttributes": ["title", "content"],
+            "filterableAttributes": ["id", "content"],
+        }
+
+        self.assertEqual(diff_settings(current, desired), {})
+
+    def test_should_compare_searchable_attributes_in_order(self):
+        """
+        Test the order of the searchable attributes is a change.
+        """
+        current = {"searchableAttributes": ["title", "content"]}
+        desired = {"searchableAttributes": ["content", "title"]}
+
+        self.assertEqual(
+            diff_settings(current, desired),
+            {
+                "searchableAttributes": {
+                    "old": ["title", "content"],
+                    "new": ["content", "title"],
+                }
+            },
+        )
+
+    def test_should_return_the_changed_settings(self):
+        """
+        Test the function returns the old and new values of the changes.
+        """
+        current = {"sortableAttributes": ["id"]}
+        desired = {"sortableAttributes": ["id", "title"]}
+
+        self.assertEqual(
+            diff_settings(current, desired),
+            {
+                "sortableAttributes": {
+                    "old": ["id"],
+                    "new": ["id", "title"],
+                }
+            },
+        )
@@ -0,0 +1,59 @@
+"""
+Test cases for the iterate_in_batches function.
+"""
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from django_meilisearch.utils import iterate_in_batches
+from example.models import Post
+
+
+class IterateInBatchesTestCase(TestCase):
+    """
+    Test cases for the iterate_in_batches function.
+    """
+
+    fixtures = ["posts.json"]
+
+    def test_should_yield_every_row_once_in_key_order(self):
+        """
+        Test the function yields every row exactly once, ordered by the key.
+        """
+        batches = list(iterate_in_batches(Post.objects.all(), "id", 10))
+
+        ids = [post.id for batch in batches for post in batch]
+
+        self.assertEqual(len(batches), 5)
+        self.assertEqual(
+            ids, sorted(Post.objects.values_list("id", flat=True))
+        )
+
+    def test_should_yield_a_smaller_last_batch(self):
+        """
+        Test the function yields the remaining rows in the last batch.
+        """
+        batches = list(iterate_in_batches(Post.objects.all(), "id", 15))
+
+        self.assertEqual([len(batch) for batch in batches], [15, 15, 15, 5])
+
+    def test_should_not_use_offset_queries(self):
+        """
+        Test the function paginates with the key instead of OFFSET.
+        """
+        with CaptureQueriesContext(connection) as context:
+            list(iterate_in_batches(Post.objects.all(), "id", 10))
+
+        sqls = [query["sql"] for query in context.captured_queries]
+
+        self.assertTrue(all("OFFSET" not in sql for sql in sqls))
+        self.assertTrue(all('"id" >' in sql for sql in sqls[1:]))
+
+    def test_should_yield_nothing_for_an_empty_queryset(self):
+        """
+        Test the function yields no batch for an empty queryset.
+        """
+        batches = list(iterate_in_batches(Post.objects.none(), "id", 10))
+
+        self.assertEqual(batches, [])
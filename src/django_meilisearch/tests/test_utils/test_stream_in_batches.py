@@ -0,0 +1,54 @@
+"""
+Test cases for the stream_in_batches function.
+"""
+
+from django.test import TestCase
+
+from django_meilisearch.utils import stream_in_batches
+from example.models import Post
+
+
+class StreamInBatchesTestCase(TestCase):
+    """
+    Test cases for the stream_in_batches function.
+    """
+
+    def setUp(self):
+        # bulk_create does not send the signals indexing the posts
+        Post.objects.bulk_create(
+            Post(title=f"Post {i}", content="itaque") for i in range(25)
+        )
+
+    def test_should_stream_every_row_once_in_key_order(self):
+        """
+        Test the batches hold every row exactly once, ordered by the key.
+        """
+        batches = [
+            [post.id for chunk in chunks for post in chunk]
+            for chunks in stream_in_batches(
+                Post.objects.all(), "id", 10, chunk_size=4
+            )
+        ]
+
+        ids = [key for batch in batches for key in batch]
+
+        self.assertEqual([len(batch) for batch in batches], [10, 10, 5])
+        self.assertEqual(
+            ids, sorted(Post.objects.values_list("id", flat=True))
+        )
+
+    def test_should_read_the_rows_by_chunks(self):
+        """
+        Test the rows of a batch are yielded in chunks of chunk_size rows.
+        """
+        chunks = next(stream_in_batches(Post.objects.all(), "id", 10, 4))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [4, 4, 2])
+
+    def test_should_yield_nothing_for_an_empty_queryset(self):
+        """
+        Test the function yields no batch for an empty queryset.
+        """
+        batches = list(stream_in_batches(Post.objects.none(), "id", 10))
+
+        self.assertEqual(batches, [])
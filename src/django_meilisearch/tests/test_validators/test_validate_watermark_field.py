@@ -0,0 +1,30 @@
+from django.db import models
+from django.test import TestCase
+
+from django_meilisearch.validators import validate_watermark_field
+from django_meilisearch.exceptions import InvalidWatermarkFieldError
+
+
+class TestValidateWatermarkField(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        class WatermarkFieldPostModel(models.Model):
+            title = models.CharField(max_length=100)
+            content = models.TextField()
+            updated_at = models.DateTimeField(auto_now=True)
+
+        cls.model = WatermarkFieldPostModel
+
+    def test_missing_watermark_field(self):
+        validate_watermark_field(self.model, None)
+
+    def test_non_string_watermark_field_argument(self):
+        with self.assertRaises(InvalidWatermarkFieldError):
+            validate_watermark_field(self.model, ["updated_at"])
+
+    def test_existing_watermark_field(self):
+        validate_watermark_field(self.model, "updated_at")
+
+    def test_non_existing_watermark_field(self):
+        with self.assertRaises(InvalidWatermarkFieldError):
+            validate_watermark_field(self.model, "invalid_field")
@@ -0,0 +1,161 @@
+"""
+Test cases for the TaskWaiter class.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import TestCase
+
+from django_meilisearch.exceptions import TaskNotFoundError, TaskTimeoutError
+from django_meilisearch.indexes import BaseIndex
+from django_meilisearch.waiter import TaskWaiter, WaitStats
+from example.indexes import CommentIndex, PostIndex
+
+
+def make_task(uid, status):
+    """Build a fake Meilisearch task."""
+    return SimpleNamespace(uid=uid, status=status)
+
+
+class TaskWaiterTestCase(TestCase):
+    """
+    Test cases for the TaskWaiter class.
+    """
+
+    def setUp(self):
+        self.waiter = TaskWaiter(initial_interval=0, max_interval=0)
+
+    @mock.patch("django_meilisearch.waiter.client")
+    def test_should_poll_a_single_task_until_it_finishes(self, client):
+        """
+        Test the waiter polls a single task until it is finished.
+        """
+        client.get_task.side_effect = [
+            make_task(1, "enqueued"),
+            make_task(1, "processing"),
+            make_task(1, "succeeded"),
+        ]
+
+        task = self.waiter.wait(1)
+
+        self.assertEqual(task.status, "succeeded")
+        self.assertEqual(client.get_task.call_count, 3)
+        self.assertEqual(self.waiter.last_stats.polls, 3)
+        self.assertEqual(self.waiter.last_stats.task_uids, [1])
+
+    @mock.patch("django_meilisearch.waiter.client")
+    def test_should_poll_many_tasks_with_a_single_request(self, client):
+        """
+        Test the waiter polls several tasks with one request per round.
+        """
+        client.get_tasks.side_effect = [
+            SimpleNamespace(
+                results=[
+                    make_task(1, "succeeded"),
+                    make_task(2, "enqueued"),
+                    make_task(3, "processing"),
+                ]
+            ),
+            SimpleNamespace(
+                results=[make_task(2, "failed"), make_task(3, "succeeded")]
+            ),
+        ]
+
+        tasks = self.waiter.wait_many([3, 2, 1])
+
+        self.assertEqual([task.uid for task in tasks], [3, 2, 1])
+        self.assertEqual(
+            [task.status for task in tasks],
+            ["succeeded", "failed", "succeeded"],
+        )
+        self.assertEqual(client.get_tasks.call_count, 2)
+        self.assertEqual(
+            client.get_tasks.call_args_list[0].args[0]["uids"], ["1", "2", "3"]
+        )
+        self.assertEqual(
+            client.get_tasks.call_args_list[1].args[0]["uids"], ["2", "3"]
+        )
+        self.assertEqual(self.waiter.last_stats.polls, 2)
+
+    @mock.patch("django_meilisearch.waiter.time.sleep")
+    @mock.patch("django_meilisearch.waiter.client")
+    def test_should_back_off_between_polls(self, client, sleep):
+        """
+        Test the interval between polls grows up to the maximum interval.
+        """
+        client.get_task.side_effect = [make_task(1, "enqueued")] * 4 + [
+            make_task(1, "succeeded")
+        ]
+        waiter = TaskWaiter(
+            initial_interval=0.1, max_interval=0.3, backoff_factor=2
+        )
+
+        waiter.wait(1)
+
+        intervals = [call.args[0] for call in sleep.call_args_list]
+        self.assertEqual(intervals, [0.1, 0.2, 0.3, 0.3])
+
+    @mock.patch("django_meilisearch.waiter.client")
+    def test_should_raise_after_the_deadline(self, client):
+        """
+        Test the waiter raises when the tasks are not finished in time.
+        """
+        client.get_task.return_value = make_task(1, "processing")
+        waiter = TaskWaiter(initial_interval=0.01, timeout=0.05)
+
+        with self.assertRaises(TaskTimeoutError):
+            waiter.wait(1)
+
+        self.assertGreater(waiter.last_stats.polls, 1)
+
+    @mock.patch("django_meilisearch.waiter.async_client")
+    def test_should_wait_many_without_blocking(self, async_client):
+        """
+        Test the coroutine polls several tasks with the async client.
+        """
+        async_client.get_tasks = mock.AsyncMock(
+            return_value=[make_task(1, "succeeded"), make_task(2, "enqueued")]
+        )
+        async_client.get_task = mock.AsyncMock(
+            return_value=make_task(2, "succeeded")
+        )
+
+        tasks = asyncio.run(self.waiter.wait_many_async([2, 1]))
+
+        self.assertEqual([task.uid for task in tasks], [2, 1])
+        async_client.get_tasks.assert_awaited_once_with([1, 2])
+        async_client.get_task.assert_awaited_once_with(2)
+        self.assertEqual(self.waiter.last_stats.polls, 2)
+
+    @mock.patch("django_meilisearch.waiter.client")
+    def test_should_raise_when_a_task_is_missing(self, client):
+        """
+        Test the waiter raises when a polled task does not exist.
+        """
+        client.get_tasks.return_value = SimpleNamespace(
+            results=[make_task(1, "enqueued")]
+        )
+
+        with self.assertRaises(TaskNotFoundError):
+            self.waiter.wait_many([1, 2])
+
+    def test_should_copy_the_settings_only(self):
+        """
+        Test a copy of a waiter has the same settings and an empty history.
+        """
+        self.waiter.history.append(WaitStats([1], 1, 0.0))
+
+        waiter = self.waiter.copy()
+
+        self.assertEqual(waiter.max_interval, self.waiter.max_interval)
+        self.assertEqual(waiter.history.maxlen, self.waiter.history.maxlen)
+        self.assertIsNone(waiter.last_stats)
+
+    def test_should_give_each_index_its_own_waiter(self):
+        """
+        Test the indexes do not share the waiter of their base class.
+        """
+        self.assertIsNot(PostIndex.task_waiter, CommentIndex.task_waiter)
+        self.assertIsNot(PostIndex.task_waiter, BaseIndex.task_waiter)
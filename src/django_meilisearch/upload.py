@@ -0,0 +1,93 @@
+"""
+This module contains the DocumentStream class, which encodes documents as
+NDJSON and compresses them while they are sent to Meilisearch.
+"""
+
+import json
+import zlib
+from typing import Iterable, Iterator, Optional
+
+# Window bits of zlib for the supported `Content-Encoding` values: gzip
+# wraps the deflate data with a gzip header, deflate with a zlib header.
+COMPRESSIONS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+
+
+class DocumentStream:
+    """NDJSON request body, encoded chunk by chunk while it is sent.
+
+    Only one chunk of documents and its encoded bytes are held in memory at
+    a time. The stream can only be iterated once.
+
+    Args:
+        chunks (Iterable[list[dict]]): Documents, in small chunks.
+        compression (Optional[str]): `gzip`, `deflate` or `None` to send the
+        documents uncompressed.
+        level (int): Compression level, from 1 (fastest) to 9 (smallest).
+
+    Attributes:
+        documents (int): Number of documents encoded so far.
+        payload_bytes (int): Size of the NDJSON encoded so far, before its
+        compression, in bytes.
+        bytes_sent (int): Size of the body produced so far, in bytes.
+
+    Raises:
+        ValueError: If the compression is not supported.
+    """
+
+    CONTENT_TYPE = "application/x-ndjson"
+
+    def __init__(
+        self,
+        chunks: Iterable[list[dict]],
+        compression: Optional[str] = "gzip",
+        level: int = 6,
+    ):
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ValueError(
+                f"Unsupported compression {compression!r}, expected one of"
+                f" {sorted(COMPRESSIONS)} or None"
+            )
+
+        self.chunks = chunks
+        self.compression = compression
+        self.level = level
+        self.documents = 0
+        self.payload_bytes = 0
+        self.bytes_sent = 0
+
+        self._encoder = json.JSONEncoder(
+            ensure_ascii=False, separators=(",", ":")
+        )
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Headers describing the body."""
+        headers = {"Content-Type": self.CONTENT_TYPE}
+        if self.compression is not None:
+            headers["Content-Encoding"] = self.compression
+        return headers
+
+    def __iter__(self) -> Iterator[bytes]:
+        compressor = None
+        if self.compression is not None:
+            compressor = zlib.compressobj(
+                self.level, zlib.DEFLATED, COMPRESSIONS[self.compression]
+            )
+
+        for documents in self.chunks:
+            data = "".join(
+                self._encoder.encode(document) + "\n" for document in documents
+            ).encode()
+            self.documents += len(documents)
+            self.payload_bytes += len(data)
+
+            if compressor is not None:
+                data = compressor.compress(data)
+            if data:
+                self.bytes_sent += len(data)
+                yield data
+
+        if compressor is not None:
+            data = compressor.flush()
+            self.bytes_sent += len(data)
+            yield data
@@ -2,6 +2,12 @@
 This module contains utility functions used in the package.
 """
 
+from itertools import chain, islice
+from operator import attrgetter
+from typing import Any, Callable, Iterator, Optional, Union
+
+from django.db.models import QuerySet
+
 
 def exists_field_in_namespace(field: str, namespace: dict) -> bool:
     """Check if a field exists in a namespace
@@ -23,3 +29,174 @@ def exists_field_in_namespace(field: str, namespace: dict) -> bool:
         )
 
     return True
+
+
+def iterate_in_batches(
+    queryset: QuerySet,
+    key_field: str,
+    batch_size: Union[int, Callable[[], int]],
+    chunk_size: Optional[int] = None,
+    key_getter: Optional[Callable[[Any], Any]] = None,
+) -> Iterator[list[Any]]:
+    """Iterate over a queryset in batches using keyset pagination
+
+    Instead of slicing the queryset with LIMIT/OFFSET, which makes the database
+    scan every skipped row, each batch is fetched with a `key_field > last_key`
+    condition ordered by `key_field`. The cost of a batch query is therefore
+    the same at the start and at the end of the table. Rows are streamed from
+    the database with `QuerySet.iterator` so that backends supporting
+    server-side cursors do not load the whole batch result at once.
+
+    Args:
+        queryset (QuerySet): The queryset to iterate over
+        key_field (str): A unique and ordered field used as pagination key
+        batch_size (Union[int, Callable[[], int]]): The maximum number of rows
+        of each batch, or a function returning it before each batch
+        chunk_size (Optional[int]): The number of rows fetched from the
+        database cursor at a time. Defaults to `min(batch_size, 2000)`
+        key_getter (Optional[Callable]): A function returning the key of a row,
+        needed when the rows are not model instances (e.g. `values_list`).
+        Defaults to reading the `key_field` attribute
+
+    Yields:
+        list: The rows of each batch, ordered by `key_field`
+    """
+    if key_getter is None:
+        key_getter = attrgetter(key_field)
+
+    queryset = queryset.order_by(key_field)
+    last_key = None
+
+    while True:
+        size = batch_size() if callable(batch_size) else batch_size
+        page = queryset
+        if last_key is not None:
+            page = page.filter(**{f"{key_field}__gt": last_key})
+
+        batch = list(
+            page[:size].iterator(chunk_size=chunk_size or min(size, 2000))
+        )
+        if not batch:
+            return
+
+        yield batch
+
+        if len(batch) < size:
+            return
+
+        last_key = key_getter(batch[-1])
+
+
+def _read_chunks(
+    rows: Iterator[Any],
+    first: list[Any],
+    chunk_size: int,
+    read: dict[str, Any],
+) -> Iterator[list[Any]]:
+    """Read the chunks of rows of a batch from the database cursor
+
+    Args:
+        rows (Iterator): The rows of the batch left after the first chunk
+        first (list): The first chunk of rows of the batch
+        chunk_size (int): The maximum number of rows of each chunk
+        read (dict): Updated with the number of `rows` read and the `last`
+        row read
+
+    Yields:
+        list: The chunks of rows
+    """
+    for chunk in chain(
+        [first], iter(lambda: list(islice(rows, chunk_size)), [])
+    ):
+        read["rows"] += len(chunk)
+        read["last"] = chunk[-1]
+        yield chunk
+
+
+def stream_in_batches(
+    queryset: QuerySet,
+    key_field: str,
+    batch_size: Union[int, Callable[[], int]],
+    chunk_size: Optional[int] = None,
+    key_getter: Optional[Callable[[Any], Any]] = None,
+) -> Iterator[Iterator[list[Any]]]:
+    """Iterate over a queryset in batches streamed from the database cursor
+
+    The batches are fetched with keyset pagination, as by
+    `iterate_in_batches`, but each batch is an iterator of chunks of rows read
+    from the database cursor, so a whole batch is never held in memory. Each
+    batch must be consumed before the next one is requested.
+
+    Args:
+        queryset (QuerySet): The queryset to iterate over
+        key_field (str): A unique and ordered field used as pagination key
+        batch_size (Union[int, Callable[[], int]]): The maximum number of rows
+        of each batch, or a function returning it before each batch
+        chunk_size (Optional[int]): The maximum number of rows of each chunk.
+        Defaults to `min(batch_size, 2000)`
+        key_getter (Optional[Callable]): A function returning the key of a row,
+        needed when the rows are not model instances (e.g. `values_list`).
+        Defaults to reading the `key_field` attribute
+
+    Yields:
+        Iterator[list]: The chunks of rows of each batch, ordered by
+        `key_field`
+    """
+    if key_getter is None:
+        key_getter = attrgetter(key_field)
+
+    queryset = queryset.order_by(key_field)
+    last_key = None
+
+    while True:
+        size = batch_size() if callable(batch_size) else batch_size
+        rows_per_chunk = chunk_size or min(size, 2000)
+        page = queryset
+        if last_key is not None:
+            page = page.filter(**{f"{key_field}__gt": last_key})
+
+        rows = page[:size].iterator(chunk_size=rows_per_chunk)
+        first = list(islice(rows, rows_per_chunk))
+        if not first:
+            return
+
+        read: dict[str, Any] = {"rows": 0, "last": None}
+        yield _read_chunks(rows, first, rows_per_chunk, read)
+
+        if read["rows"] < size:
+            return
+
+        last_key = key_getter(read["last"])
+
+
+UNORDERED_SETTINGS = ("filterableAttributes", "sortableAttributes")
+
+
+def diff_settings(
+    current: dict[str, Any], desired: dict[str, Any]
+) -> dict[str, dict[str, Any]]:
+    """Compare index settings
+
+    The order of the attributes is only meaningful for the searchable
+    attributes, which rank the matches, so the other attribute lists are
+    compared as sets.
+
+    Args:
+        current (dict): The current settings of the index
+        desired (dict): The settings to apply, by setting name
+
+    Returns:
+        dict: The settings which differ, with their `old` and `new` values
+    """
+    changes = {}
+    for key, new in desired.items():
+        old = current.get(key)
+        if key in UNORDERED_SETTINGS and old is not None and new is not None:
+            changed = set(old) != set(new)
+        else:
+            changed = old != new
+
+        if changed:
+            changes[key] = {"old": old, "new": new}
+
+    return changes
@@ -2,7 +2,7 @@
 Validators for the MeiliSearch index metaclass.
 """
 
-from typing import Union
+from typing import Optional, Union
 
 from django.db.models import Model
 
@@ -11,6 +11,7 @@ from django_meilisearch.exceptions import (
     InvalidPrimaryKeyError,
     InvalidSearchableFieldError,
     InvalidSortableFieldError,
+    InvalidWatermarkFieldError,
 )
 
 
@@ -119,3 +120,32 @@ def validate_sortable_fields(
             raise InvalidSortableFieldError(
                 f"{model.__name__} does not have a filterable_field named {field}"
             )
+
+
+def validate_watermark_field(
+    model: type[Model],
+    watermark_field: Optional[str],
+) -> None:
+    """
+    Validate the watermark field of an index. The watermark field is optional and,
+    when set, must be a concrete field of the model.
+
+    Args:
+        model (type[Model]): Django model.
+        watermark_field (Optional[str]): Watermark field.
+
+    Raises:
+        InvalidWatermarkFieldError: If the watermark field is not a model field.
+    """
+    if watermark_field is None:
+        return
+
+    if not isinstance(watermark_field, str):
+        raise InvalidWatermarkFieldError(
+            f"{model.__name__}.watermark_field must be a string"
+        )
+
+    if watermark_field not in [field.name for field in model._meta.fields]:
+        raise InvalidWatermarkFieldError(
+            f"{model.__name__} does not have a watermark_field named {watermark_field}"
+        )
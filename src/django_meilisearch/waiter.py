@@ -0,0 +1,299 @@
+"""
+This module contains the TaskWaiter class, which waits for Meilisearch tasks
+to be processed by polling the tasks route with an exponential backoff.
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from meilisearch.models.task import Task
+
+from django_meilisearch import async_client, client
+from django_meilisearch.exceptions import TaskNotFoundError, TaskTimeoutError
+from django_meilisearch.instrumentation import operation
+
+
+@dataclass
+class WaitStats:
+    """Statistics of a single wait.
+
+    Attributes:
+        task_uids (list[int]): UIDs of the awaited tasks.
+        polls (int): Number of HTTP requests sent to the tasks route.
+        elapsed (float): Time spent waiting, in seconds.
+    """
+
+    task_uids: list[int]
+    polls: int
+    elapsed: float
+
+
+class TaskWaiter:
+    """Wait for Meilisearch tasks to finish.
+
+    The tasks are polled with an exponential backoff, starting at
+    `initial_interval` seconds and growing by `backoff_factor` up to
+    `max_interval` seconds between polls. When several tasks are awaited at
+    once, a single `/tasks?uids=...` request covers all of them. The
+    `wait_async` and `wait_many_async` coroutines poll with the async client
+    and sleep without blocking the event loop.
+
+    Args:
+        initial_interval (float): First interval between polls, in seconds.
+        max_interval (float): Maximum interval between polls, in seconds.
+        backoff_factor (float): Factor applied to the interval after each poll.
+        timeout (Optional[float]): Overall deadline of a wait, in seconds.
+        Defaults to no deadline.
+        history_size (int): Number of `WaitStats` kept in `history`.
+    """
+
+    FINISHED_STATUSES = ("succeeded", "failed", "canceled")
+    UNFINISHED_STATUSES = ("enqueued", "processing")
+    MAX_UIDS_PER_POLL = 1000
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        initial_interval: float = 0.01,
+        max_interval: float = 1.0,
+        backoff_factor: float = 2.0,
+        timeout: Optional[float] = None,
+        history_size: int = 100,
+    ):
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self.history: deque[WaitStats] = deque(maxlen=history_size)
+
+    @property
+    def last_stats(self) -> Optional[WaitStats]:
+        """Statistics of the most recent wait, if any."""
+        return self.history[-1] if self.history else None
+
+    def copy(self) -> "TaskWaiter":
+        """Create a waiter with the same settings and an empty history.
+
+        Returns:
+            TaskWaiter: New waiter.
+        """
+        return TaskWaiter(
+            initial_interval=self.initial_interval,
+            max_interval=self.max_interval,
+            backoff_factor=self.backoff_factor,
+            timeout=self.timeout,
+            history_size=self.history.maxlen or 0,
+        )
+
+    def wait(self, task_uid: int) -> Task:
+        """Wait for a task to finish.
+
+        Args:
+            task_uid (int): Task UID.
+
+        Returns:
+            Task: Meilisearch task object.
+
+        Raises:
+            TaskTimeoutError: If the task is not finished before the deadline.
+            MeilisearchApiError: If the task does not exist.
+        """
+        return self.wait_many([task_uid])[0]
+
+    def wait_many(self, task_uids: Iterable[int]) -> list[Task]:
+        """Wait for several tasks to finish.
+
+        Args:
+            task_uids (Iterable[int]): Task UIDs.
+
+        Returns:
+            list[Task]: Meilisearch task objects, in the order of `task_uids`.
+
+        Raises:
+            TaskTimeoutError: If a task is not finished before the deadline.
+            TaskNotFoundError: If one of several tasks does not exist.
+        """
+        task_uids = list(task_uids)
+        with operation("wait_tasks") as event:
+            if event is not None:
+                event.task_uids = task_uids
+            return self._wait_many(task_uids)
+
+    def _wait_many(self, task_uids: list[int]) -> list[Task]:
+        """Poll the tasks until they are finished."""
+        pending = set(task_uids)
+        finished: dict[int, Task] = {}
+
+        start = time.monotonic()
+        deadline = None if self.timeout is None else start + self.timeout
+        interval = self.initial_interval
+        polls = 0
+
+        while pending:
+            for task in self._poll(sorted(pending)):
+                if task.status in self.FINISHED_STATUSES:
+                    finished[task.uid] = task
+                    pending.discard(task.uid)
+            polls += 1
+
+            if not pending:
+                break
+
+            if deadline is not None and time.monotonic() + interval > deadline:
+                self.history.append(
+                    WaitStats(task_uids, polls, time.monotonic() - start)
+                )
+                raise TaskTimeoutError(
+                    f"Tasks {sorted(pending)} did not finish"
+                    f" within {self.timeout} seconds"
+                )
+
+            time.sleep(interval)
+            interval = min(interval * self.backoff_factor, self.max_interval)
+
+        self.history.append(
+            WaitStats(task_uids, polls, time.monotonic() - start)
+        )
+        return [finished[uid] for uid in task_uids]
+
+    async def wait_async(self, task_uid: int) -> Task:
+        """Wait for a task to finish without blocking the event loop.
+
+        Args:
+            task_uid (int): Task UID.
+
+        Returns:
+            Task: Meilisearch task object.
+
+        Raises:
+            TaskTimeoutError: If the task is not finished before the deadline.
+            MeilisearchApiError: If the task does not exist.
+        """
+        tasks = await self.wait_many_async([task_uid])
+        return tasks[0]
+
+    async def wait_many_async(self, task_uids: Iterable[int]) -> list[Task]:
+        """Wait for several tasks to finish without blocking the event loop.
+
+        Args:
+            task_uids (Iterable[int]): Task UIDs.
+
+        Returns:
+            list[Task]: Meilisearch task objects, in the order of `task_uids`.
+
+        Raises:
+            TaskTimeoutError: If a task is not finished before the deadline.
+            TaskNotFoundError: If one of several tasks does not exist.
+        """
+        task_uids = list(task_uids)
+        with operation("wait_tasks") as event:
+            if event is not None:
+                event.task_uids = task_uids
+            return await self._wait_many_async(task_uids)
+
+    async def _wait_many_async(self, task_uids: list[int]) -> list[Task]:
+        """Poll the tasks with the async client until they are finished."""
+        pending = set(task_uids)
+        finished: dict[int, Task] = {}
+
+        start = time.monotonic()
+        deadline = None if self.timeout is None else start + self.timeout
+        interval = self.initial_interval
+        polls = 0
+
+        while pending:
+            for task in await self._apoll(sorted(pending)):
+                if task.status in self.FINISHED_STATUSES:
+                    finished[task.uid] = task
+                    pending.discard(task.uid)
+            polls += 1
+
+            if not pending:
+                break
+
+            if deadline is not None and time.monotonic() + interval > deadline:
+                self.history.append(
+                    WaitStats(task_uids, polls, time.monotonic() - start)
+                )
+                raise TaskTimeoutError(
+                    f"Tasks {sorted(pending)} did not finish"
+                    f" within {self.timeout} seconds"
+                )
+
+            await asyncio.sleep(interval)
+            interval = min(interval * self.backoff_factor, self.max_interval)
+
+        self.history.append(
+            WaitStats(task_uids, polls, time.monotonic() - start)
+        )
+        return [finished[uid] for uid in task_uids]
+
+    def _poll(self, task_uids: list[int]) -> list[Task]:
+        """Fetch the current state of the given tasks.
+
+        Args:
+            task_uids (list[int]): Task UIDs, at most `MAX_UIDS_PER_POLL`
+            of them are fetched.
+
+        Returns:
+            list[Task]: Meilisearch task objects.
+
+        Raises:
+            MeilisearchApiError: If a single task does not exist.
+            TaskNotFoundError: If one of several tasks does not exist.
+        """
+        if len(task_uids) == 1:
+            return [client.get_task(task_uids[0])]
+
+        task_uids = task_uids[: self.MAX_UIDS_PER_POLL]
+        results = client.get_tasks(
+            {
+                "uids": [str(uid) for uid in task_uids],
+                "limit": len(task_uids),
+            }
+        )
+        return self._check_found(task_uids, results.results)
+
+    async def _apoll(self, task_uids: list[int]) -> list[Task]:
+        """Fetch the current state of the given tasks with the async client.
+
+        Args:
+            task_uids (list[int]): Task UIDs, at most `MAX_UIDS_PER_POLL`
+            of them are fetched.
+
+        Returns:
+            list[Task]: Meilisearch task objects.
+
+        Raises:
+            MeilisearchApiError: If a single task does not exist.
+            TaskNotFoundError: If one of several tasks does not exist.
+        """
+        if len(task_uids) == 1:
+            return [await async_client.get_task(task_uids[0])]
+
+        task_uids = task_uids[: self.MAX_UIDS_PER_POLL]
+        tasks = await async_client.get_tasks(task_uids)
+        return self._check_found(task_uids, tasks)
+
+    @staticmethod
+    def _check_found(task_uids: list[int], tasks: list[Task]) -> list[Task]:
+        """Check the polled tasks are all returned, since the tasks route
+        silently leaves out the unknown UIDs.
+
+        Args:
+            task_uids (list[int]): Polled task UIDs.
+            tasks (list[Task]): Meilisearch task objects.
+
+        Returns:
+            list[Task]: Meilisearch task objects.
+
+        Raises:
+            TaskNotFoundError: If a polled task does not exist.
+        """
+        missing = set(task_uids) - {task.uid for task in tasks}
+        if missing:
+            raise TaskNotFoundError(f"Tasks {sorted(missing)} not found")
+        return tasks
@@ -4,7 +4,9 @@ Admin dashboard configuration for the api app.
 
 from django.contrib import admin
 
-from .models import Post
+from .models import Comment, Post, Tag
 
 # Register your models here.
 admin.site.register(Post)
+admin.site.register(Comment)
+admin.site.register(Tag)
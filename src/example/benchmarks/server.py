@@ -0,0 +1,593 @@
+"""
+This module contains an in-process HTTP stand-in of Meilisearch, answering
+the routes used by the indexes, to benchmark the library without a
+Meilisearch binary.
+"""
+
+import json
+import operator
+import re
+import threading
+import zlib
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+class StandInState:
+    """
+    Indexes, documents and tasks of the stand-in server. The tasks are
+    processed as soon as they are enqueued, and the search is a naive scan
+    of the documents, so the benchmarks measure the cost of the library and
+    of the HTTP round-trips rather than the one of the search engine.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.indexes: dict[str, dict[str, Any]] = {}
+        self.tasks: list[dict[str, Any]] = []
+
+    def index(self, uid: str, primary_key: Optional[str] = None) -> dict:
+        """Get an index, creating it as Meilisearch does on writes."""
+        if uid not in self.indexes:
+            now = self.now()
+            self.indexes[uid] = {
+                "uid": uid,
+                "primaryKey": primary_key,
+                "createdAt": now,
+                "updatedAt": now,
+                "documents": {},
+                "settings": {
+                    "searchableAttributes": ["*"],
+                    "filterableAttributes": [],
+                    "sortableAttributes": [],
+                },
+            }
+        index = self.indexes[uid]
+        if index["primaryKey"] is None:
+            index["primaryKey"] = primary_key
+        return index
+
+    def task(
+        self,
+        index_uid: Optional[str],
+        task_type: str,
+        details: Optional[dict] = None,
+    ) -> dict[str, Any]:
+        """Record a succeeded task and return its summary."""
+        now = self.now()
+        task = {
+            "uid": len(self.tasks),
+            "indexUid": index_uid,
+            "status": "succeeded",
+            "type": task_type,
+            "details": details or {},
+            "duration": "PT0S",
+            "enqueuedAt": now,
+            "startedAt": now,
+            "finishedAt": now,
+        }
+        self.tasks.append(task)
+        return {
+            "taskUid": task["uid"],
+            "indexUid": index_uid,
+            "status": "enqueued",
+            "type": task_type,
+            "enqueuedAt": now,
+        }
+
+    @staticmethod
+    def now() -> str:
+        """Current date and time, as formatted by Meilisearch."""
+        return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+class StandInRoutes:
+    """
+    Base class of the routes of the stand-in server. The routes of a request
+    are answered by the methods named in `ROUTES`, which return the status
+    and the body of the response.
+
+    Args:
+        state (StandInState): State of the server.
+        query (dict[str, str]): Query string of the request.
+        body (Any): Decoded body of the request.
+    """
+
+    ROUTES: list[tuple[str, str, str]] = []
+
+    def __init__(self, state: StandInState, query: dict[str, str], body: Any):
+        self.state = state
+        self.query = query
+        self.body = body
+
+    @staticmethod
+    def error(message: str, code: str) -> dict[str, str]:
+        """Body of an error response."""
+        return {
+            "message": message,
+            "code": code,
+            "type": "invalid_request",
+            "link": f"https://docs.meilisearch.com/errors#{code}",
+        }
+
+    def existing_index(self, uid: str) -> Optional[dict]:
+        """Get an existing index."""
+        return self.state.indexes.get(uid)
+
+    def missing_index(self, uid: str) -> tuple[int, dict]:
+        """Response of a request on a missing index."""
+        return 404, self.error(f"Index `{uid}` not found.", "index_not_found")
+
+
+class IndexRoutes(StandInRoutes):
+    """
+    Routes of the indexes and of their settings.
+    """
+
+    ROUTES = [
+        ("GET", r"/health", "health"),
+        ("GET", r"/indexes", "list_indexes"),
+        ("POST", r"/indexes", "create_index"),
+        ("POST", r"/swap-indexes", "swap_indexes"),
+        ("GET", r"/indexes/(?P<uid>[^/]+)", "get_index"),
+        ("DELETE", r"/indexes/(?P<uid>[^/]+)", "delete_index"),
+        ("GET", r"/indexes/(?P<uid>[^/]+)/settings", "get_settings"),
+        ("PATCH", r"/indexes/(?P<uid>[^/]+)/settings", "update_settings"),
+        ("GET", r"/indexes/(?P<uid>[^/]+)/stats", "get_stats"),
+    ]
+
+    @staticmethod
+    def index_info(index: dict) -> dict[str, Any]:
+        """Public description of an index."""
+        return {
+            key: index[key]
+            for key in ("uid", "primaryKey", "createdAt", "updatedAt")
+        }
+
+    def health(self):
+        """GET /health"""
+        return 200, {"status": "available"}
+
+    def list_indexes(self):
+        """GET /indexes"""
+        offset = int(self.query.get("offset", 0))
+        limit = int(self.query.get("limit", 20))
+        indexes = list(self.state.indexes.values())
+        return 200, {
+            "results": [
+                self.index_info(index)
+                for index in indexes[offset : offset + limit]
+            ],
+            "offset": offset,
+            "limit": limit,
+            "total": len(indexes),
+        }
+
+    def create_index(self):
+        """POST /indexes"""
+        uid = self.body["uid"]
+        self.state.index(uid, self.body.get("primaryKey"))
+        return 202, self.state.task(
+            uid, "indexCreation", {"primaryKey": self.body.get("primaryKey")}
+        )
+
+    def get_index(self, uid):
+        """GET /indexes/{uid}"""
+        index = self.existing_index(uid)
+        if index is None:
+            return self.missing_index(uid)
+        return 200, self.index_info(index)
+
+    def delete_index(self, uid):
+        """DELETE /indexes/{uid}"""
+        index = self.state.indexes.pop(uid, None)
+        deleted = len(index["documents"]) if index else 0
+        return 202, self.state.task(
+            uid, "indexDeletion", {"deletedDocuments": deleted}
+        )
+
+    def swap_indexes(self):
+        """POST /swap-indexes"""
+        for swap in self.body:
+            first, second = swap["indexes"]
+            first_index = self.state.index(first)
+            second_index = self.state.index(second)
+            first_index["uid"], second_index["uid"] = second, first
+            self.state.indexes[first] = second_index
+            self.state.indexes[second] = first_index
+        return 202, self.state.task(None, "indexSwap", {"swaps": self.body})
+
+    def get_settings(self, uid):
+        """GET /indexes/{uid}/settings"""
+        index = self.existing_index(uid)
+        if index is None:
+            return self.missing_index(uid)
+        return 200, index["settings"]
+
+    def update_settings(self, uid):
+        """PATCH /indexes/{uid}/settings"""
+        self.state.index(uid)["settings"].update(self.body)
+        return 202, self.state.task(uid, "settingsUpdate", self.body)
+
+    def get_stats(self, uid):
+        """GET /indexes/{uid}/stats"""
+        index = self.existing_index(uid)
+        if index is None:
+            return self.missing_index(uid)
+        return 200, {
+            "numberOfDocuments": len(index["documents"]),
+            "isIndexing": False,
+            "fieldDistribution": {},
+        }
+
+
+class DocumentRoutes(StandInRoutes):
+    """
+    Routes of the documents and of the search.
+    """
+
+    ROUTES = [
+        ("POST", r"/multi-search", "multi_search"),
+        ("POST", r"/indexes/(?P<uid>[^/]+)/search", "search"),
+        ("GET", r"/indexes/(?P<uid>[^/]+)/documents", "get_documents"),
+        (
+            "POST",
+            r"/indexes/(?P<uid>[^/]+)/documents/fetch",
+            "fetch_documents",
+        ),
+        ("POST", r"/indexes/(?P<uid>[^/]+)/documents", "add_documents"),
+        ("PUT", r"/indexes/(?P<uid>[^/]+)/documents", "update_documents"),
+        (
+            "DELETE",
+            r"/indexes/(?P<uid>[^/]+)/documents",
+            "delete_all_documents",
+        ),
+        (
+            "POST",
+            r"/indexes/(?P<uid>[^/]+)/documents/delete-batch",
+            "delete_documents",
+        ),
+        (
+            "DELETE",
+            r"/indexes/(?P<uid>[^/]+)/documents/(?P<document_id>[^/]+)",
+            "delete_document",
+        ),
+    ]
+    FILTER_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+        "=": operator.eq,
+        "!=": operator.ne,
+        ">": operator.gt,
+        ">=": operator.ge,
+        "<": operator.lt,
+        "<=": operator.le,
+    }
+
+    def add_documents(self, uid, partial=False):
+        """POST /indexes/{uid}/documents"""
+        index = self.state.index(uid, self.query.get("primaryKey"))
+        documents = index["documents"]
+        for document in self.body:
+            key = document[index["primaryKey"]]
+            if partial and key in documents:
+                documents[key] = {**documents[key], **document}
+            else:
+                documents[key] = document
+        return 202, self.state.task(
+            uid,
+            "documentAdditionOrUpdate",
+            {
+                "receivedDocuments": len(self.body),
+                "indexedDocuments": len(self.body),
+            },
+        )
+
+    def update_documents(self, uid):
+        """PUT /indexes/{uid}/documents"""
+        return self.add_documents(uid, partial=True)
+
+    def get_documents(self, uid, parameters=None):
+        """GET /indexes/{uid}/documents"""
+        parameters = self.query if parameters is None else parameters
+        index = self.existing_index(uid)
+        if index is None:
+            return self.missing_index(uid)
+
+        offset = int(parameters.get("offset", 0))
+        limit = int(parameters.get("limit", 20))
+        fields = parameters.get("fields")
+        if isinstance(fields, str):
+            fields = fields.split(",")
+        documents = [
+            document
+            for document in index["documents"].values()
+            if self.matches(document, parameters.get("filter"))
+        ]
+        results = documents[offset : offset + limit]
+        if fields:
+            results = [
+                {field: document.get(field) for field in fields}
+                for document in results
+            ]
+        return 200, {
+            "results": results,
+            "offset": offset,
+            "limit": limit,
+            "total": len(documents),
+        }
+
+    def fetch_documents(self, uid):
+        """POST /indexes/{uid}/documents/fetch"""
+        return self.get_documents(uid, self.body)
+
+    @classmethod
+    def matches(cls, document: dict, expression: Optional[str]) -> bool:
+        """Check a document matches a filter made of comparisons joined by
+        `AND`, the only filters sent by the indexes."""
+        if not expression:
+            return True
+
+        for condition in expression.split(" AND "):
+            field, comparison, value = re.split(
+                r"\s*(>=|<=|!=|>|<|=)\s*", condition.strip(), maxsplit=1
+            )
+            if not cls.FILTER_OPERATORS[comparison](
+                document.get(field), json.loads(value)
+            ):
+                return False
+        return True
+
+    def delete_documents(self, uid, document_ids=None):
+        """POST /indexes/{uid}/documents/delete-batch"""
+        if document_ids is None:
+            document_ids = self.body
+
+        documents = self.state.index(uid)["documents"]
+        deleted = 0
+        for document_id in document_ids:
+            # The client sends the ids as strings.
+            keys = [document_id, str(document_id)]
+            if str(document_id).isdigit():
+                keys.append(int(document_id))
+            for key in keys:
+                if documents.pop(key, None) is not None:
+                    deleted += 1
+                    break
+        return 202, self.state.task(
+            uid,
+            "documentDeletion",
+            {"providedIds": len(document_ids), "deletedDocuments": deleted},
+        )
+
+    def delete_document(self, uid, document_id):
+        """DELETE /indexes/{uid}/documents/{id}"""
+        ids = [int(document_id)] if document_id.isdigit() else [document_id]
+        return self.delete_documents(uid, ids)
+
+    def delete_all_documents(self, uid):
+        """DELETE /indexes/{uid}/documents"""
+        documents = self.state.index(uid)["documents"]
+        deleted = len(documents)
+        documents.clear()
+        return 202, self.state.task(
+            uid, "documentDeletion", {"deletedDocuments": deleted}
+        )
+
+    def search(self, uid, query=None):
+        """POST /indexes/{uid}/search"""
+        query = self.body if query is None else query
+        index = self.existing_index(uid)
+        if index is None:
+            return self.missing_index(uid)
+
+        term = (query.get("q") or "").lower()
+        fields = query.get("attributesToSearchOn") or None
+        hits = [
+            document
+            for document in index["documents"].values()
+            if any(
+                term in str(value).lower()
+                for key, value in document.items()
+                if fields is None or key in fields
+            )
+        ]
+
+        offset = query.get("offset") or 0
+        limit = query.get("limit") or 20
+        page = hits[offset : offset + limit]
+        retrieve = query.get("attributesToRetrieve")
+        if retrieve and retrieve != ["*"]:
+            page = [
+                {key: hit[key] for key in retrieve if key in hit}
+                for hit in page
+            ]
+
+        return 200, {
+            "hits": page,
+            "query": query.get("q") or "",
+            "processingTimeMs": 0,
+            "offset": offset,
+            "limit": limit,
+            "estimatedTotalHits": len(hits),
+        }
+
+    def multi_search(self):
+        """POST /multi-search"""
+        results = []
+        for query in self.body["queries"]:
+            status, data = self.search(query["indexUid"], query)
+            if status != 200:
+                return status, data
+            results.append({"indexUid": query["indexUid"], **data})
+        return 200, {"results": results}
+
+
+class TaskRoutes(StandInRoutes):
+    """
+    Routes of the tasks.
+    """
+
+    ROUTES = [
+        ("GET", r"/tasks", "list_tasks"),
+        ("GET", r"/tasks/(?P<task_uid>\d+)", "get_task"),
+    ]
+
+    def list_tasks(self):
+        """GET /tasks"""
+        tasks = self.state.tasks
+        filters = {
+            "uid": "uids",
+            "indexUid": "indexUids",
+            "status": "statuses",
+        }
+        for field, param in filters.items():
+            if param in self.query:
+                values = self.query[param].split(",")
+                tasks = [task for task in tasks if str(task[field]) in values]
+        tasks = tasks[::-1][: int(self.query.get("limit", 20))]
+        return 200, {
+            "results": tasks,
+            "total": len(tasks),
+            "limit": len(tasks),
+            "from": None,
+            "next": None,
+        }
+
+    def get_task(self, task_uid):
+        """GET /tasks/{uid}"""
+        task_uid = int(task_uid)
+        if task_uid >= len(self.state.tasks):
+            return 404, self.error("Task not found.", "task_not_found")
+        return 200, self.state.tasks[task_uid]
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Request handler of the stand-in server.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # The headers and the body are written separately, which Nagle's
+    # algorithm would delay until the client acknowledges the headers.
+    disable_nagle_algorithm = True
+    server: "StandInServer"
+
+    ROUTE_GROUPS = (IndexRoutes, DocumentRoutes, TaskRoutes)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Handle a GET request."""
+        self.dispatch("GET")
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Handle a POST request."""
+        self.dispatch("POST")
+
+    def do_PUT(self):  # pylint: disable=invalid-name
+        """Handle a PUT request."""
+        self.dispatch("PUT")
+
+    def do_PATCH(self):  # pylint: disable=invalid-name
+        """Handle a PATCH request."""
+        self.dispatch("PATCH")
+
+    def do_DELETE(self):  # pylint: disable=invalid-name
+        """Handle a DELETE request."""
+        self.dispatch("DELETE")
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Do not log the requests."""
+
+    def dispatch(self, method: str) -> None:
+        """Call the method of the route of the request."""
+        url = urlparse(self.path)
+        query = {
+            key: values[-1] for key, values in parse_qs(url.query).items()
+        }
+        body = self.read_body()
+
+        for group in self.ROUTE_GROUPS:
+            for route_method, pattern, name in group.ROUTES:
+                match = re.fullmatch(pattern, url.path)
+                if route_method == method and match:
+                    routes = group(self.server.state, query, body)
+                    with self.server.state.lock:
+                        status, data = getattr(routes, name)(
+                            **match.groupdict()
+                        )
+                    self.respond(status, data)
+                    return
+
+        self.respond(404, StandInRoutes.error("Route not found", "not_found"))
+
+    def read_body(self) -> Any:
+        """Read the JSON or NDJSON body of the request, decompressing it
+        and reading its chunks as Meilisearch does."""
+        if self.headers.get("Transfer-Encoding") == "chunked":
+            raw_body = b""
+            while size := int(self.rfile.readline().split(b";")[0], 16):
+                raw_body += self.rfile.read(size)
+                self.rfile.readline()
+            self.rfile.readline()
+        else:
+            length = int(self.headers.get("Content-Length") or 0)
+            raw_body = self.rfile.read(length) if length else b""
+
+        encoding = self.headers.get("Content-Encoding")
+        if encoding == "gzip":
+            raw_body = zlib.decompress(raw_body, 16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            raw_body = zlib.decompress(raw_body)
+
+        if not raw_body.strip():
+            return None
+        if self.headers.get("Content-Type") == "application/x-ndjson":
+            return [json.loads(line) for line in raw_body.splitlines() if line]
+        return json.loads(raw_body)
+
+    def respond(self, status: int, data: Any) -> None:
+        """Send a JSON response."""
+        content = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class StandInServer(ThreadingHTTPServer):
+    """
+    In-process HTTP stand-in of Meilisearch, served by a daemon thread on a
+    free port of the loopback interface. It can be used as a context
+    manager.
+    """
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.state = StandInState()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """URL of the server."""
+        host, port = self.socket.getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        """Serve the requests in a daemon thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving the requests."""
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> "StandInServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,205 @@
+"""
+This module contains the benchmarks of the hot paths of the indexes. Each
+benchmark returns a list of results, made of the benchmark name, its
+parameters and its metrics, which are serialized to JSON by the benchmark
+command.
+"""
+
+import itertools
+import statistics
+import time
+from typing import Any, Callable
+
+from django.db.models import signals
+
+from django_meilisearch.instrumentation import (
+    Instrumentation,
+    MetricsCollector,
+)
+from django_meilisearch.metaclass import BaseIndexMetaclass
+from example.indexes import (
+    PostIndex,
+    PostIndexWithCompiledSerializer,
+    PostIndexWithUseTimestamp,
+)
+from example.models import Post
+
+Result = dict[str, Any]
+
+WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua itaque"
+).split()
+
+
+def result(name: str, params: dict[str, Any], **metrics: Any) -> Result:
+    """Build a benchmark result."""
+    return {"benchmark": name, "params": params, "metrics": metrics}
+
+
+def best_of(repeat: int, function: Callable[[], Any]) -> float:
+    """Run a function several times and return its fastest run, in seconds.
+
+    A first untimed run warms up the caches (e.g. the serializer fields).
+    The fastest run is the least disturbed by the other processes of the
+    machine, so it is the most stable measure between runs.
+    """
+    function()
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def create_posts(count: int) -> list[Post]:
+    """Create posts without sending the signals indexing them."""
+    return Post.objects.bulk_create(
+        Post(
+            title=" ".join(WORDS[(i + j) % len(WORDS)] for j in range(6)),
+            content=" ".join(WORDS[(i * j) % len(WORDS)] for j in range(40)),
+        )
+        for i in range(count)
+    )
+
+
+def bench_populate(batch_sizes: list[int], repeat: int) -> list[Result]:
+    """Measure the documents indexed per second and the bytes sent by
+    `populate`, with the regular and the streamed gzip uploads."""
+    results = []
+    documents = Post.objects.count()
+    metrics = MetricsCollector()
+    defaults = {
+        "indexing_batch_size": PostIndex.indexing_batch_size,
+        "use_streamed_upload": PostIndex.use_streamed_upload,
+        "instrumentation": PostIndex.instrumentation,
+    }
+
+    PostIndex.create()
+    PostIndex.instrumentation = Instrumentation([metrics])
+    try:
+        for batch_size, upload in itertools.product(
+            batch_sizes, ("json", "streamed_gzip")
+        ):
+            PostIndex.indexing_batch_size = batch_size
+            PostIndex.use_streamed_upload = upload == "streamed_gzip"
+            metrics.reset()
+            seconds = best_of(repeat, PostIndex.populate)
+            populate = metrics.get(PostIndex.name, "populate")
+            results.append(
+                result(
+                    "populate",
+                    {"indexing_batch_size": batch_size, "upload": upload},
+                    documents=documents,
+                    seconds=seconds,
+                    documents_per_second=documents / seconds,
+                    bytes_sent=populate["bytes_sent"]
+                    // populate["operations"],
+                )
+            )
+    finally:
+        for name, value in defaults.items():
+            setattr(PostIndex, name, value)
+        PostIndex.destroy()
+
+    return results
+
+
+def bench_serializers(repeat: int) -> list[Result]:
+    """Measure the serialization time per document of the serializers."""
+    compiled_serializer = PostIndexWithCompiledSerializer.compiled_serializer
+    if compiled_serializer is None:
+        raise ValueError(
+            "PostIndexWithCompiledSerializer must use the compiled serializer"
+        )
+
+    instances = list(Post.objects.all())
+    rows = list(compiled_serializer.rows(Post.objects.all()))
+    model_serializer = PostIndex.serializer
+    timestamp_serializer = PostIndexWithUseTimestamp.serializer
+    serializers = {
+        "model_serializer": lambda: model_serializer(
+            instances, many=True
+        ).data,
+        "model_serializer_use_timestamp": lambda: timestamp_serializer(
+            instances, many=True
+        ).data,
+        "compiled_serializer": lambda: compiled_serializer.to_documents(rows),
+    }
+
+    results = []
+    for name, serialize in serializers.items():
+        seconds = best_of(repeat, serialize)
+        results.append(
+            result(
+                "serializer",
+                {"serializer": name},
+                documents=len(instances),
+                seconds=seconds,
+                microseconds_per_document=seconds / len(instances) * 1e6,
+            )
+        )
+    return results
+
+
+def bench_signals(saves: int, repeat: int) -> list[Result]:
+    """Measure the time added to each `save` by the signal handlers."""
+    posts = create_posts(saves)
+
+    def save_all():
+        for post in posts:
+            post.save()
+
+    with_handlers = best_of(repeat, save_all)
+
+    signals.post_save.disconnect(
+        sender=Post, dispatch_uid=BaseIndexMetaclass.DISPATCH_UID
+    )
+    try:
+        without_handlers = best_of(repeat, save_all)
+    finally:
+        BaseIndexMetaclass.connect_model(Post)
+
+    indexes = len(list(BaseIndexMetaclass.model_indexes(Post)))
+    return [
+        result(
+            "signal_handler",
+            {"saves": saves, "indexes": indexes},
+            milliseconds_per_save=with_handlers / saves * 1e3,
+            milliseconds_per_save_without_handler=without_handlers
+            / saves
+            * 1e3,
+            overhead_milliseconds_per_save=(with_handlers - without_handlers)
+            / saves
+            * 1e3,
+        )
+    ]
+
+
+def bench_search(searches: int) -> list[Result]:
+    """Measure the latency percentiles of `search`."""
+    PostIndex.create()
+    try:
+        PostIndex.populate()
+
+        latencies = []
+        for i in range(searches):
+            term = WORDS[i % len(WORDS)]
+            start = time.perf_counter()
+            PostIndex.search(term, limit=20)
+            latencies.append((time.perf_counter() - start) * 1e3)
+    finally:
+        PostIndex.destroy()
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    return [
+        result(
+            "search",
+            {"searches": searches, "limit": 20},
+            p50_milliseconds=percentiles[49],
+            p99_milliseconds=percentiles[98],
+            mean_milliseconds=statistics.fmean(latencies),
+        )
+    ]
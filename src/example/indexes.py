@@ -2,9 +2,20 @@
 This module contains the indexes definition for the api app.
 """
 
+from django.db.models import Count
+
+from django_meilisearch.batching import AdaptiveBatchSize
+from django_meilisearch.cache import LocalSearchCache
+from django_meilisearch.fields import ComputedField
 from django_meilisearch.indexes import BaseIndex
+from django_meilisearch.indexing_queue import IndexingQueue
+from django_meilisearch.instrumentation import (
+    Instrumentation,
+    MetricsCollector,
+)
+from django_meilisearch.pipeline import PopulatePipeline
 
-from example.models import Post
+from example.models import Comment, Post
 
 
 class PostIndex(BaseIndex):
@@ -48,3 +59,133 @@ class PostIndexWith10IndexingBatchSize(BaseIndex):
     name = "posts_without_timestamp"
     model = Post
     indexing_batch_size = 10
+
+
+class PostIndexWithPopulatePipeline(BaseIndex):
+    """
+    Index definition for the Post model.
+    """
+
+    name = "posts_with_populate_pipeline"
+    model = Post
+    indexing_batch_size = 10
+    populate_pipeline = PopulatePipeline(
+        serialize_workers=2,
+        serialize_queue_size=1,
+        upload_queue_size=1,
+    )
+
+
+class PostIndexWithCompiledSerializer(BaseIndex):
+    """
+    Index definition for the Post model.
+    """
+
+    name = "posts_with_compiled_serializer"
+    model = Post
+    use_timestamp = True
+    use_compiled_serializer = True
+    indexing_batch_size = 10
+
+
+class PostIndexWithIndexingQueue(BaseIndex):
+    """
+    Index definition for the Post model.
+    """
+
+    name = "posts_with_indexing_queue"
+    model = Post
+    indexing_queue = IndexingQueue(batch_size=100, flush_interval=None)
+
+
+class PostIndexWithOutbox(BaseIndex):
+    """
+    Index definition for the Post model.
+    """
+
+    name = "posts_with_outbox"
+    model = Post
+    use_outbox = True
+
+
+class PostIndexWithSearchCache(BaseIndex):
+    """
+    Index definition for the Post model.
+    """
+
+    name = "posts_with_search_cache"
+    model = Post
+    search_cache = LocalSearchCache(ttl=60, max_entries=100)
+
+
+class PostIndexWithWatermarkField(BaseIndex):
+    """
+    Index definition for the Post model.
+    """
+
+    name = "posts_with_watermark_field"
+    model = Post
+    watermark_field = "created_at"
+
+
+class PostIndexWithInstrumentation(BaseIndex):
+    """
+    Index definition for the Post model.
+    """
+
+    name = "posts_with_instrumentation"
+    model = Post
+    instrumentation = Instrumentation([MetricsCollector()])
+
+
+class PostIndexWithStreamedUpload(BaseIndex):
+    """
+    Index definition for the Post model.
+    """
+
+    name = "posts_with_streamed_upload"
+    model = Post
+    use_streamed_upload = True
+    indexing_batch_size = 10
+
+
+class PostIndexWithAdaptiveBatchSize(BaseIndex):
+    """
+    Index definition for the Post model.
+    """
+
+    name = "posts_with_adaptive_batch_size"
+    model = Post
+    adaptive_batch_size = AdaptiveBatchSize(
+        initial_size=10, min_size=5, max_size=40, target_task_seconds=None
+    )
+
+
+class PostIndexWithRelatedFields(BaseIndex):
+    """
+    Index definition for the Post model.
+    """
+
+    name = "posts_with_related_fields"
+    model = Post
+    related_fields = ["comments__author", "tags__name"]
+    computed_fields = {
+        "comment_count": Count("comments"),
+        "title_length": lambda post: len(post.title),
+    }
+
+
+class CommentIndex(BaseIndex):
+    """
+    Index definition for the Comment model.
+    """
+
+    name = "comments"
+    model = Comment
+    related_fields = ["post__title"]
+    computed_fields = {
+        "summary": ComputedField(
+            lambda comment: f"{comment.author} on {comment.post.title}",
+            depends_on=["post"],
+        ),
+    }
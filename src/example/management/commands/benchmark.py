@@ -0,0 +1,186 @@
+"""
+Management command benchmarking the indexing and search throughput of the
+indexes.
+"""
+
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from importlib import metadata
+
+from alive_progress import config_handler
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test.utils import override_settings
+
+from django_meilisearch import async_client, client
+from django_meilisearch.metaclass import BaseIndexMetaclass
+from example.benchmarks import suite
+from example.benchmarks.server import StandInServer
+
+
+class Command(BaseCommand):
+    """
+    Management command benchmarking the indexing and search throughput of the
+    indexes.
+    """
+
+    help = (
+        "Benchmark the populate, serializer, signal handler and search hot "
+        "paths against an in-process Meilisearch stand-in or a Meilisearch "
+        "server, and write the results as JSON"
+    )
+
+    def add_arguments(self, parser):
+        """
+        Arguments of the benchmarks.
+        """
+        parser.add_argument(
+            "--documents",
+            type=int,
+            default=10_000,
+            help="Number of posts indexed by the benchmarks",
+        )
+        parser.add_argument(
+            "--batch-sizes",
+            type=int,
+            nargs="+",
+            default=[100, 1_000, 10_000],
+            help="Indexing batch sizes of the populate benchmark",
+        )
+        parser.add_argument(
+            "--saves",
+            type=int,
+            default=200,
+            help="Number of saves of the signal handler benchmark",
+        )
+        parser.add_argument(
+            "--searches",
+            type=int,
+            default=500,
+            help="Number of searches of the search benchmark",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Number of runs of each benchmark, the fastest is kept",
+        )
+        parser.add_argument(
+            "--url",
+            help=(
+                "Meilisearch server to benchmark against, which must be "
+                "disposable. Defaults to an in-process stand-in"
+            ),
+        )
+        parser.add_argument(
+            "--api-key", help="API key of the Meilisearch server"
+        )
+        parser.add_argument(
+            "--output",
+            default="benchmark.json",
+            help='Path of the JSON results, "-" for the standard output',
+        )
+
+    def handle(self, *args, **kwargs):
+        """
+        Run the benchmarks and write their results.
+        """
+        server = None
+        url = kwargs["url"]
+        if url is None:
+            server = StandInServer()
+            server.start()
+            url = server.url
+
+        meilisearch_settings = {
+            **settings.DJANGO_MEILISEARCH,
+            "url": url,
+            "api_key": kwargs["api_key"],
+        }
+
+        # The rows created by the benchmarks are rolled back at the end.
+        config_handler.set_global(disable=True)
+        try:
+            with override_settings(DJANGO_MEILISEARCH=meilisearch_settings):
+                self.reset_clients()
+                with transaction.atomic():
+                    results = self.run_benchmarks(**kwargs)
+                    transaction.set_rollback(True)
+        finally:
+            config_handler.reset()
+            self.reset_clients()
+            if server is not None:
+                server.stop()
+
+        report = {
+            "version": self.version(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "server": "stand-in" if server is not None else "meilisearch",
+            "date": datetime.now(timezone.utc).isoformat(),
+            "results": results,
+        }
+
+        if kwargs["output"] == "-":
+            json.dump(report, sys.stdout, indent=2)
+            return
+
+        with open(kwargs["output"], "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        self.info(f"Results written: {kwargs['output']}")
+
+    def run_benchmarks(self, **kwargs) -> list[dict]:
+        """
+        Run every benchmark.
+        """
+        repeat = kwargs["repeat"]
+
+        self.info(f"Creating {kwargs['documents']} posts")
+        suite.create_posts(kwargs["documents"])
+
+        results = []
+        for name, benchmark in (
+            (
+                "populate",
+                lambda: suite.bench_populate(kwargs["batch_sizes"], repeat),
+            ),
+            ("serializer", lambda: suite.bench_serializers(repeat)),
+            (
+                "signal_handler",
+                lambda: suite.bench_signals(kwargs["saves"], repeat),
+            ),
+            ("search", lambda: suite.bench_search(kwargs["searches"])),
+        ):
+            self.info(f"Running benchmark: {name}")
+            for benchmark_result in benchmark():
+                self.info(f"  {benchmark_result}")
+                results.append(benchmark_result)
+
+        return results
+
+    @staticmethod
+    def reset_clients():
+        """
+        Build the clients again from the current settings.
+        """
+        client.reset()
+        async_client.reset()
+        BaseIndexMetaclass.reset_index_handles()
+
+    @staticmethod
+    def version() -> str:
+        """
+        Version of the library, if it is installed.
+        """
+        try:
+            return metadata.version("django-meilisearch")
+        except metadata.PackageNotFoundError:
+            return "unknown"
+
+    def info(self, message):
+        """Info message styling, on the standard error so the results can be
+        written on the standard output"""
+        self.stderr.write(f"[INFO]:    {message}", style_func=lambda x: x)
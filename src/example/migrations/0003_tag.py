@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-17 18:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("example", "0002_comment"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tag",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=50)),
+                (
+                    "posts",
+                    models.ManyToManyField(
+                        related_name="tags", to="example.post"
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -19,3 +19,33 @@ class Post(models.Model):
     title = models.CharField(max_length=100)
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+
+
+class Comment(models.Model):
+    """
+    A model representing a comment on a blog post.
+
+    Attributes:
+        post (models.ForeignKey): The commented post.
+        author (models.CharField): The comment author name.
+        content (models.TextField): The comment content.
+    """
+
+    post = models.ForeignKey(
+        Post, related_name="comments", on_delete=models.CASCADE
+    )
+    author = models.CharField(max_length=100)
+    content = models.TextField()
+
+
+class Tag(models.Model):
+    """
+    A model representing a tag of blog posts.
+
+    Attributes:
+        name (models.CharField): The tag name.
+        posts (models.ManyToManyField): The tagged posts.
+    """
+
+    name = models.CharField(max_length=50)
+    posts = models.ManyToManyField(Post, related_name="tags")
@@ -0,0 +1,56 @@
+"""
+Test cases for the coroutine methods of the indexes.
+"""
+
+from django.test import TestCase
+
+from example.indexes import PostIndex
+from example.models import Post
+
+
+class TestAsyncMethods(TestCase):
+    """
+    Test cases for the coroutine methods of the indexes.
+    """
+
+    fixtures = ["posts.json"]
+
+    async def test_populate_and_search(self):
+        """
+        Test the index is populated and searched from the event loop.
+        """
+        await PostIndex.acreate_async()
+        tasks = await PostIndex.apopulate_async()
+        count = await PostIndex.acount()
+        results = await PostIndex.asearch("itaque", limit=5)
+        await PostIndex.adestroy_async()
+
+        self.assertTrue(all(task.status == "succeeded" for task in tasks))
+        self.assertEqual(count, await Post.objects.acount())
+        self.assertEqual(len(results["hits"]), 5)
+        self.assertEqual(results["estimatedTotalHits"], 7)
+
+    async def test_add_and_remove_single_document(self):
+        """
+        Test a single document is added and removed from the event loop.
+        """
+        post = await Post.objects.afirst()
+
+        await PostIndex.acreate_async()
+        await PostIndex.aadd_single_document_async(post)
+        count_after_add = await PostIndex.acount()
+        await PostIndex.aremove_single_document_async(post)
+        count_after_remove = await PostIndex.acount()
+        await PostIndex.adestroy_async()
+
+        self.assertEqual(count_after_add, 1)
+        self.assertEqual(count_after_remove, 0)
+
+    async def test_search_on_missing_index(self):
+        """
+        Test the search on a missing index returns no hits.
+        """
+        results = await PostIndex.asearch("itaque")
+
+        self.assertEqual(results["hits"], [])
+        self.assertEqual(results["code"], "index_not_found")
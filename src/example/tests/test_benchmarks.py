@@ -0,0 +1,66 @@
+"""
+Test cases for the benchmark command.
+"""
+
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from example.models import Post
+
+
+class TestBenchmarkCommand(TestCase):
+    """
+    Test cases for the benchmark command.
+    """
+
+    def test_benchmarks_against_the_stand_in(self):
+        """
+        Test every benchmark writes its results and leaves no rows behind.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory) / "benchmark.json"
+            call_command(
+                "benchmark",
+                "--documents=50",
+                "--batch-sizes",
+                "10",
+                "100",
+                "--saves=2",
+                "--searches=5",
+                "--repeat=1",
+                f"--output={output}",
+                stderr=StringIO(),
+            )
+            report = json.loads(output.read_text(encoding="utf-8"))
+
+        self.assertEqual(report["server"], "stand-in")
+        self.assertEqual(
+            [result["benchmark"] for result in report["results"]],
+            [
+                "populate",
+                "populate",
+                "populate",
+                "populate",
+                "serializer",
+                "serializer",
+                "serializer",
+                "signal_handler",
+                "search",
+            ],
+        )
+        self.assertEqual(
+            report["results"][0]["metrics"]["documents"],
+            50,
+        )
+        json_upload, streamed_upload = report["results"][:2]
+        self.assertEqual(streamed_upload["params"]["upload"], "streamed_gzip")
+        self.assertLess(
+            streamed_upload["metrics"]["bytes_sent"],
+            json_upload["metrics"]["bytes_sent"],
+        )
+        self.assertEqual(Post.objects.count(), 0)
@@ -101,3 +101,21 @@ class TestInitialize(TestCase):
 
         with self.assertRaises(MeilisearchApiError):
             client.get_index(PostIndex.name)
+
+    def test_rebuild_index(self):
+        """
+        Test the rebuild of the index through a shadow index.
+        """
+        PostIndex.create()
+        PostIndex.populate()
+        Post.objects.filter(id=1).delete()
+
+        tasks = PostIndex.rebuild()
+        count = PostIndex.count()
+
+        self.assertTrue(all(task.status == "succeeded" for task in tasks))
+        self.assertEqual(count, Post.objects.count())
+        with self.assertRaises(MeilisearchApiError):
+            client.get_index(f"{PostIndex.name}_tmp")
+
+        PostIndex.destroy()
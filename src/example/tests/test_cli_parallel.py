@@ -0,0 +1,109 @@
+"""
+Test cases for the CLI actions performed on several indexes in parallel.
+"""
+
+import threading
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from django_meilisearch import client
+from django_meilisearch.management.commands.meilisearch import Command
+from django_meilisearch.waiter import WaitStats
+
+
+class TestParallelActions(SimpleTestCase):
+    """
+    Test cases for the CLI actions performed on several indexes in parallel.
+    """
+
+    indexes = ["posts", "posts_with_search_cache", "posts_with_indexing_queue"]
+
+    def call_populate(self, populate, *args):
+        """
+        Call the populate action on the indexes with a mocked action method.
+        """
+        out = StringIO()
+        with mock.patch.object(
+            Command, "populate", populate
+        ), mock.patch.object(
+            client, "get_indexes", return_value={"results": []}
+        ):
+            call_command(
+                "meilisearch",
+                "populate",
+                *self.indexes,
+                *args,
+                "--yes",
+                stdout=out,
+            )
+        return out.getvalue()
+
+    def test_actions_run_concurrently(self):
+        """
+        Test every index is processed at the same time.
+        """
+        barrier = threading.Barrier(len(self.indexes), timeout=5)
+
+        def populate(command, index_name, _index_cls):
+            barrier.wait()
+            command.success(f'Index populated successfully: "{index_name}"')
+
+        output = self.call_populate(populate, "--parallel", "3")
+
+        self.assertIn("Action succeeded on 3 indexes", output)
+
+    def test_wait_stats_of_each_index(self):
+        """
+        Test the wait statistics reported for an index are its own, while
+        the other indexes wait at the same time.
+        """
+        barrier = threading.Barrier(len(self.indexes), timeout=5)
+
+        def populate(command, _index_name, index_cls):
+            polls = self.indexes.index(index_cls.name) + 1
+            index_cls.task_waiter.history.append(
+                WaitStats([polls], polls, 0.0)
+            )
+            barrier.wait()
+            command._wait_stats(index_cls)  # pylint: disable=protected-access
+
+        output = self.call_populate(populate, "--parallel", "3")
+
+        for polls in range(1, len(self.indexes) + 1):
+            self.assertIn(f"for 1 task(s) with {polls} poll(s)", output)
+
+    def test_failure_does_not_abort_other_indexes(self):
+        """
+        Test a failing index is reported without stopping the others.
+        """
+        populated = []
+
+        def populate(_command, index_name, index_cls):
+            if index_cls.search_cache is not None:
+                raise RuntimeError("Meilisearch is down")
+            populated.append(index_name)
+
+        output = self.call_populate(populate, "--parallel", "2")
+
+        self.assertEqual(len(populated), 2)
+        self.assertIn("RuntimeError('Meilisearch is down')", output)
+        self.assertIn("Action failed on 1 of 3 indexes", output)
+
+    def test_sequential_failure_does_not_abort_other_indexes(self):
+        """
+        Test a failing index does not stop the sequential actions either.
+        """
+        populated = []
+
+        def populate(_command, index_name, index_cls):
+            if index_cls.search_cache is not None:
+                raise RuntimeError("Meilisearch is down")
+            populated.append(index_name)
+
+        output = self.call_populate(populate)
+
+        self.assertEqual(len(populated), 2)
+        self.assertIn("Action failed on 1 of 3 indexes", output)
@@ -0,0 +1,215 @@
+"""
+Test cases for the reindexing of the documents reading related rows.
+"""
+
+import gc
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import TestCase
+from meilisearch.models.task import Task
+
+from django_meilisearch.indexes import BaseIndex
+from example.indexes import (
+    CommentIndex,
+    PostIndexWithIndexingQueue,
+    PostIndexWithRelatedFields,
+)
+from example.models import Comment, Post, Tag
+
+
+class TestDependencies(TestCase):
+    """
+    Test cases for the reindexing of the documents reading related rows.
+    """
+
+    fixtures = ["posts.json", "comments.json"]
+
+    def setUp(self):
+        for index_cls in (BaseIndex, PostIndexWithIndexingQueue):
+            for name in ("aadd_single_document", "aremove_single_document"):
+                patcher = mock.patch.object(index_cls, name)
+                patcher.start()
+                self.addCleanup(patcher.stop)
+
+        for name in ("add", "remove"):
+            patcher = mock.patch.object(
+                PostIndexWithIndexingQueue.indexing_queue, name
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.reindexed = {}
+        for index_cls in (PostIndexWithRelatedFields, CommentIndex):
+            patcher = mock.patch.object(index_cls, "areindex_documents")
+            self.reindexed[index_cls] = patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def reindexed_keys(self, index_cls):
+        """
+        Get the primary keys of each reindex of an index.
+        """
+        return [
+            sorted(call.args[0])
+            for call in self.reindexed[index_cls].call_args_list
+        ]
+
+    def test_saved_row_reindexes_its_parents(self):
+        """
+        Test saving a comment reindexes its post once committed.
+        """
+        comment = Comment.objects.get(pk=1)
+        comment.author = "Kurtis"
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            comment.save()
+
+        self.assertEqual(self.reindexed_keys(PostIndexWithRelatedFields), [])
+        for callback in callbacks:
+            callback()
+        self.assertEqual(
+            self.reindexed_keys(PostIndexWithRelatedFields), [[1]]
+        )
+
+    def test_saved_parent_reindexes_its_children(self):
+        """
+        Test renaming a post reindexes the comments embedding its title.
+        """
+        post = Post.objects.get(pk=1)
+        post.title = "renamed"
+
+        with self.captureOnCommitCallbacks(execute=True):
+            post.save()
+
+        self.assertEqual(self.reindexed_keys(CommentIndex), [[1, 2]])
+
+    def test_queryset_delete_reindexes_the_parents_once(self):
+        """
+        Test the parents of the rows of a QuerySet are found with a single
+        query and reindexed once.
+        """
+        with mock.patch.object(
+            PostIndexWithRelatedFields,
+            "get_dependent_keys",
+            wraps=PostIndexWithRelatedFields.get_dependent_keys,
+        ) as get_dependent_keys:
+            with self.captureOnCommitCallbacks(execute=True):
+                Comment.objects.filter(post__in=[1, 2]).delete()
+
+        get_dependent_keys.assert_called_once()
+        self.assertEqual(
+            self.reindexed_keys(PostIndexWithRelatedFields), [[1, 2]]
+        )
+
+    def test_deleted_row_reindexes_its_parents(self):
+        """
+        Test deleting a comment reindexes its post.
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            Comment.objects.get(pk=3).delete()
+
+        self.assertEqual(
+            self.reindexed_keys(PostIndexWithRelatedFields), [[2]]
+        )
+
+    def test_deletion_reindexes_are_keyed_by_row(self):
+        """
+        Test the reindexes of a deletion are shared by the instances of the
+        deleted row, and dropped with them.
+        """
+        first = Comment.objects.get(pk=3)
+        second = Comment.objects.get(pk=3)
+
+        reindexes = BaseIndex.deletion_reindexes(first)
+
+        self.assertIs(BaseIndex.deletion_reindexes(second), reindexes)
+        self.assertIn((Comment, 3), BaseIndex.DEPENDENT_REINDEXES)
+
+        del first, second
+        gc.collect()
+
+        self.assertNotIn((Comment, 3), BaseIndex.DEPENDENT_REINDEXES)
+
+    def test_many_to_many_changes_reindex_the_near_side(self):
+        """
+        Test adding, removing and clearing tags reindexes the tagged posts.
+        """
+        tag = Tag.objects.create(name="django")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tag.posts.add(1, 2)
+            Post.objects.get(pk=3).tags.add(tag)
+            tag.posts.remove(1)
+            tag.posts.clear()
+
+        self.assertEqual(
+            self.reindexed_keys(PostIndexWithRelatedFields),
+            [[1, 2], [3], [1], [2, 3]],
+        )
+
+    def test_dependent_keys_single_query(self):
+        """
+        Test the documents reading rows are found with a single query.
+        """
+        with self.assertNumQueries(1):
+            keys = PostIndexWithRelatedFields.get_dependent_keys(
+                Comment, [1, 2, 3]
+            )
+
+        self.assertEqual(sorted(keys), [1, 2])
+        self.assertEqual(
+            PostIndexWithRelatedFields.get_dependent_keys(Post, [4]), [4]
+        )
+        self.assertEqual(CommentIndex.get_dependent_keys(Tag, [1]), [])
+
+    def test_dependent_keys_of_the_index_model(self):
+        """
+        Test the primary keys of the index model rows are mapped to the
+        `primary_key_field` of the index.
+        """
+        with mock.patch.object(
+            PostIndexWithRelatedFields, "primary_key_field", "title"
+        ):
+            keys = PostIndexWithRelatedFields.get_dependent_keys(Post, [1])
+
+            with self.captureOnCommitCallbacks(execute=True):
+                Post.objects.get(pk=1).tags.add(Tag.objects.create(name="a"))
+
+        self.assertEqual(keys, [Post.objects.get(pk=1).title])
+        self.assertEqual(
+            self.reindexed_keys(PostIndexWithRelatedFields), [keys]
+        )
+
+
+class TestReindexDocuments(TestCase):
+    """
+    Test cases for the reindexing of several documents.
+    """
+
+    fixtures = ["posts.json", "comments.json"]
+
+    def test_reindex_documents(self):
+        """
+        Test the rows are serialized and uploaded again with their related
+        fields.
+        """
+        with mock.patch.object(
+            PostIndexWithRelatedFields, "get_index"
+        ) as get_index, mock.patch(
+            "django_meilisearch.indexes.client.get_task"
+        ) as get_task:
+            index = get_index.return_value
+            index.add_documents.return_value = SimpleNamespace(task_uid=7)
+            get_task.side_effect = lambda task_uid: mock.Mock(
+                spec=Task, uid=task_uid
+            )
+
+            tasks = PostIndexWithRelatedFields.areindex_documents([1, 2])
+
+        [documents, primary_key] = index.add_documents.call_args.args
+        self.assertEqual([task.uid for task in tasks], [7])
+        self.assertEqual(primary_key, "id")
+        self.assertEqual(
+            [document["comments__author"] for document in documents],
+            [["Leanne", "Ervin"], ["Clementine"]],
+        )
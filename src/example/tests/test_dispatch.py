@@ -0,0 +1,140 @@
+"""
+Test cases for the dispatch of the signals to the indexes of each model.
+"""
+
+import gc
+from unittest import mock
+
+from django.db.models import signals
+from django.test import TestCase
+
+from django_meilisearch.indexes import BaseIndex
+from django_meilisearch.metaclass import BaseIndexMetaclass
+from example.indexes import CommentIndex, PostIndexWithIndexingQueue
+from example.models import Comment, Post
+
+
+class ProxyPost(Post):
+    """
+    Proxy of the post model, defined after its indexes.
+    """
+
+    class Meta:
+        proxy = True
+        app_label = "example"
+
+
+def receivers(signal, sender):
+    """
+    Count the receivers of a signal connected to a model by the indexes, by
+    disconnecting them, before connecting them again.
+    """
+    count = 0
+    while signal.disconnect(
+        sender=sender, dispatch_uid=BaseIndexMetaclass.DISPATCH_UID
+    ):
+        count += 1
+
+    BaseIndexMetaclass.connect_model(sender)
+    return count
+
+
+class TestDispatch(TestCase):
+    """
+    Test cases for the dispatch of the signals to the indexes of each model.
+    """
+
+    def setUp(self):
+        patcher = mock.patch.object(BaseIndex, "aadd_single_document")
+        self.add = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(
+            PostIndexWithIndexingQueue.indexing_queue, "add"
+        )
+        self.queue_add = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.post_indexes = [
+            index
+            for index in BaseIndex.REGISTERED_INDEXES.values()
+            if index.model is Post
+        ]
+        self.direct_indexes = [
+            index
+            for index in self.post_indexes
+            if index.indexing_queue is None and not index.use_outbox
+        ]
+
+    def test_model_indexes(self):
+        """
+        Test each model is dispatched to its own indexes only.
+        """
+        self.assertCountEqual(BaseIndex.model_indexes(Post), self.post_indexes)
+        self.assertEqual(
+            list(BaseIndex.model_indexes(Comment)), [CommentIndex]
+        )
+
+    def test_single_receiver_per_model(self):
+        """
+        Test one receiver of each signal is connected to an indexed model,
+        whatever its number of indexes.
+        """
+        self.assertGreater(len(self.post_indexes), 1)
+        for signal in (signals.post_save, signals.post_delete):
+            self.assertEqual(receivers(signal, Post), 1)
+            self.assertEqual(receivers(signal, Comment), 1)
+
+    def test_save_dispatches_once_per_index(self):
+        """
+        Test a save is dispatched once to each index of its model.
+        """
+        post = Post.objects.create(title="Dispatch", content="Dispatch")
+
+        self.assertEqual(self.add.call_count, len(self.direct_indexes))
+        self.queue_add.assert_called_once_with(
+            PostIndexWithIndexingQueue, post, "default"
+        )
+
+    def test_proxy_model_is_dispatched_to_the_indexes_of_its_model(self):
+        """
+        Test the saves of a proxy model defined after the indexes of its
+        model are dispatched to them.
+        """
+        self.assertEqual(receivers(signals.post_save, ProxyPost), 1)
+        self.assertCountEqual(
+            BaseIndex.model_indexes(ProxyPost), self.post_indexes
+        )
+
+        post = ProxyPost.objects.create(title="Proxy", content="Proxy")
+
+        self.assertEqual(self.add.call_count, len(self.direct_indexes))
+        self.add.assert_called_with(post)
+
+    def test_deleted_index_leaves_the_other_indexes_of_its_model(self):
+        """
+        Test an index garbage collected is removed from the dispatch table,
+        without disconnecting the other indexes of its model.
+        """
+
+        # pylint: disable=unused-variable
+        class TemporaryCommentIndex(BaseIndex):
+            """
+            Index of the comments, deleted by the test.
+            """
+
+            name = "temporary_comments"
+            model = Comment
+
+        label = BaseIndex.INDEX_NAMES["temporary_comments"]
+        self.assertIn(label, BaseIndex.MODEL_INDEXES[Comment])
+
+        del TemporaryCommentIndex
+        gc.collect()
+
+        self.assertNotIn(label, BaseIndex.MODEL_INDEXES[Comment])
+        self.assertNotIn("temporary_comments", BaseIndex.INDEX_NAMES)
+        self.assertEqual(
+            list(BaseIndex.model_indexes(Comment)), [CommentIndex]
+        )
+        self.assertEqual(receivers(signals.post_save, Comment), 1)
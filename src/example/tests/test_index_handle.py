@@ -0,0 +1,46 @@
+"""
+Test cases for the cached index handle.
+"""
+
+from unittest import mock
+
+from django.test import TestCase
+
+import django_meilisearch
+from example.indexes import PostIndex
+
+
+class TestIndexHandle(TestCase):
+    """
+    Test cases for the cached index handle.
+    """
+
+    def setUp(self):
+        patcher = mock.patch.object(django_meilisearch.client, "get_client")
+        self.client = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.addCleanup(PostIndex.reset_index_handle)
+        PostIndex.reset_index_handle()
+
+    def test_search_does_not_request_the_index(self):
+        """
+        Test the searches only send the search request.
+        """
+        PostIndex.search("itaque")
+        PostIndex.search("itaque")
+
+        self.client.get_index.assert_not_called()
+        self.client.index.assert_called_once_with(PostIndex.name)
+        self.assertEqual(self.client.index.return_value.search.call_count, 2)
+
+    def test_handle_is_invalidated_on_create_and_destroy(self):
+        """
+        Test the handle is created again after a create or a destroy.
+        """
+        PostIndex.get_index()
+        PostIndex.acreate()
+        PostIndex.get_index()
+        PostIndex.adestroy()
+        PostIndex.get_index()
+
+        self.assertEqual(self.client.index.call_count, 3)
@@ -0,0 +1,101 @@
+"""
+Test cases for the searches of several indexes with a single request.
+"""
+
+import asyncio
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from django_meilisearch.multi_search import amulti_search, multi_search
+from example.indexes import PostIndex, PostIndexWithUseTimestamp
+
+
+class TestMultiSearch(SimpleTestCase):
+    """
+    Test cases for the searches of several indexes with a single request.
+    """
+
+    def setUp(self):
+        patcher = mock.patch("django_meilisearch.multi_search.client")
+        self.client = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_results_are_mapped_to_the_index_classes(self):
+        """
+        Test the searches are sent at once and mapped to their index class.
+        """
+        self.client.multi_search.return_value = {
+            "results": [
+                {"indexUid": "posts", "hits": [{"id": 1}]},
+                {"indexUid": "posts_with_timestamp", "hits": []},
+            ]
+        }
+
+        results = multi_search(
+            [
+                (PostIndex, "itaque", {"limit": 5}),
+                (PostIndexWithUseTimestamp, "itaque"),
+            ]
+        )
+
+        self.assertEqual(results[PostIndex]["hits"], [{"id": 1}])
+        self.assertEqual(results[PostIndexWithUseTimestamp]["hits"], [])
+
+        queries = self.client.multi_search.call_args.args[0]
+        self.assertEqual(
+            queries[0],
+            {
+                "indexUid": "posts",
+                "q": "itaque",
+                "limit": 5,
+                "attributesToSearchOn": PostIndex.searchable_fields,
+            },
+        )
+        self.assertEqual(queries[1]["indexUid"], "posts_with_timestamp")
+        self.assertNotIn(
+            "federation", self.client.multi_search.call_args.kwargs
+        )
+
+    def test_federated_results_are_merged(self):
+        """
+        Test the merged results of a federated search are returned.
+        """
+        response = {"hits": [{"id": 1, "_federation": {"indexUid": "posts"}}]}
+        self.client.multi_search.return_value = response
+
+        results = multi_search(
+            [(PostIndex, "itaque"), (PostIndex, "dolor")],
+            federation={"limit": 10},
+        )
+
+        self.assertEqual(results, response)
+        self.assertEqual(
+            self.client.multi_search.call_args.kwargs["federation"],
+            {"limit": 10},
+        )
+
+    def test_same_index_without_federation(self):
+        """
+        Test an index cannot be searched twice without federation.
+        """
+        with self.assertRaises(ValueError):
+            multi_search([(PostIndex, "itaque"), (PostIndex, "dolor")])
+
+        self.client.multi_search.assert_not_called()
+
+    def test_async_multi_search(self):
+        """
+        Test the searches are sent at once by the async client.
+        """
+        with mock.patch(
+            "django_meilisearch.multi_search.async_client"
+        ) as async_client:
+            async_client.multi_search = mock.AsyncMock(
+                return_value={"results": [{"hits": []}]}
+            )
+
+            results = asyncio.run(amulti_search([(PostIndex, "itaque")]))
+
+        self.assertEqual(results, {PostIndex: {"hits": []}})
+        async_client.multi_search.assert_awaited_once()
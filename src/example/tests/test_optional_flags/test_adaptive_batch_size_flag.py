@@ -0,0 +1,42 @@
+"""
+Test cases for the adaptive batch size flag.
+"""
+
+from django.test import TestCase
+
+from example.indexes import PostIndex, PostIndexWithAdaptiveBatchSize
+from example.models import Post
+
+
+class TestAdaptiveBatchSizeFlag(TestCase):
+    """
+    Test cases for the adaptive batch size flag.
+    """
+
+    fixtures = ["posts.json"]
+
+    def test_default_adaptive_batch_size_flag(self):
+        """
+        Test the batches have a fixed size by default.
+        """
+
+        self.assertIsNone(PostIndex.adaptive_batch_size)
+
+    def test_adaptive_batch_size_flag_as_set(self):
+        """
+        Test the populate with batches growing from their initial size.
+        """
+
+        PostIndexWithAdaptiveBatchSize.create()
+        tasks = PostIndexWithAdaptiveBatchSize.populate()
+        count = PostIndexWithAdaptiveBatchSize.count()
+        PostIndexWithAdaptiveBatchSize.destroy()
+
+        stats = tasks.batches
+        self.assertTrue(all(task.status == "succeeded" for task in tasks))
+        self.assertEqual(count, Post.objects.count())
+        self.assertEqual([batch.size for batch in stats], [10, 20, 20])
+        self.assertTrue(all(batch.payload_bytes for batch in stats))
+        self.assertLessEqual(
+            {batch.task_uid for batch in stats}, {task.uid for task in tasks}
+        )
@@ -0,0 +1,44 @@
+"""
+Test cases for the indexing queue flag.
+"""
+
+from django.test import TestCase
+
+from example.indexes import PostIndex, PostIndexWithIndexingQueue
+from example.models import Post
+
+
+class TestIndexingQueueFlag(TestCase):
+    """
+    Test cases for the indexing queue flag.
+    """
+
+    def test_default_indexing_queue_flag(self):
+        """
+        Test the signals send one request per instance by default.
+        """
+
+        self.assertIsNone(PostIndex.indexing_queue)
+
+    def test_signals_with_indexing_queue(self):
+        """
+        Test the signal changes are sent in a single flush.
+        """
+
+        PostIndexWithIndexingQueue.create()
+        with self.captureOnCommitCallbacks(execute=True):
+            posts = [
+                Post.objects.create(title=f"Post {i}", content="Content")
+                for i in range(10)
+            ]
+            posts[0].delete()
+
+        queued = len(PostIndexWithIndexingQueue.indexing_queue)
+        task_uids = PostIndexWithIndexingQueue.indexing_queue.flush()
+        PostIndexWithIndexingQueue.task_waiter.wait_many(task_uids)
+        count = PostIndexWithIndexingQueue.count()
+        PostIndexWithIndexingQueue.destroy()
+
+        self.assertEqual(queued, 10)
+        self.assertEqual(len(task_uids), 2)
+        self.assertEqual(count, 9)
@@ -0,0 +1,65 @@
+"""
+Test cases for the instrumentation flag.
+"""
+
+from django.test import TestCase
+
+from example.indexes import PostIndex, PostIndexWithInstrumentation
+from example.models import Post
+
+
+class TestInstrumentationFlag(TestCase):
+    """
+    Test cases for the instrumentation flag.
+    """
+
+    fixtures = ["posts.json"]
+
+    def setUp(self):
+        self.metrics = PostIndexWithInstrumentation.instrumentation.sinks[0]
+        self.metrics.reset()
+
+    def test_default_instrumentation_flag(self):
+        """
+        Test the indexes are not instrumented by default.
+        """
+
+        self.assertIsNone(PostIndex.instrumentation)
+
+    def test_populate_with_instrumentation(self):
+        """
+        Test the populate, its batches and its wait are measured.
+        """
+
+        PostIndexWithInstrumentation.create()
+        PostIndexWithInstrumentation.populate()
+        PostIndexWithInstrumentation.destroy()
+
+        name = PostIndexWithInstrumentation.name
+        populate = self.metrics.get(name, "populate")
+        batches = self.metrics.get(name, "add_documents")
+
+        self.assertEqual(populate["operations"], 1)
+        self.assertEqual(populate["documents"], Post.objects.count())
+        self.assertEqual(batches["documents"], Post.objects.count())
+        self.assertGreaterEqual(populate["tasks"], batches["tasks"])
+        self.assertGreater(populate["round_trips"], batches["round_trips"])
+        self.assertGreater(batches["bytes_sent"], 0)
+        self.assertEqual(self.metrics.get(name, "wait_tasks")["errors"], 0)
+
+    def test_search_with_instrumentation(self):
+        """
+        Test the searches are measured with the number of hits.
+        """
+
+        PostIndexWithInstrumentation.create()
+        PostIndexWithInstrumentation.populate()
+        results = PostIndexWithInstrumentation.search("")
+        PostIndexWithInstrumentation.destroy()
+
+        search = self.metrics.get(PostIndexWithInstrumentation.name, "search")
+
+        self.assertEqual(search["operations"], 1)
+        self.assertEqual(search["round_trips"], 1)
+        self.assertEqual(search["documents"], len(results["hits"]))
+        self.assertGreater(search["bytes_received"], 0)
@@ -0,0 +1,86 @@
+"""
+Test cases for the outbox flag.
+"""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase
+
+from django_meilisearch.models import OutboxEntry
+from example.indexes import PostIndex, PostIndexWithOutbox
+from example.models import Post
+
+
+class TestOutboxFlag(TestCase):
+    """
+    Test cases for the outbox flag.
+    """
+
+    def test_default_outbox_flag(self):
+        """
+        Test the signals send the changes to Meilisearch by default.
+        """
+
+        self.assertFalse(PostIndex.use_outbox)
+
+    def test_signals_write_to_the_outbox(self):
+        """
+        Test the signal changes are written to the outbox, in the
+        transaction of the changed rows.
+        """
+
+        posts = [
+            Post.objects.create(title=f"Post {i}", content="Content")
+            for i in range(3)
+        ]
+        keys = [post.pk for post in posts]
+        posts[0].delete()
+        try:
+            with transaction.atomic():
+                Post.objects.create(title="Rolled back", content="Content")
+                raise ValueError()
+        except ValueError:
+            pass
+
+        entries = OutboxEntry.objects.filter(
+            index_name=PostIndexWithOutbox.name
+        ).order_by("id")
+        self.assertEqual(
+            [(entry.key, entry.operation) for entry in entries],
+            [(key, "add") for key in keys] + [(keys[0], "remove")],
+        )
+
+    def test_worker_sends_the_outbox(self):
+        """
+        Test the worker action sends the changes of the outbox.
+        """
+
+        PostIndexWithOutbox.create()
+        posts = [
+            Post.objects.create(title=f"Post {i}", content="Content")
+            for i in range(10)
+        ]
+        posts[0].delete()
+        count_before = PostIndexWithOutbox.count()
+
+        out = StringIO()
+        call_command(
+            "meilisearch",
+            "worker",
+            PostIndexWithOutbox.name,
+            "--once",
+            stdout=out,
+        )
+        count = PostIndexWithOutbox.count()
+        PostIndexWithOutbox.destroy()
+
+        self.assertEqual(count_before, 0)
+        self.assertEqual(count, 9)
+        self.assertIn("Changes sent: 11", out.getvalue())
+        self.assertFalse(
+            OutboxEntry.objects.filter(
+                index_name=PostIndexWithOutbox.name
+            ).exists()
+        )
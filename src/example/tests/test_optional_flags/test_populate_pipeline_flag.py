@@ -0,0 +1,37 @@
+"""
+Test cases for the populate pipeline flag.
+"""
+
+from django.test import TestCase
+
+from example.indexes import PostIndex, PostIndexWithPopulatePipeline
+from example.models import Post
+
+
+class TestPopulatePipelineFlag(TestCase):
+    """
+    Test cases for the populate pipeline flag.
+    """
+
+    fixtures = ["posts.json"]
+
+    def test_default_populate_pipeline_flag(self):
+        """
+        Test the populate is sequential by default.
+        """
+
+        self.assertIsNone(PostIndex.populate_pipeline)
+
+    def test_populate_with_pipeline(self):
+        """
+        Test the pipelined populate indexes every document.
+        """
+
+        PostIndexWithPopulatePipeline.create()
+        tasks = PostIndexWithPopulatePipeline.populate()
+        count = PostIndexWithPopulatePipeline.count()
+        PostIndexWithPopulatePipeline.destroy()
+
+        self.assertEqual(len(tasks), 5)
+        self.assertTrue(all(task.status == "succeeded" for task in tasks))
+        self.assertEqual(count, Post.objects.count())
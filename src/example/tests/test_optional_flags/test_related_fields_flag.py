@@ -0,0 +1,90 @@
+"""
+Test cases for the related and computed fields flags.
+"""
+
+from django.test import TestCase
+
+from example.indexes import CommentIndex, PostIndex, PostIndexWithRelatedFields
+from example.models import Comment, Post
+
+
+class TestRelatedFieldsFlag(TestCase):
+    """
+    Test cases for the related and computed fields flags.
+    """
+
+    fixtures = ["posts.json", "comments.json"]
+
+    def documents(self, index_cls):
+        """
+        Serialize every row of an index, by primary key.
+        """
+        batches, serialize = index_cls._document_batches()
+        return {
+            document["id"]: document
+            for batch in batches
+            for document in serialize(batch)
+        }
+
+    def test_default_related_fields_flag(self):
+        """
+        Test the documents only hold the model fields by default.
+        """
+
+        self.assertIsNone(PostIndex.related_fields)
+        self.assertIsNone(PostIndex.computed_fields)
+        self.assertEqual(PostIndex.document_fields.names, [])
+
+    def test_reverse_relation_is_prefetched(self):
+        """
+        Test a multi-valued related field is prefetched with the batch.
+        """
+
+        with self.assertNumQueries(3):
+            documents = self.documents(PostIndexWithRelatedFields)
+
+        post = Post.objects.get(pk=1)
+        self.assertEqual(documents[1]["comments__author"], ["Leanne", "Ervin"])
+        self.assertEqual(documents[1]["comment_count"], 2)
+        self.assertEqual(documents[1]["title_length"], len(post.title))
+        self.assertEqual(documents[4]["comments__author"], [])
+        self.assertEqual(documents[4]["tags__name"], [])
+        self.assertEqual(documents[4]["comment_count"], 0)
+
+    def test_forward_relation_is_selected(self):
+        """
+        Test a single-valued related field is selected with the batch.
+        """
+
+        with self.assertNumQueries(1):
+            documents = self.documents(CommentIndex)
+
+        post = Post.objects.get(pk=1)
+        self.assertEqual(len(documents), Comment.objects.count())
+        self.assertEqual(documents[1]["post__title"], post.title)
+        self.assertEqual(documents[1]["summary"], f"Leanne on {post.title}")
+
+    def test_single_document_reads_the_annotations(self):
+        """
+        Test a saved instance is read again with its annotations.
+        """
+
+        post = Post.objects.get(pk=1)
+
+        with self.assertNumQueries(3):
+            [document] = PostIndexWithRelatedFields.serialize_instances([post])
+
+        self.assertEqual(document["comment_count"], 2)
+
+    def test_related_fields_flag_as_set(self):
+        """
+        Test the populate with related and computed fields.
+        """
+
+        PostIndexWithRelatedFields.create()
+        tasks = PostIndexWithRelatedFields.populate()
+        count = PostIndexWithRelatedFields.count()
+        PostIndexWithRelatedFields.destroy()
+
+        self.assertTrue(all(task.status == "succeeded" for task in tasks))
+        self.assertEqual(count, Post.objects.count())
@@ -0,0 +1,44 @@
+"""
+Test cases for the search cache flag.
+"""
+
+from django.test import TestCase
+
+from example.indexes import PostIndex, PostIndexWithSearchCache
+
+
+class TestSearchCacheFlag(TestCase):
+    """
+    Test cases for the search cache flag.
+    """
+
+    fixtures = ["posts.json"]
+
+    def test_default_search_cache_flag(self):
+        """
+        Test the search results are not cached by default.
+        """
+
+        self.assertIsNone(PostIndex.search_cache)
+
+    def test_search_with_search_cache(self):
+        """
+        Test the results are cached until the index is written.
+        """
+
+        cache = PostIndexWithSearchCache.search_cache
+        PostIndexWithSearchCache.create()
+        PostIndexWithSearchCache.populate()
+
+        first = PostIndexWithSearchCache.search("itaque", limit=5)
+        second = PostIndexWithSearchCache.search("itaque", limit=5)
+        hits = cache.hits
+
+        PostIndexWithSearchCache.clean()
+        third = PostIndexWithSearchCache.search("itaque", limit=5)
+        PostIndexWithSearchCache.destroy()
+
+        self.assertIs(first, second)
+        self.assertEqual(hits, 1)
+        self.assertEqual(len(first["hits"]), 5)
+        self.assertEqual(third["hits"], [])
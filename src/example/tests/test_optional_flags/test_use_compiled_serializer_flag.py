@@ -0,0 +1,43 @@
+"""
+Test cases for the use compiled serializer flag.
+"""
+
+from django.test import TestCase
+
+from example.indexes import PostIndex, PostIndexWithCompiledSerializer
+from example.models import Post
+
+
+class TestUseCompiledSerializerFlag(TestCase):
+    """
+    Test cases for the use compiled serializer flag.
+    """
+
+    fixtures = ["posts.json"]
+
+    def test_default_use_compiled_serializer_flag(self):
+        """
+        Test the compiled serializer is disabled by default.
+        """
+
+        self.assertEqual(PostIndex.use_compiled_serializer, False)
+        self.assertIsNone(PostIndex.compiled_serializer)
+
+    def test_use_compiled_serializer_flag_as_true(self):
+        """
+        Test the populate with the compiled serializer.
+        """
+
+        PostIndexWithCompiledSerializer.create()
+        tasks = PostIndexWithCompiledSerializer.populate()
+        count = PostIndexWithCompiledSerializer.count()
+        result = PostIndexWithCompiledSerializer.search(
+            "sunt aut facere repellat provident occaecati excepturi optio reprehenderit",
+            filter="id=1",
+            limit=1,
+        )
+        PostIndexWithCompiledSerializer.destroy()
+
+        self.assertEqual(len(tasks), 5)
+        self.assertEqual(count, Post.objects.count())
+        self.assertEqual(result["hits"][0]["created_at"], 1727550139.537)
@@ -0,0 +1,38 @@
+"""
+Test cases for the use streamed upload flag.
+"""
+
+from django.test import TestCase
+
+from example.indexes import PostIndex, PostIndexWithStreamedUpload
+from example.models import Post
+
+
+class TestUseStreamedUploadFlag(TestCase):
+    """
+    Test cases for the use streamed upload flag.
+    """
+
+    fixtures = ["posts.json"]
+
+    def test_default_use_streamed_upload_flag(self):
+        """
+        Test the streamed upload is disabled by default.
+        """
+
+        self.assertEqual(PostIndex.use_streamed_upload, False)
+        self.assertEqual(PostIndex.upload_compression, "gzip")
+
+    def test_use_streamed_upload_flag_as_true(self):
+        """
+        Test the populate with the streamed upload.
+        """
+
+        PostIndexWithStreamedUpload.create()
+        tasks = PostIndexWithStreamedUpload.populate()
+        count = PostIndexWithStreamedUpload.count()
+        PostIndexWithStreamedUpload.destroy()
+
+        self.assertEqual(len(tasks), 5)
+        self.assertTrue(all(task.status == "succeeded" for task in tasks))
+        self.assertEqual(count, Post.objects.count())
@@ -0,0 +1,70 @@
+"""
+Test cases for the watermark field flag.
+"""
+
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+
+from django_meilisearch.exceptions import InvalidWatermarkFieldError
+from example.indexes import PostIndex, PostIndexWithWatermarkField
+from example.models import Post
+
+
+class TestWatermarkFieldFlag(TestCase):
+    """
+    Test cases for the watermark field flag.
+    """
+
+    fixtures = ["posts.json"]
+
+    def test_default_watermark_field_flag(self):
+        """
+        Test the indexes cannot be synced by default.
+        """
+
+        self.assertIsNone(PostIndex.watermark_field)
+        with self.assertRaises(InvalidWatermarkFieldError):
+            PostIndex.sync()
+
+    def test_sync_with_watermark_field(self):
+        """
+        Test the first sync uploads every row and stores the watermark.
+        """
+
+        PostIndexWithWatermarkField.create()
+        tasks = PostIndexWithWatermarkField.sync()
+        count = PostIndexWithWatermarkField.count()
+        watermark = PostIndexWithWatermarkField.get_watermark()
+        PostIndexWithWatermarkField.destroy()
+
+        self.assertTrue(all(task.status == "succeeded" for task in tasks))
+        self.assertEqual(count, Post.objects.count())
+        self.assertEqual(
+            watermark, Post.objects.latest("created_at").created_at
+        )
+
+    def test_sync_deletes_the_deleted_rows(self):
+        """
+        Test the documents of the rows deleted without signal are deleted,
+        one range of primary keys at a time.
+        """
+
+        PostIndexWithWatermarkField.create()
+        PostIndexWithWatermarkField.sync()
+        keys = list(Post.objects.order_by("id").values_list("id", flat=True))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {Post._meta.db_table} WHERE id IN (%s, %s, %s)",
+                [keys[0], keys[3], keys[-1]],
+            )
+
+        with mock.patch.object(
+            PostIndexWithWatermarkField, "sync_deletion_batch_size", 2
+        ):
+            PostIndexWithWatermarkField.sync()
+        count = PostIndexWithWatermarkField.count()
+        PostIndexWithWatermarkField.destroy()
+
+        self.assertEqual(count, len(keys) - 3)
@@ -0,0 +1,142 @@
+"""
+Test cases for the removal of several documents at once.
+"""
+
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import TestCase
+from meilisearch.models.task import Task
+
+from django_meilisearch.indexes import BaseIndex
+from example.indexes import PostIndex, PostIndexWithIndexingQueue
+from example.models import Post
+
+
+class TestRemoveDocuments(TestCase):
+    """
+    Test cases for the removal of several documents at once.
+    """
+
+    def setUp(self):
+        patcher = mock.patch.object(PostIndex, "get_index")
+        self.index = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch("django_meilisearch.indexes.client.get_task")
+        patcher.start().side_effect = lambda task_uid: mock.Mock(
+            spec=Task, uid=task_uid
+        )
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(PostIndex, "indexing_batch_size", 2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.index.delete_documents.side_effect = [
+            SimpleNamespace(task_uid=task_uid) for task_uid in range(1, 10)
+        ]
+
+        # bulk_create does not send the signals indexing the posts
+        self.posts = Post.objects.bulk_create(
+            Post(title=f"Post {i}", content="itaque") for i in range(5)
+        )
+
+    def deleted_keys(self):
+        """
+        Get the primary keys sent in each delete request.
+        """
+        return [
+            call.args[0] for call in self.index.delete_documents.call_args_list
+        ]
+
+    def test_remove_documents_by_queryset(self):
+        """
+        Test the rows of a QuerySet are removed in batches.
+        """
+        keys = [post.id for post in self.posts]
+
+        tasks = PostIndex.aremove_documents(Post.objects.all())
+
+        self.assertEqual([task.uid for task in tasks], [1, 2, 3])
+        self.assertEqual(
+            self.deleted_keys(), [keys[0:2], keys[2:4], keys[4:5]]
+        )
+
+    def test_remove_documents_by_ids(self):
+        """
+        Test a list of primary keys is removed in batches.
+        """
+        tasks = PostIndex.aremove_documents([10, 11, 12])
+
+        self.assertEqual(len(tasks), 2)
+        self.assertEqual(self.deleted_keys(), [[10, 11], [12]])
+
+    def test_remove_no_documents(self):
+        """
+        Test no request is sent without primary keys.
+        """
+        self.assertEqual(PostIndex.aremove_documents([]), [])
+        self.index.delete_documents.assert_not_called()
+
+    def test_remove_by_filter(self):
+        """
+        Test the documents matching a filter are removed with one request.
+        """
+        task = PostIndex.aremove_by_filter("id < 3")
+
+        self.assertEqual(task.uid, 1)
+        self.index.delete_documents.assert_called_once_with(filter="id < 3")
+
+
+class TestBulkRemovalSignal(TestCase):
+    """
+    Test cases for the removal of the rows deleted by a QuerySet.
+    """
+
+    def setUp(self):
+        self.posts = Post.objects.bulk_create(
+            Post(title=f"Post {i}", content="itaque") for i in range(5)
+        )
+
+        patcher = mock.patch.object(BaseIndex, "aremove_documents")
+        self.aremove_documents = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(BaseIndex, "aremove_single_document")
+        self.aremove_single_document = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(
+            PostIndexWithIndexingQueue.indexing_queue, "remove"
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_queryset_delete_collapses_the_removals(self):
+        """
+        Test the rows deleted by a QuerySet are removed with one call per
+        index once the deletion is committed.
+        """
+        keys = [post.id for post in self.posts]
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            Post.objects.all().delete()
+
+        self.aremove_documents.assert_not_called()
+        for callback in callbacks:
+            callback()
+
+        self.aremove_single_document.assert_not_called()
+        self.assertEqual(len(callbacks), self.aremove_documents.call_count)
+        for call in self.aremove_documents.call_args_list:
+            self.assertEqual(sorted(call.args[0]), keys)
+
+    def test_instance_delete_removes_a_single_document(self):
+        """
+        Test the deletion of an instance still removes its document at once.
+        """
+        self.posts[0].delete()
+
+        self.aremove_single_document.assert_called()
+        self.aremove_documents.assert_not_called()
@@ -0,0 +1,64 @@
+"""
+Test cases for the search results hydrated into QuerySets.
+"""
+
+from unittest import mock
+
+from django.test import TestCase
+
+from example.indexes import PostIndex
+from example.models import Post
+
+
+class TestSearchToQueryset(TestCase):
+    """
+    Test cases for the search results hydrated into QuerySets.
+    """
+
+    def setUp(self):
+        patcher = mock.patch.object(PostIndex, "get_index")
+        self.index = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+        # bulk_create does not send the signals indexing the posts
+        self.posts = Post.objects.bulk_create(
+            Post(title=f"Post {i}", content="itaque") for i in range(5)
+        )
+
+    def test_instances_are_in_ranking_order(self):
+        """
+        Test the instances are returned in the order of the hits.
+        """
+        ranked = [self.posts[3], self.posts[0], self.posts[4]]
+        self.index.search.return_value = {
+            "hits": [{"id": post.id} for post in ranked]
+        }
+
+        with self.assertNumQueries(1):
+            posts = list(PostIndex.search("itaque", to_queryset=True))
+
+        self.assertEqual(posts, ranked)
+
+    def test_only_primary_key_is_retrieved(self):
+        """
+        Test only the primary key of the hits is requested to Meilisearch.
+        """
+        self.index.search.return_value = {"hits": []}
+
+        PostIndex.search(
+            "itaque", to_queryset=True, attributes_to_retrieve=["title"]
+        )
+
+        opt_params = self.index.search.call_args.kwargs["opt_params"]
+        self.assertEqual(opt_params["attributesToRetrieve"], ["id"])
+
+    def test_no_hits(self):
+        """
+        Test an empty QuerySet is returned without querying the database.
+        """
+        self.index.search.return_value = {"hits": []}
+
+        with self.assertNumQueries(0):
+            posts = list(PostIndex.search("itaque", to_queryset=True))
+
+        self.assertEqual(posts, [])
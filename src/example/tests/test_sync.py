@@ -0,0 +1,171 @@
+"""
+Test cases for the incremental sync of the indexes.
+"""
+
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+from meilisearch.models.document import DocumentsResults
+from meilisearch.models.task import Task
+
+from example.indexes import PostIndexWithWatermarkField
+from example.models import Post
+
+
+class TestSync(TestCase):
+    """
+    Test cases for the incremental sync of the indexes.
+    """
+
+    def setUp(self):
+        patcher = mock.patch.object(PostIndexWithWatermarkField, "get_index")
+        self.index = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(PostIndexWithWatermarkField, "task_waiter")
+        self.task_waiter = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.task_waiter.wait_many.side_effect = lambda task_uids: [
+            mock.Mock(spec=Task, status="succeeded") for _ in task_uids
+        ]
+
+        self.index.get_settings.return_value = (
+            PostIndexWithWatermarkField.get_index_settings()
+        )
+        self.index.get_documents.return_value = DocumentsResults(
+            {"results": [], "offset": 0, "limit": 1000, "total": 0}
+        )
+
+        # bulk_create does not send the signals indexing the posts
+        now = timezone.now()
+        self.posts = Post.objects.bulk_create(
+            Post(title=f"Post {i}", content="itaque") for i in range(3)
+        )
+        for days, post in enumerate(reversed(self.posts)):
+            post.created_at = now - timedelta(days=days)
+        Post.objects.bulk_update(self.posts, ["created_at"])
+
+    def uploaded_ids(self):
+        """
+        Get the ids of the uploaded documents.
+        """
+        return [
+            document["id"]
+            for call in self.index.add_documents.call_args_list
+            for document in call.args[0]
+        ]
+
+    def test_first_sync_uploads_every_row(self):
+        """
+        Test every row is uploaded and the watermark is stored.
+        """
+        PostIndexWithWatermarkField.sync()
+
+        self.assertEqual(
+            sorted(self.uploaded_ids()), [post.id for post in self.posts]
+        )
+        self.assertEqual(
+            PostIndexWithWatermarkField.get_watermark(),
+            self.posts[-1].created_at,
+        )
+
+    def test_sync_uploads_the_changed_rows(self):
+        """
+        Test only the rows changed since the watermark are uploaded.
+        """
+        PostIndexWithWatermarkField.set_watermark(self.posts[1].created_at)
+
+        PostIndexWithWatermarkField.sync()
+
+        self.assertEqual(
+            self.uploaded_ids(), [self.posts[1].id, self.posts[2].id]
+        )
+
+    def test_sync_deletes_the_deleted_rows(self):
+        """
+        Test the documents without row are deleted.
+        """
+        PostIndexWithWatermarkField.set_watermark(self.posts[-1].created_at)
+        self.index.get_documents.side_effect = [
+            DocumentsResults(
+                {
+                    "results": [{"id": self.posts[0].id}, {"id": 404}],
+                    "offset": 0,
+                    "limit": 1000,
+                    "total": 2,
+                }
+            ),
+            DocumentsResults(
+                {"results": [], "offset": 2, "limit": 1000, "total": 2}
+            ),
+        ]
+
+        PostIndexWithWatermarkField.sync()
+
+        self.index.delete_documents.assert_called_once_with([404])
+
+    def test_sync_reads_the_documents_by_range_of_primary_keys(self):
+        """
+        Test the documents are read and deleted one range of primary keys at
+        a time.
+        """
+        PostIndexWithWatermarkField.set_watermark(self.posts[-1].created_at)
+        first, second, _ = (post.id for post in self.posts)
+        self.index.get_documents.side_effect = [
+            DocumentsResults(
+                {
+                    "results": [{"id": first}, {"id": 0}],
+                    "offset": 0,
+                    "limit": 2,
+                    "total": 2,
+                }
+            ),
+            DocumentsResults(
+                {"results": [], "offset": 2, "limit": 2, "total": 2}
+            ),
+            DocumentsResults(
+                {"results": [{"id": 404}], "offset": 0, "limit": 2, "total": 1}
+            ),
+        ]
+
+        with mock.patch.object(
+            PostIndexWithWatermarkField, "sync_deletion_batch_size", 2
+        ):
+            PostIndexWithWatermarkField.sync()
+
+        self.assertEqual(
+            [
+                call.args[0].get("filter")
+                for call in self.index.get_documents.call_args_list
+            ],
+            [f"id <= {second}", f"id <= {second}", f"id > {second}"],
+        )
+        self.assertEqual(
+            self.index.delete_documents.call_args_list,
+            [mock.call([0]), mock.call([404])],
+        )
+
+    def test_sync_filters_on_the_primary_key(self):
+        """
+        Test the primary key is filterable, to read the ranges of keys.
+        """
+        with mock.patch.object(
+            PostIndexWithWatermarkField, "filterable_fields", ["title"]
+        ):
+            settings = PostIndexWithWatermarkField.get_index_settings()
+
+        self.assertEqual(settings["filterableAttributes"], ["title", "id"])
+
+    def test_failed_sync_keeps_the_watermark(self):
+        """
+        Test the watermark is not moved when a task fails.
+        """
+        self.task_waiter.wait_many.side_effect = lambda task_uids: [
+            mock.Mock(spec=Task, status="failed") for _ in task_uids
+        ]
+
+        PostIndexWithWatermarkField.sync()
+
+        self.assertIsNone(PostIndexWithWatermarkField.get_watermark())
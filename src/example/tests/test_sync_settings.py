@@ -0,0 +1,82 @@
+"""
+Test cases for the settings synchronization of the indexes.
+"""
+
+from unittest import mock
+
+from django.test import TestCase
+
+from django_meilisearch.batching import BatchStats
+from example.indexes import PostIndex
+
+
+class TestSyncSettings(TestCase):
+    """
+    Test cases for the settings synchronization of the indexes.
+    """
+
+    def setUp(self):
+        patcher = mock.patch.object(PostIndex, "get_index")
+        self.index = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+    def test_unchanged_settings_are_not_sent(self):
+        """
+        Test no update is sent when the settings are up to date.
+        """
+        self.index.get_settings.return_value = {
+            **PostIndex.get_index_settings(),
+            "sortableAttributes": list(reversed(PostIndex.sortable_fields)),
+        }
+
+        changes = PostIndex.sync_settings()
+
+        self.assertEqual(changes, {})
+        self.index.update_settings.assert_not_called()
+
+    def test_changed_settings_are_sent_at_once(self):
+        """
+        Test the changed settings are sent in a single request.
+        """
+        self.index.get_settings.return_value = {
+            **PostIndex.get_index_settings(),
+            "searchableAttributes": ["*"],
+            "filterableAttributes": [],
+        }
+
+        changes = PostIndex.sync_settings()
+
+        self.assertEqual(
+            set(changes), {"searchableAttributes", "filterableAttributes"}
+        )
+        self.index.update_settings.assert_called_once_with(
+            {
+                "searchableAttributes": list(PostIndex.searchable_fields),
+                "filterableAttributes": list(PostIndex.filterable_fields),
+            }
+        )
+
+    def test_populate_returns_the_changed_settings_and_batches(self):
+        """
+        Test the settings updated and the batches uploaded by a populate are
+        returned with its tasks.
+        """
+        self.index.get_settings.return_value = {
+            **PostIndex.get_index_settings(),
+            "searchableAttributes": ["*"],
+        }
+        batches = [BatchStats(10, 1), BatchStats(5, 2)]
+
+        with mock.patch.object(
+            PostIndex, "_add_batches_with_progress", return_value=batches
+        ), mock.patch.object(
+            PostIndex.task_waiter, "wait_many", return_value=[]
+        ) as wait_many:
+            result = PostIndex.populate()
+
+        self.assertEqual(list(result), [])
+        self.assertEqual(result.batches, batches)
+        self.assertEqual(
+            set(result.settings_changes), {"searchableAttributes"}
+        )
+        self.assertEqual(list(wait_many.call_args.args[0]), [1, 2])
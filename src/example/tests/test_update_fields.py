@@ -0,0 +1,168 @@
+"""
+Test cases for the partial updates of the documents.
+"""
+
+from types import SimpleNamespace
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from meilisearch.models.task import Task
+
+from django_meilisearch.exceptions import InvalidUpdateFieldError
+from django_meilisearch.indexes import BaseIndex
+from example.indexes import (
+    PostIndex,
+    PostIndexWithIndexingQueue,
+    PostIndexWithRelatedFields,
+)
+from example.models import Post
+
+
+class TestUpdateFields(TestCase):
+    """
+    Test cases for the partial updates of several documents.
+    """
+
+    fixtures = ["posts.json"]
+
+    def setUp(self):
+        patcher = mock.patch.object(PostIndex, "get_index")
+        self.index = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch("django_meilisearch.indexes.client.get_task")
+        patcher.start().side_effect = lambda task_uid: mock.Mock(
+            spec=Task, uid=task_uid
+        )
+        self.addCleanup(patcher.stop)
+
+        self.index.update_documents.side_effect = [
+            SimpleNamespace(task_uid=task_uid) for task_uid in range(1, 10)
+        ]
+
+    def test_update_fields_sends_partial_documents(self):
+        """
+        Test only the primary key and the given fields are read and sent.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            tasks = PostIndex.aupdate_fields(
+                Post.objects.filter(pk__in=[1, 2]), ["title"]
+            )
+
+        self.assertEqual([task.uid for task in tasks], [1])
+        documents, primary_key = self.index.update_documents.call_args.args
+        self.assertEqual(primary_key, "id")
+        self.assertEqual(
+            documents,
+            [
+                {"id": post.id, "title": post.title}
+                for post in Post.objects.filter(pk__in=[1, 2]).order_by("id")
+            ],
+        )
+        self.assertNotIn('"content"', queries.captured_queries[-1]["sql"])
+
+    def test_update_fields_in_batches(self):
+        """
+        Test a list of primary keys is updated in batches.
+        """
+        with mock.patch.object(PostIndex, "indexing_batch_size", 2):
+            tasks = PostIndex.aupdate_fields([1, 2, 3], ["title"])
+
+        self.assertEqual(len(tasks), 2)
+        self.assertEqual(
+            [
+                [document["id"] for document in call.args[0]]
+                for call in self.index.update_documents.call_args_list
+            ],
+            [[1, 2], [3]],
+        )
+
+    def test_update_unknown_field(self):
+        """
+        Test the fields must be document fields.
+        """
+        with self.assertRaises(InvalidUpdateFieldError):
+            PostIndex.aupdate_fields([1], ["unknown"])
+        self.index.update_documents.assert_not_called()
+
+    def test_partial_related_and_computed_fields(self):
+        """
+        Test the related and computed fields are read again for a partial
+        document.
+        """
+        post = Post.objects.get(pk=1)
+
+        [document] = PostIndexWithRelatedFields.serialize_instances(
+            [post], ["title", "comment_count"]
+        )
+
+        self.assertEqual(
+            document, {"id": 1, "title": post.title, "comment_count": 0}
+        )
+
+
+class TestUpdateFieldsSignal(TestCase):
+    """
+    Test cases for the saves with `update_fields`.
+    """
+
+    fixtures = ["posts.json"]
+
+    def setUp(self):
+        self.patched = {}
+        for name in ("aadd_single_document", "aupdate_single_document"):
+            patcher = mock.patch.object(BaseIndex, name)
+            self.patched[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(
+            PostIndexWithIndexingQueue.indexing_queue, "add"
+        )
+        self.queue_add = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_save_with_update_fields_updates_the_fields(self):
+        """
+        Test a save with `update_fields` only updates the saved fields.
+        """
+        post = Post.objects.get(pk=1)
+        post.title = "renamed"
+
+        post.save(update_fields=["title"])
+
+        self.patched["aadd_single_document"].assert_not_called()
+        self.patched["aupdate_single_document"].assert_any_call(
+            post, ["title"]
+        )
+        self.queue_add.assert_called_once()
+
+    def test_changed_fields_include_the_document_fields(self):
+        """
+        Test the related and computed fields are updated with the saved
+        fields.
+        """
+        self.assertEqual(PostIndex.get_changed_fields({"title"}), ["title"])
+        self.assertEqual(PostIndex.get_changed_fields({"id"}), [])
+        self.assertEqual(
+            PostIndexWithRelatedFields.get_changed_fields({"title"}),
+            [
+                "title",
+                "comments__author",
+                "tags__name",
+                "comment_count",
+                "title_length",
+            ],
+        )
+
+    def test_save_without_update_fields_adds_the_document(self):
+        """
+        Test a full save still replaces the whole document.
+        """
+        post = Post.objects.get(pk=1)
+
+        post.save()
+
+        self.patched["aadd_single_document"].assert_called()
+        self.patched["aupdate_single_document"].assert_not_called()
@@ -19,7 +19,6 @@ def test_search(request: HttpRequest) -> JsonResponse:
     """
     response = PostIndex.search(
         request.GET.get("q"),
-        # to_queryset=True,
         # attributes_to_retrieve=["title", "content"],
         # attributes_to_highlight=["content"],
         sort=["created_at:desc"],